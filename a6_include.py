@@ -103,11 +103,13 @@ class SLNode:
     Singly Linked List node for use in a hash map
     """
 
-    def __init__(self, key: str, value: object, next: "SLNode" = None) -> None:
-        """Initialize node given a key and value."""
+    def __init__(self, key: str, value: object, next: "SLNode" = None,
+                 hash_value: int = None) -> None:
+        """Initialize node given a key, value and optionally the key's hash."""
         self.key = key
         self.value = value
         self.next = next
+        self.hash_value = hash_value
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
@@ -168,20 +170,22 @@ class LinkedList:
         """Return an iterator for the list, starting at the head."""
         return LinkedListIterator(self._head)
 
-    def insert(self, key: str, value: object) -> None:
+    def insert(self, key: str, value: object, hash_value: int = None) -> None:
         """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+        self._head = SLNode(key, value, self._head, hash_value)
         self._size += 1
 
-    def remove(self, key: str) -> bool:
+    def remove(self, key: str, hash_value: int = None) -> bool:
         """
         Remove first node with matching key.
+        When the key's hash is given, nodes with another hash are skipped
+        without comparing keys.
         Return True if removal was successful, False otherwise.
         """
         previous, node = None, self._head
         while node:
 
-            if node.key == key:
+            if (hash_value is None or node.hash_value == hash_value) and node.key == key:
                 if previous:
                     previous.next = node.next
                 else:
@@ -192,11 +196,15 @@ class LinkedList:
             previous, node = node, node.next
         return False
 
-    def contains(self, key: str) -> SLNode:
-        """Return node with matching key, or None if no match"""
+    def contains(self, key: str, hash_value: int = None) -> SLNode:
+        """
+        Return node with matching key, or None if no match.
+        When the key's hash is given, nodes with another hash are skipped
+        without comparing keys.
+        """
         node = self._head
         while node:
-            if node.key == key:
+            if (hash_value is None or node.hash_value == hash_value) and node.key == key:
                 return node
             node = node.next
         return node
@@ -210,11 +218,14 @@ class LinkedList:
 
 class HashEntry:
 
-    def __init__(self, key: str, value: object) -> None:
+    def __init__(self, key: str, value: object, hash_value: int = None) -> None:
         """Initialize an entry for use in a hash map."""
         self.key = key
         self.value = value
 
+        # full hash of the key, so resizing and probing never rehash the key
+        self.hash_value = hash_value
+
         # Set this value to True when you "delete" a HashEntry
         self.is_tombstone = False
 
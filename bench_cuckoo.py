@@ -0,0 +1,137 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Cuckoo HashMap against the chaining and open addressing HashMaps.
+#              Reports put and get throughput, get latency percentiles and the
+#              most entries a single lookup had to inspect, which is the bound
+#              cuckoo hashing keeps fixed.
+
+
+import gc
+import random
+import time
+
+from a6_include import hash_function_2
+from bench_suite import percentile
+from hash_functions import hash_fnv1a
+import hash_map_cuckoo
+import hash_map_oa
+import hash_map_sc
+
+
+ENGINES = (
+    ('sc', hash_map_sc.HashMap),
+    ('oa', hash_map_oa.HashMap),
+    ('cuckoo', hash_map_cuckoo.HashMap),
+)
+
+HASH_FUNCTIONS = (
+    ('hash_function_2', hash_function_2),
+    ('hash_fnv1a', hash_fnv1a),
+)
+
+
+def worst_lookup(m, keys: list) -> int:
+    """
+    Returns the most entries a lookup of any of the keys inspects
+
+    param: map and keys to look up
+
+    return: int, the longest chain for the chaining map
+    """
+    if hasattr(m, 'probe_length'):
+        return max(m.probe_length(key) for key in keys)
+    return m.stats()['longest_chain']
+
+
+def timed(operation, keys: list) -> float:
+    """
+    Runs the operation on every key
+
+    param: one argument callable and keys
+
+    return: seconds taken
+    """
+    gc.collect()
+    start = time.perf_counter()
+    for key in keys:
+        operation(key)
+    return time.perf_counter() - start
+
+
+def get_latencies(m, keys: list) -> list:
+    """
+    Times every get individually
+
+    param: map and keys
+
+    return: sorted list of per-get nanoseconds
+    """
+    clock = time.perf_counter_ns
+    get = m.get
+    out = []
+    for key in keys:
+        start = clock()
+        get(key)
+        out.append(clock() - start)
+    out.sort()
+    return out
+
+
+def measure(engine, function, count: int, seed: int = 0) -> dict:
+    """
+    Fills a map with count keys and measures puts, hits and misses
+
+    param: map class, hash function, number of keys and random seed
+
+    return: dict of results
+    """
+    rng = random.Random(seed)
+    keys = ['key' + str(rng.randrange(10 ** 12)) for _ in range(count)]
+    missing = ['miss' + str(rng.randrange(10 ** 12)) for _ in range(count)]
+
+    m = engine(11, function)
+    put_seconds = timed(lambda key: m.put(key, key), keys)
+    hit_seconds = timed(m.get, keys)
+    miss_seconds = timed(m.get, missing)
+    latencies = get_latencies(m, keys + missing)
+
+    return {
+        'put': count / put_seconds,
+        'hit': count / hit_seconds,
+        'miss': count / miss_seconds,
+        'p50': percentile(latencies, .5),
+        'p99': percentile(latencies, .99),
+        'p999': percentile(latencies, .999),
+        'worst': max(worst_lookup(m, keys), worst_lookup(m, missing)),
+        'load': m.table_load(),
+    }
+
+
+def main(counts: tuple = (10000, 50000)) -> None:
+    """
+    Prints one line per engine, hash function and key count
+
+    param: key counts to sweep
+
+    return: None
+    """
+    header = f"{'engine':<8}{'function':<17}{'keys':>7}{'load':>6}" \
+             f"{'put/s':>10}{'hit/s':>10}{'miss/s':>10}" \
+             f"{'p50 ns':>8}{'p99 ns':>8}{'p99.9 ns':>10}{'worst':>7}"
+    print(header)
+    print('-' * len(header))
+
+    for count in counts:
+        for function_name, function in HASH_FUNCTIONS:
+            for engine_name, engine in ENGINES:
+                r = measure(engine, function, count)
+                print(f"{engine_name:<8}{function_name:<17}{count:>7}{r['load']:>6.2f}"
+                      f"{r['put']:>10.0f}{r['hit']:>10.0f}{r['miss']:>10.0f}"
+                      f"{r['p50']:>8}{r['p99']:>8}{r['p999']:>10}{r['worst']:>7}")
+
+
+if __name__ == "__main__":
+    main()
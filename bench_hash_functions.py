@@ -0,0 +1,116 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash function benchmark - throughput and bucket distribution
+
+
+import itertools
+import random
+import time
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import hash_builtin, hash_fnv1a, hash_mix
+
+
+HASH_FUNCTIONS = (
+    ('hash_function_1', hash_function_1),
+    ('hash_function_2', hash_function_2),
+    ('hash_fnv1a', hash_fnv1a),
+    ('hash_mix', hash_mix),
+    ('hash_builtin', hash_builtin),
+)
+
+
+def key_sets(count: int, seed: int = 0) -> tuple:
+    """
+    Builds the key sets every hash function is measured against
+
+    param: number of keys per set and random seed
+
+    return: tuple of (name, list of keys)
+    """
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+
+    sequential = ['key' + str(i) for i in range(count)]
+    random_short = [''.join(rng.choice(letters) for _ in range(rng.randrange(4, 12)))
+                    for _ in range(count)]
+    random_long = [''.join(rng.choice(letters) for _ in range(64)) for _ in range(count)]
+    anagrams = [''.join(p) for p in itertools.islice(itertools.permutations('abcdefghij'), count)]
+
+    return (
+        ('sequential', sequential),
+        ('random_short', random_short),
+        ('random_long', random_long),
+        ('anagrams', anagrams),
+    )
+
+
+def throughput(function, keys: list, repeat: int = 3) -> float:
+    """
+    Measures how many keys per second the hash function can process
+
+    param: hash function, keys and number of timed repetitions
+
+    return: best keys per second over the repetitions
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for key in keys:
+            function(key)
+        best = min(best, time.perf_counter() - start)
+    return len(keys) / best
+
+
+def distribution(function, keys: list, buckets: int) -> (float, int, int):
+    """
+    Measures how evenly the hash function spreads keys across buckets
+
+    param: hash function, keys and number of buckets
+
+    return: chi-squared ratio (1.0 is ideal), longest bucket, distinct hash values
+    """
+    counts = [0] * buckets
+    hashes = set()
+    for key in keys:
+        hash = function(key)
+        hashes.add(hash)
+        counts[hash % buckets] += 1
+
+    # chi-squared statistic divided by its expected value under uniform hashing
+    expected = len(keys) / buckets
+    chi_squared = sum((count - expected) ** 2 for count in counts) / expected
+    return chi_squared / (buckets - 1), max(counts), len(hashes)
+
+
+def main(count: int = 20000, buckets: tuple = (10007, 16384)) -> None:
+    """
+    Prints throughput and distribution quality for every hash function and key set
+
+    param: number of keys per set and bucket counts to spread them over
+
+    return: None
+    """
+    header = f"{'keys':<14}{'function':<17}{'keys/sec':>12}{'distinct':>10}"
+    for count_buckets in buckets:
+        header += f"{'chi2@' + str(count_buckets):>14}{'max@' + str(count_buckets):>12}"
+    print(header)
+    print('-' * len(header))
+
+    for set_name, keys in key_sets(count):
+        for function_name, function in HASH_FUNCTIONS:
+            line = f"{set_name:<14}{function_name:<17}{throughput(function, keys):>12.0f}"
+            for index, count_buckets in enumerate(buckets):
+                chi_squared, longest, distinct = distribution(function, keys, count_buckets)
+                if index == 0:
+                    line += f"{distinct:>10}"
+                line += f"{chi_squared:>14.2f}{longest:>12}"
+            print(line)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Capacity selection and bucket index benchmark -
+#              prime modulo vs power of two masking
+
+
+import time
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import mix_low_bits
+from primes import next_power_of_two, next_prime
+import hash_map_oa
+import hash_map_sc
+
+
+def trial_division_next_prime(capacity: int) -> int:
+    """
+    The original _next_prime/_is_prime pair, kept as the baseline
+
+    param: requested capacity
+
+    return: smallest odd prime that is at least capacity
+    """
+    if capacity % 2 == 0:
+        capacity += 1
+
+    while True:
+        if capacity == 3:
+            return capacity
+        if capacity != 1:
+            factor = 3
+            while factor ** 2 <= capacity and capacity % factor != 0:
+                factor += 2
+            if factor ** 2 > capacity:
+                return capacity
+        capacity += 2
+
+
+def time_capacity_selection(repeat: int = 200) -> None:
+    """
+    Prints the cost of picking every capacity along a doubling growth ladder
+
+    param: number of times the ladder is walked
+
+    return: None
+    """
+    ladder = [11 * 2 ** step for step in range(17)]
+
+    for name, function in (('trial division', trial_division_next_prime),
+                           ('prime table', next_prime),
+                           ('power of two', next_power_of_two)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for capacity in ladder:
+                function(capacity)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16}{elapsed / (repeat * len(ladder)) * 1e6:>10.2f} us per capacity")
+
+
+def time_index(function, hashes: list, capacity: int, repeat: int = 5) -> float:
+    """
+    Measures the cost of turning a hash into a bucket index
+
+    param: index function, hashes, capacity and number of timed repetitions
+
+    return: best nanoseconds per index
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for hash in hashes:
+            function(hash, capacity)
+        best = min(best, time.perf_counter() - start)
+    return best / len(hashes) * 1e9
+
+
+def longest_bucket(function, hashes: list, capacity: int) -> int:
+    """
+    Returns how many hashes land in the fullest bucket
+
+    param: index function, hashes and capacity
+
+    return: int of hashes in the fullest bucket
+    """
+    counts = [0] * capacity
+    for hash in hashes:
+        counts[function(hash, capacity)] += 1
+    return max(counts)
+
+
+def compare_index_functions(count: int = 50000) -> None:
+    """
+    Prints index cost and distribution for prime modulo and power of two masking
+
+    param: number of keys hashed
+
+    return: None
+    """
+    schemes = (
+        ('prime %', lambda hash, capacity: hash % capacity, next_prime),
+        ('pow2 & raw', lambda hash, capacity: hash & (capacity - 1), next_power_of_two),
+        ('pow2 & mixed', lambda hash, capacity: mix_low_bits(hash) & (capacity - 1), next_power_of_two),
+    )
+
+    print(f"{'function':<17}{'scheme':<14}{'capacity':>10}{'ns/index':>10}{'longest':>9}")
+    for function_name, function in (('hash_function_1', hash_function_1),
+                                    ('hash_function_2', hash_function_2)):
+        hashes = [function('key' + str(i)) for i in range(count)]
+        for scheme_name, index, pick_capacity in schemes:
+            capacity = pick_capacity(count * 2)
+            print(f"{function_name:<17}{scheme_name:<14}{capacity:>10}"
+                  f"{time_index(index, hashes, capacity):>10.1f}"
+                  f"{longest_bucket(index, hashes, capacity):>9}")
+
+
+def compare_maps(count: int = 20000) -> None:
+    """
+    Prints put and get throughput of both maps in prime and power of two mode
+
+    param: number of keys
+
+    return: None
+    """
+    keys = ['key' + str(i) for i in range(count)]
+
+    print(f"{'map':<8}{'mode':<14}{'put/sec':>12}{'get/sec':>12}")
+    for name, engine in (('sc', hash_map_sc.HashMap), ('oa', hash_map_oa.HashMap)):
+        for power_of_two in (False, True):
+            m = engine(11, hash_function_2, power_of_two=power_of_two)
+
+            start = time.perf_counter()
+            for key in keys:
+                m.put(key, key)
+            put_rate = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for key in keys:
+                m.get(key)
+            get_rate = count / (time.perf_counter() - start)
+
+            mode = 'power of two' if power_of_two else 'prime'
+            print(f"{name:<8}{mode:<14}{put_rate:>12.0f}{get_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    print("\nCapacity selection")
+    print("------------------")
+    time_capacity_selection()
+
+    print("\nBucket index")
+    print("------------")
+    compare_index_functions()
+
+    print("\nEnd to end")
+    print("----------")
+    compare_maps()
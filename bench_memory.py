@@ -0,0 +1,73 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Memory per entry report - object per slot vs compact array storage
+
+
+import gc
+import tracemalloc
+
+from a6_include import hash_function_2
+import hash_map_compact
+import hash_map_oa
+import hash_map_sc
+
+
+LAYOUTS = (
+    ('oa_objects', hash_map_oa.HashMap),
+    ('oa_compact', hash_map_compact.HashMap),
+    ('sc_chains', hash_map_sc.HashMap),
+)
+
+
+def measure(engine, count: int) -> (int, int):
+    """
+    Builds a map with count entries and measures the memory the map itself holds
+
+    param: map class and number of entries
+
+    return: bytes held by the map and its capacity
+    """
+    # keys and values are created first so only the table structure is measured
+    keys = ['key' + str(i) for i in range(count)]
+    values = [i * 1000 for i in range(count)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    m = engine(11, hash_function_2)
+    for num in range(count):
+        m.put(keys[num], values[num])
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, m.get_capacity()
+
+
+def main(counts: tuple = (1000, 10000, 30000)) -> None:
+    """
+    Prints bytes per entry and bytes per bucket for every storage layout
+
+    param: entry counts to measure
+
+    return: None
+    """
+    header = f"{'layout':<12}{'entries':>10}{'capacity':>10}{'bytes':>14}" \
+             f"{'bytes/entry':>14}{'bytes/bucket':>14}"
+    print(header)
+    print('-' * len(header))
+
+    for count in counts:
+        for name, engine in LAYOUTS:
+            used, capacity = measure(engine, count)
+            print(f"{name:<12}{count:>10}{capacity:>10}{used:>14}"
+                  f"{used / count:>14.1f}{used / capacity:>14.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
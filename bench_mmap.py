@@ -0,0 +1,62 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Cold start report - rebuilding an OA HashMap with put vs opening
+#              a memory-mapped table file
+
+
+import os
+import tempfile
+import time
+
+from hash_functions import hash_fnv1a
+import hash_map_mmap
+import hash_map_oa
+
+
+def main(counts: tuple = (10000, 100000, 300000), lookups: int = 1000) -> None:
+    """
+    Prints rebuild time, file write time and time to open the file and serve lookups
+
+    param: key counts to measure and number of lookups after the start
+
+    return: None
+    """
+    print(f"{'keys':>8}{'rebuild s':>11}{'write s':>10}{'open ms':>10}"
+          f"{'first gets ms':>15}{'file MiB':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'table.hm')
+
+        for count in counts:
+            pairs = [('key' + str(i), i) for i in range(count)]
+            probe_keys = [key for key, value in pairs[::max(count // lookups, 1)]]
+
+            start = time.perf_counter()
+            m = hash_map_oa.HashMap(11, hash_fnv1a)
+            for key, value in pairs:
+                m.put(key, value)
+            rebuild = time.perf_counter() - start
+
+            start = time.perf_counter()
+            hash_map_mmap.HashMap.write(path, pairs, hash_fnv1a)
+            write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            mapped = hash_map_mmap.HashMap.open(path)
+            opened = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for key in probe_keys:
+                mapped.get(key)
+            gets = time.perf_counter() - start
+            mapped.close()
+
+            print(f"{count:>8}{rebuild:>11.2f}{write:>10.2f}{opened * 1e3:>10.3f}"
+                  f"{gets * 1e3:>15.2f}{os.path.getsize(path) / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Probe length comparison - quadratic probing vs Robin Hood probing
+
+
+import random
+
+from a6_include import hash_function_1, hash_function_2
+import hash_map_oa
+import hash_map_rh
+
+
+ENGINES = (
+    ('quadratic', hash_map_oa.HashMap),
+    ('robin_hood', hash_map_rh.HashMap),
+)
+
+HASH_FUNCTIONS = (
+    ('hash_function_1', hash_function_1),
+    ('hash_function_2', hash_function_2),
+)
+
+
+def summarize(lengths: list) -> (float, int, int):
+    """
+    Summarizes a list of probe lengths
+
+    param: list of probe lengths
+
+    return: mean, 99th percentile and max probe length
+    """
+    lengths = sorted(lengths)
+    mean = sum(lengths) / len(lengths)
+    p99 = lengths[min(len(lengths) - 1, int(len(lengths) * .99))]
+    return mean, p99, lengths[-1]
+
+
+def measure(engine, function, capacity: int, load: float, seed: int = 0) -> dict:
+    """
+    Fills a map to the given load factor and records hit and miss probe lengths
+
+    param: map class, hash function, capacity, load factor and random seed
+
+    return: dict of probe length summaries for hits and misses
+    """
+    rng = random.Random(seed)
+    m = engine(capacity, function)
+    count = int(m.get_capacity() * load)
+
+    keys = ['key' + str(rng.randrange(10 ** 9)) for _ in range(count)]
+    for key in keys:
+        m.put(key, key)
+    missing = ['miss' + str(rng.randrange(10 ** 9)) for _ in range(count)]
+
+    return {
+        'hit': summarize([m.probe_length(key) for key in keys]),
+        'miss': summarize([m.probe_length(key) for key in missing]),
+    }
+
+
+def main(capacity: int = 4099, loads: tuple = (.1, .25, .4, .49)) -> None:
+    """
+    Prints a probe length table for every engine, hash function and load factor
+
+    param: capacity and load factors to sweep
+
+    return: None
+    """
+    header = f"{'engine':<12}{'function':<17}{'load':>6}" \
+             f"{'hit mean':>10}{'hit p99':>9}{'hit max':>9}" \
+             f"{'miss mean':>11}{'miss p99':>10}{'miss max':>10}"
+    print(header)
+    print('-' * len(header))
+
+    for function_name, function in HASH_FUNCTIONS:
+        for load in loads:
+            for engine_name, engine in ENGINES:
+                result = measure(engine, function, capacity, load)
+                hit, miss = result['hit'], result['miss']
+                print(f"{engine_name:<12}{function_name:<17}{load:>6.2f}"
+                      f"{hit[0]:>10.2f}{hit[1]:>9}{hit[2]:>9}"
+                      f"{miss[0]:>11.2f}{miss[1]:>10}{miss[2]:>10}")
+
+
+if __name__ == "__main__":
+    main()
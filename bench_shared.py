@@ -0,0 +1,76 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Worker startup and memory report - every worker rebuilding its own
+#              OA HashMap vs attaching to one shared memory table
+
+
+import gc
+import time
+import tracemalloc
+
+from hash_functions import hash_fnv1a
+import hash_map_oa
+import hash_map_shared
+
+
+def build_private(pairs: list) -> hash_map_oa.HashMap:
+    """
+    Builds the per worker copy the shared table replaces
+
+    param: key/value pairs
+
+    return: HashMap
+    """
+    m = hash_map_oa.HashMap(len(pairs) * 2, hash_fnv1a)
+    m.put_many(pairs)
+    return m
+
+
+def main(counts: tuple = (1000, 10000, 100000)) -> None:
+    """
+    Prints startup time and memory of a private map and an attached shared table
+
+    param: key counts to measure
+
+    return: None
+    """
+    print(f"{'keys':>8}{'rebuild ms':>12}{'attach ms':>11}{'private KiB':>13}{'shared KiB':>12}"
+          f"{'get/sec oa':>13}{'get/sec shm':>13}")
+
+    for count in counts:
+        pairs = [('key' + str(i), i) for i in range(count)]
+        keys = [key for key, value in pairs]
+
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        private = build_private(pairs)
+        rebuild = time.perf_counter() - start
+        private_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        with hash_map_shared.HashMap.build(pairs, hash_fnv1a) as owner:
+            start = time.perf_counter()
+            shared = hash_map_shared.HashMap.attach(owner.get_name())
+            shared.get(keys[0])
+            attach = time.perf_counter() - start
+
+            rates = []
+            for m in (private, shared):
+                start = time.perf_counter()
+                for key in keys:
+                    m.get(key)
+                rates.append(count / (time.perf_counter() - start))
+
+            shared_bytes = len(owner._segment.buf)
+            shared.close()
+
+        print(f"{count:>8}{rebuild * 1e3:>12.1f}{attach * 1e3:>11.3f}{private_bytes / 1024:>13.0f}"
+              f"{shared_bytes / 1024:>12.0f}{rates[0]:>13.0f}{rates[1]:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Reproducible benchmark suite - SC and OA HashMaps with every hash
+#              function against the builtin dict, across workloads, table sizes
+#              and load factors. Reports ops/sec, p50/p99 latency and peak memory
+#              and can write the results as JSON to track regressions.
+#
+#              python bench_suite.py                        full sweep
+#              python bench_suite.py --quick                small sweep
+#              python bench_suite.py --json results.json    also write JSON
+
+
+import argparse
+import bisect
+import gc
+import itertools
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import hash_fnv1a, hash_mix
+import hash_map_cuckoo
+import hash_map_oa
+import hash_map_sc
+
+
+# hash_builtin is left out, str hashes change between runs unless PYTHONHASHSEED is set
+HASH_FUNCTIONS = (
+    ('hash_function_1', hash_function_1),
+    ('hash_function_2', hash_function_2),
+    ('hash_fnv1a', hash_fnv1a),
+    ('hash_mix', hash_mix),
+)
+
+MAPS = (
+    ('sc', hash_map_sc.HashMap),
+    ('oa', hash_map_oa.HashMap),
+    ('cuckoo', hash_map_cuckoo.HashMap),
+)
+
+WORKLOADS = ('uniform', 'zipf', 'sequential', 'anagram', 'delete_heavy')
+
+# every anagram has the same hash_function_1 value, so larger runs take minutes
+ANAGRAM_LIMIT = 2000
+
+# exponent of the Zipf distribution used for skewed lookups
+ZIPF_EXPONENT = 1.1
+
+
+class DictMap:
+    """
+    The builtin dict behind the HashMap put/get/remove interface
+    """
+
+    def __init__(self, capacity: int = 0, function=None) -> None:
+        """Initialize an empty dict, capacity and function are ignored"""
+        self._data = {}
+
+    def put(self, key: str, value: object) -> None:
+        """Store value under key"""
+        self._data[key] = value
+
+    def get(self, key: str) -> object:
+        """Return the value of key or None"""
+        return self._data.get(key)
+
+    def remove(self, key: str) -> None:
+        """Remove key if present"""
+        self._data.pop(key, None)
+
+    def get_size(self) -> int:
+        """Return the number of keys"""
+        return len(self._data)
+
+
+# ------------------------------------------------------------------ #
+# workloads - each one is a list of (operation, key) pairs applied in order
+
+
+def random_keys(rng: random.Random, count: int) -> list:
+    """
+    Builds count distinct random lowercase keys
+
+    param: random generator and number of keys
+
+    return: list of keys
+    """
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    keys = set()
+    while len(keys) < count:
+        keys.add(''.join(rng.choice(letters) for _ in range(rng.randrange(6, 16))))
+    out = sorted(keys)
+    rng.shuffle(out)
+    return out
+
+
+def zipf_sample(rng: random.Random, keys: list, count: int) -> list:
+    """
+    Samples count keys where the i-th key is chosen with weight 1 / (i + 1) ** s
+
+    param: random generator, keys ordered from most to least popular and sample size
+
+    return: list of sampled keys
+    """
+    cumulative = list(itertools.accumulate(1 / (rank + 1) ** ZIPF_EXPONENT
+                                           for rank in range(len(keys))))
+    total = cumulative[-1]
+    return [keys[bisect.bisect_left(cumulative, rng.random() * total)] for _ in range(count)]
+
+
+def build_workload(name: str, size: int, seed: int) -> list:
+    """
+    Builds the operation list for a workload
+
+    param: workload name, number of distinct keys and random seed
+
+    return: list of (operation, key) tuples
+    """
+    rng = random.Random(f"{name}:{size}:{seed}")
+
+    if name == 'uniform':
+        keys = random_keys(rng, size)
+        lookups = [rng.choice(keys) for _ in range(size)]
+        return [('put', key) for key in keys] + [('get', key) for key in lookups]
+
+    if name == 'zipf':
+        keys = random_keys(rng, size)
+        return [('put', key) for key in keys] + \
+               [('get', key) for key in zipf_sample(rng, keys, size * 2)]
+
+    if name == 'sequential':
+        keys = ['key' + str(i) for i in range(size)]
+        return [('put', key) for key in keys] + [('get', key) for key in keys]
+
+    if name == 'anagram':
+        # permutations of one string share their character sum and length
+        keys = [''.join(p) for p in itertools.islice(itertools.permutations('abcdefghij'), size)]
+        rng.shuffle(keys)
+        misses = [key[::-1] + 'x' for key in keys[:size // 4]]
+        return [('put', key) for key in keys] + [('get', key) for key in keys] + \
+               [('get', key) for key in misses]
+
+    if name == 'delete_heavy':
+        # fill, then repeatedly drop half the live keys and insert fresh ones
+        keys = random_keys(rng, size * 3)
+        live = keys[:size]
+        fresh = iter(keys[size:])
+        ops = [('put', key) for key in live]
+        for _ in range(4):
+            rng.shuffle(live)
+            half = len(live) // 2
+            ops += [('remove', key) for key in live[:half]]
+            ops += [('get', key) for key in live[:half // 2]]
+            live = live[half:]
+            for _ in range(half):
+                key = next(fresh, None)
+                if key is None:
+                    break
+                ops.append(('put', key))
+                live.append(key)
+        return ops
+
+    raise ValueError(f"unknown workload {name!r}")
+
+
+# ------------------------------------------------------------------ #
+# measurements
+
+
+def apply(m, ops: list) -> None:
+    """
+    Runs every operation against the map
+
+    param: map and operation list
+
+    return: None
+    """
+    put, get, remove = m.put, m.get, m.remove
+    for op, key in ops:
+        if op == 'get':
+            get(key)
+        elif op == 'put':
+            put(key, key)
+        else:
+            remove(key)
+
+
+def throughput(make_map, ops: list, repeat: int) -> float:
+    """
+    Measures operations per second, best of repeat fresh runs
+
+    param: zero argument map factory, operation list and repetitions
+
+    return: ops/sec
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        m = make_map()
+        gc.collect()
+        start = time.perf_counter()
+        apply(m, ops)
+        best = min(best, time.perf_counter() - start)
+    return len(ops) / best if best > 0 else float('inf')
+
+
+def latencies(make_map, ops: list) -> list:
+    """
+    Times every operation individually on a fresh map
+
+    param: zero argument map factory and operation list
+
+    return: sorted list of per-op nanoseconds
+    """
+    m = make_map()
+    clock = time.perf_counter_ns
+    out = []
+    for op, key in ops:
+        if op == 'get':
+            start = clock()
+            m.get(key)
+        elif op == 'put':
+            start = clock()
+            m.put(key, key)
+        else:
+            start = clock()
+            m.remove(key)
+        out.append(clock() - start)
+    out.sort()
+    return out
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Nearest rank percentile of an already sorted list
+
+    param: sorted values and fraction between 0 and 1
+
+    return: value at that percentile
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def peak_memory(make_map, ops: list) -> (int, object):
+    """
+    Measures the peak memory allocated while running the workload
+
+    param: zero argument map factory and operation list
+
+    return: peak bytes and the finished map
+    """
+    gc.collect()
+    tracemalloc.start()
+    m = make_map()
+    apply(m, ops)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, m
+
+
+def engines() -> list:
+    """
+    Lists every map configuration the suite measures
+
+    param: None
+
+    return: list of (map name, hash function name, map class, hash function)
+    """
+    out = [(map_name, function_name, engine, function)
+           for map_name, engine in MAPS
+           for function_name, function in HASH_FUNCTIONS]
+    out.append(('dict', 'builtin', DictMap, None))
+    return out
+
+
+def run(sizes: tuple, load_factors: tuple, workloads: tuple, repeat: int, seed: int,
+        anagram_limit: int = ANAGRAM_LIMIT) -> list:
+    """
+    Runs the whole sweep and prints one line per measurement
+
+    param: table sizes, load factors, workloads, timed repetitions, random seed
+           and largest anagram size to run
+
+    return: list of result dicts
+    """
+    results = []
+    header = f"{'workload':<14}{'size':>7}{'lf':>6}{'map':>8}  {'hash':<17}" \
+             f"{'ops/sec':>12}{'p50 ns':>9}{'p99 ns':>9}{'peak KiB':>11}{'load':>7}"
+    print(header)
+    print('-' * len(header))
+
+    for workload in workloads:
+        for size in sizes:
+            if workload == 'anagram' and size > anagram_limit:
+                print(f"{workload:<14}{size:>7}  skipped, above the anagram limit of {anagram_limit}")
+                continue
+
+            ops = build_workload(workload, size, seed)
+            for load_factor in load_factors:
+                # the initial capacity puts the final key count at the requested load,
+                # OA still resizes at .5 so final_load records the load actually reached
+                capacity = max(math.ceil(size / load_factor), 1)
+
+                for map_name, function_name, engine, function in engines():
+                    def make_map(engine=engine, function=function):
+                        return engine(capacity, function)
+
+                    rate = throughput(make_map, ops, repeat)
+                    timings = latencies(make_map, ops)
+                    peak, m = peak_memory(make_map, ops)
+                    load = m.table_load() if hasattr(m, 'table_load') else None
+
+                    result = {
+                        'workload': workload,
+                        'size': size,
+                        'load_factor': load_factor,
+                        'initial_capacity': capacity,
+                        'map': map_name,
+                        'hash_function': function_name,
+                        'ops': len(ops),
+                        'ops_per_sec': rate,
+                        'p50_ns': percentile(timings, .50),
+                        'p99_ns': percentile(timings, .99),
+                        'peak_bytes': peak,
+                        'final_load': load,
+                    }
+                    results.append(result)
+
+                    load_text = f"{load:>7.2f}" if load is not None else f"{'-':>7}"
+                    print(f"{workload:<14}{size:>7}{load_factor:>6.2f}{map_name:>8}  "
+                          f"{function_name:<17}{rate:>12.0f}{result['p50_ns']:>9.0f}"
+                          f"{result['p99_ns']:>9.0f}{peak / 1024:>11.1f}{load_text}")
+            print()
+
+    return results
+
+
+def main(argv: list = None) -> None:
+    """
+    Parses the command line, runs the sweep and optionally writes JSON
+
+    param: command line arguments, sys.argv[1:] when None
+
+    return: None
+    """
+    parser = argparse.ArgumentParser(description='HashMap benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--load-factors', type=float, nargs='+', default=[.25, .5, .9])
+    parser.add_argument('--workloads', nargs='+', choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--anagram-limit', type=int, default=ANAGRAM_LIMIT)
+    parser.add_argument('--quick', action='store_true', help='one small size, one repetition')
+    parser.add_argument('--json', metavar='PATH', help='write machine readable results here')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.sizes, args.load_factors, args.repeat = [500], [.5], 1
+
+    results = run(tuple(args.sizes), tuple(args.load_factors), tuple(args.workloads),
+                  args.repeat, args.seed, args.anagram_limit)
+
+    if args.json:
+        report = {
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'results': results,
+        }
+        with open(args.json, 'w') as out:
+            json.dump(report, out, indent=2)
+        print(f"wrote {len(results)} results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Swiss table HashMap against the quadratic probing HashMap.
+#              The quadratic map inspects one HashEntry per probe, the Swiss
+#              table inspects a group of eight control bytes per probe and only
+#              compares keys on fragment matches. Reports get throughput, probes
+#              per lookup and key comparisons per lookup.
+
+
+import gc
+import random
+import time
+
+from a6_include import hash_function_2
+from hash_functions import hash_fnv1a
+import hash_map_oa
+import hash_map_swiss
+
+
+HASH_FUNCTIONS = (
+    ('hash_function_2', hash_function_2),
+    ('hash_fnv1a', hash_fnv1a),
+)
+
+
+def timed_gets(m, keys: list) -> float:
+    """
+    Looks up every key
+
+    param: map and keys
+
+    return: gets per second
+    """
+    gc.collect()
+    get = m.get
+    start = time.perf_counter()
+    for key in keys:
+        get(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def oa_comparisons(m, key: str) -> int:
+    """
+    Counts the live entries a quadratic probing lookup compares the key with,
+    an entry is only compared once its cached hash matches
+
+    param: hash_map_oa HashMap and key
+
+    return: int of key comparisons
+    """
+    hash_value = m._hash_function(key)
+    buckets = m._buckets
+    capacity = buckets.length()
+    q_probe = m._bucket_index(hash_value, capacity)
+    j_counter = comparisons = 0
+
+    while True:
+        bucket = buckets[q_probe]
+        if bucket is None:
+            return comparisons
+        if bucket.is_tombstone is False and bucket.hash_value == hash_value:
+            comparisons += 1
+            if bucket.key == key:
+                return comparisons
+        j_counter += 1
+        q_probe = m._next_probe(q_probe, j_counter, capacity)
+
+
+def summarize(values: list) -> (float, int):
+    """Return the mean and max of a list"""
+    return sum(values) / len(values), max(values)
+
+
+def measure(function, count: int, seed: int = 0) -> list:
+    """
+    Fills both maps with the same keys and measures hits and misses
+
+    param: hash function, number of keys and random seed
+
+    return: list of (engine name, load, hit/s, miss/s, probes, comparisons) with
+            probes and comparisons as (mean, max) over hits and misses together
+    """
+    rng = random.Random(seed)
+    keys = ['key' + str(rng.randrange(10 ** 12)) for _ in range(count)]
+    missing = ['miss' + str(rng.randrange(10 ** 12)) for _ in range(count)]
+    lookups = keys + missing
+
+    oa = hash_map_oa.HashMap(11, function)
+    swiss = hash_map_swiss.HashMap(11, function)
+    for key in keys:
+        oa.put(key, key)
+        swiss.put(key, key)
+
+    return [
+        ('quadratic', oa.table_load(), timed_gets(oa, keys), timed_gets(oa, missing),
+         summarize([oa.probe_length(key) for key in lookups]),
+         summarize([oa_comparisons(oa, key) for key in lookups])),
+        ('swiss', swiss.table_load(), timed_gets(swiss, keys), timed_gets(swiss, missing),
+         summarize([swiss.probe_length(key) for key in lookups]),
+         summarize([swiss.key_comparisons(key) for key in lookups])),
+    ]
+
+
+def main(counts: tuple = (5000, 20000)) -> None:
+    """
+    Prints one line per engine, hash function and key count
+
+    param: key counts to sweep
+
+    return: None
+    """
+    header = f"{'engine':<11}{'function':<17}{'keys':>7}{'load':>6}" \
+             f"{'hit/s':>10}{'miss/s':>10}" \
+             f"{'probes':>8}{'max':>6}{'compares':>10}{'max':>6}"
+    print(header)
+    print('-' * len(header))
+
+    for count in counts:
+        for function_name, function in HASH_FUNCTIONS:
+            for name, load, hit, miss, probes, comparisons in measure(function, count):
+                print(f"{name:<11}{function_name:<17}{count:>7}{load:>6.2f}"
+                      f"{hit:>10.0f}{miss:>10.0f}"
+                      f"{probes[0]:>8.2f}{probes[1]:>6}{comparisons[0]:>10.2f}{comparisons[1]:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Multi-threaded throughput benchmark - one global lock around the
+#              chaining HashMap vs the lock striped HashMap, scaling the threads.
+#              Threads only run in parallel on a free-threaded CPython build.
+
+
+import random
+import sys
+import threading
+import time
+
+from hash_functions import hash_fnv1a
+import hash_map_concurrent
+import hash_map_sc
+
+
+class GlobalLockMap:
+    """
+    The chaining HashMap behind one lock, the baseline the stripes are compared to
+    """
+
+    def __init__(self, capacity: int, function) -> None:
+        """Initialize the wrapped map and its lock"""
+        self._map = hash_map_sc.HashMap(capacity, function)
+        self._lock = threading.Lock()
+
+    def put(self, key: str, value: object) -> None:
+        """Store value under key while holding the lock"""
+        with self._lock:
+            self._map.put(key, value)
+
+    def get(self, key: str) -> object:
+        """Return the value of key while holding the lock"""
+        with self._lock:
+            return self._map.get(key)
+
+
+def worker(m, keys: list, ops: int, put_share: float, seed: int, barrier: threading.Barrier) -> None:
+    """
+    Runs a random mix of puts and gets against the shared map
+
+    param: map, key universe, number of operations, share of puts, seed and start barrier
+
+    return: None
+    """
+    rng = random.Random(seed)
+    picks = [(rng.random() < put_share, rng.choice(keys)) for _ in range(ops)]
+    put, get = m.put, m.get
+
+    barrier.wait()
+    for is_put, key in picks:
+        if is_put:
+            put(key, key)
+        else:
+            get(key)
+
+
+def run(make_map, threads: int, keys: list, ops: int, put_share: float) -> float:
+    """
+    Measures total operations per second with the given number of threads
+
+    param: map factory, thread count, key universe, operations per thread and share of puts
+
+    return: ops/sec over all threads
+    """
+    m = make_map()
+    for key in keys:
+        m.put(key, key)
+
+    # the extra party lets the clock start once every worker is ready
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=worker, args=(m, keys, ops, put_share, n, barrier))
+               for n in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main(thread_counts: tuple = (1, 2, 4, 8), key_count: int = 20000,
+         ops: int = 50000, put_share: float = .2) -> None:
+    """
+    Prints throughput of both maps for every thread count
+
+    param: thread counts, number of keys, operations per thread and share of puts
+
+    return: None
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled() else 'disabled'}")
+
+    keys = ['key' + str(i) for i in range(key_count)]
+    maps = (
+        ('global lock', lambda: GlobalLockMap(key_count, hash_fnv1a)),
+        ('4 stripes', lambda: hash_map_concurrent.HashMap(key_count, hash_fnv1a, stripes=4)),
+        ('64 stripes', lambda: hash_map_concurrent.HashMap(key_count, hash_fnv1a, stripes=64)),
+    )
+
+    print(f"{'map':<14}" + ''.join(f"{str(n) + ' threads':>14}" for n in thread_counts))
+    for name, make_map in maps:
+        rates = [run(make_map, threads, keys, ops, put_share) for threads in thread_counts]
+        print(f"{name:<14}" + ''.join(f"{rate:>14.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
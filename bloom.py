@@ -0,0 +1,177 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Counting Bloom filter kept next to both HashMaps (SC & OA).
+#              It is indexed by the hash the map already cached for each key,
+#              so a lookup of a missing key is usually answered from a couple of
+#              counters without hashing again or touching a bucket. A key the
+#              filter has never seen is missing, so get, contains_key and remove
+#              return before probing or walking a chain. A resize resets the
+#              filter for the new capacity and the keys are added back as they
+#              are moved.
+
+
+import math
+
+from hash_functions import MASK_64, PRIME_1
+
+
+# a counter that reaches this value sticks there, since its true count is unknown
+MAX_COUNT = 255
+
+
+class CountingBloomFilter:
+    """
+    Bloom filter with one 8-bit counter per position instead of one bit, so
+    keys can be removed again. A key sets hashes counters picked by double
+    hashing its map hash, folded and multiplied once so the low and high
+    halves both depend on every bit. A lookup that finds any of them at zero
+    is a definite miss, one that finds all of them set may still be a miss.
+    """
+
+    def __init__(self, capacity: int, bits_per_key: int = 10, max_load: float = 1.0) -> None:
+        """
+        Initialize an empty filter with bits_per_key counters for each key a
+        table of the capacity holds before it grows, capacity * max_load keys.
+        Counters are one byte each, so the filter takes bits_per_key bytes per key
+        """
+        if bits_per_key < 1:
+            raise ValueError("bits_per_key must be at least 1")
+
+        self._bits_per_key = bits_per_key
+        self._max_load = max_load
+
+        # this many hashes gives the lowest false positive rate for the counters per key
+        self._hashes = max(1, round(bits_per_key * math.log(2)))
+
+        # lookups the filter answered alone, and lookups it let through for keys that were missing
+        self.negatives = 0
+        self.false_positives = 0
+
+        self.reset(capacity)
+
+    def reset(self, capacity: int) -> None:
+        """
+        Empties the filter and sizes it for the keys a table of the capacity
+        holds before it grows, the lookup counters are kept
+
+        param: capacity of the table, or the number of keys for a filter used on its own
+
+        return: None
+        """
+        self._width = max(64, math.ceil(capacity * self._max_load) * self._bits_per_key)
+        self._counters = bytearray(self._width)
+        self._count = 0
+
+    def _positions(self, hash_value: int):
+        """
+        Generator over the counters a key sets
+
+        param: hash of the key
+
+        return: generator of counter indices
+        """
+        # hashes are taken as unsigned 64 bits, so a negative hash and its masked form agree
+        hash_value &= MASK_64
+        hash_value = ((hash_value ^ (hash_value >> 32)) * PRIME_1) & MASK_64
+        width = self._width
+        index = hash_value & 0xffffffff
+        step = (hash_value >> 32) | 1
+        for _ in range(self._hashes):
+            yield index % width
+            index += step
+
+    def add(self, hash_value: int) -> None:
+        """
+        Adds a key given its map hash
+
+        param: hash of the key
+
+        return: None
+        """
+        counters = self._counters
+        for index in self._positions(hash_value):
+            if counters[index] < MAX_COUNT:
+                counters[index] += 1
+        self._count += 1
+
+    def remove(self, hash_value: int) -> None:
+        """
+        Removes a key that was added before
+
+        param: hash of the key
+
+        return: None
+        """
+        counters = self._counters
+        for index in self._positions(hash_value):
+            if 0 < counters[index] < MAX_COUNT:
+                counters[index] -= 1
+        self._count -= 1
+
+    def might_contain(self, hash_value: int) -> bool:
+        """
+        Returns false when the key was definitely never added, stopping at the
+        first counter at zero
+
+        param: hash of the key
+
+        return: bool
+        """
+        counters = self._counters
+        for index in self._positions(hash_value):
+            if counters[index] == 0:
+                self.negatives += 1
+                return False
+        return True
+
+    def get_bits_per_key(self) -> int:
+        """Return the number of counters per key"""
+        return self._bits_per_key
+
+    def estimated_fpr(self) -> float:
+        """Return the chance a missing key finds all of its counters set right now"""
+        fill = (self._width - self._counters.count(0)) / self._width
+        return fill ** self._hashes
+
+    def stats(self) -> dict:
+        """
+        Returns the filter's shape, its estimated false positive rate and the
+        rate observed on the lookups of missing keys so far
+
+        param: None
+
+        return: dict of statistics
+        """
+        misses = self.negatives + self.false_positives
+        return {
+            'keys': self._count,
+            'counters': self._width,
+            'hashes': self._hashes,
+            'bits_per_key': self._bits_per_key,
+            'estimated_fpr': self.estimated_fpr(),
+            'negatives': self.negatives,
+            'false_positives': self.false_positives,
+            'observed_fpr': self.false_positives / misses if misses else 0.0,
+        }
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+    from hash_map_oa import HashMap
+    from hash_functions import hash_fnv1a
+
+    print("\nBloom filter - lookups of missing keys")
+    print("--------------------------------------")
+    m = HashMap(11, hash_fnv1a)
+    m.enable_bloom()
+    for i in range(1000):
+        m.put('key' + str(i), i)
+    for i in range(0, 1000, 2):
+        m.remove('key' + str(i))
+    print(sum(m.contains_key('key' + str(i)) for i in range(1000)),
+          sum(m.contains_key('missing' + str(i)) for i in range(10000)))
+    print(m.stats()['bloom'])
@@ -0,0 +1,533 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Bounded LRU cache with per-entry TTL on top of the project's HashMaps.
+#              The map stores a CacheEntry per key and the entries themselves are
+#              the links of a doubly linked recency list, so get, put and evict
+#              never search anything but the key's own bucket. A random eviction
+#              variant and a memoize decorator are built on the same cache.
+
+
+from contextlib import nullcontext
+import functools
+import random
+import threading
+import time
+
+from a6_include import DynamicArray
+from hash_functions import hash_builtin
+import hash_map_sc
+
+
+class CacheEntry:
+    """
+    Value stored in the map, doubling as a node of the recency list
+    """
+
+    def __init__(self, key: str, value: object, expires: float) -> None:
+        """Initialize an entry that is not linked into the recency list yet"""
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.prev = None
+        self.next = None
+
+        # position in the slot array of a RandomEvictionCache
+        self.slot = None
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output"""
+        return f"K: {self.key} V: {self.value} E: {self.expires}"
+
+
+class BoundedCache:
+    """
+    Cache holding at most max_entries keys. A put past the bound evicts the
+    least recently used key, and entries older than their TTL are treated as
+    missing and dropped the next time they are looked up.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = None,
+                 function: callable = hash_builtin, clock: callable = time.monotonic,
+                 map_class=hash_map_sc.HashMap) -> None:
+        """
+        Initialize an empty cache
+
+        param: maximum number of entries, default seconds an entry lives (forever
+               when None), hash function of the map, the clock TTLs are measured on
+               and the HashMap class the entries are stored in (SC or OA)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+
+        # sized for the bound, a chaining map then never resizes while the cache stays within it
+        self._map = map_class(max_entries + 1, function)
+
+        # sentinel of the recency list, head.next is the most recently used entry
+        self._head = CacheEntry(None, None, None)
+        self._head.prev = self._head.next = self._head
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for entry in self._entries():
+            out += str(entry) + '\n'
+        return out
+
+    # ------------------------------------------------------------------ #
+
+    def _unlink(self, entry: CacheEntry) -> None:
+        """Takes the entry out of the recency list"""
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = None
+
+    def _link(self, entry: CacheEntry) -> None:
+        """Links the entry in as the most recently used one"""
+        head = self._head
+        entry.prev = head
+        entry.next = head.next
+        head.next.prev = entry
+        head.next = entry
+
+    def _touch(self, entry: CacheEntry) -> None:
+        """Marks the entry as just used"""
+        if self._head.next is not entry:
+            self._unlink(entry)
+            self._link(entry)
+
+    def _drop(self, entry: CacheEntry) -> None:
+        """Removes the entry from both the list and the map"""
+        self._unlink(entry)
+        self._map.remove(entry.key)
+
+    def _expires(self, ttl: float) -> float:
+        """Returns the expiry time of an entry put now, None when it never expires"""
+        if ttl is None:
+            ttl = self._ttl
+        if ttl is None:
+            return None
+        return self._clock() + ttl
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        """Returns true if the entry has outlived its TTL"""
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _find(self, key: str, h_value: int) -> CacheEntry:
+        """
+        Returns the live entry of the key, dropping it if it expired
+
+        param: key and its hash
+
+        return: CacheEntry, or None when the key is missing or expired
+        """
+        node = self._map._find_node(key, h_value)
+        if node is None:
+            return None
+
+        entry = node.value
+        if self._is_expired(entry):
+            self._drop(entry)
+            self._expirations += 1
+            return None
+        return entry
+
+    def _victim(self) -> CacheEntry:
+        """Returns the entry evicted to make room, the least recently used one"""
+        return self._head.prev
+
+    def _reset_links(self) -> None:
+        """Forgets every entry after the map was cleared"""
+        self._head.prev = self._head.next = self._head
+
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str, default: object = None) -> object:
+        """
+        Returns the cached value of the key and marks it as recently used
+
+        param: key and value returned when the key is missing or expired
+
+        return: cached value or default
+        """
+        entry = self._find(key, self._map._hash_function(key))
+        if entry is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key: str, value: object, ttl: float = None) -> None:
+        """
+        Caches the value of the key, evicting the least recently used key when full
+
+        param: key, value and seconds the entry lives (the cache default when None)
+
+        return: None
+        """
+        h_value = self._map._hash_function(key)
+        expires = self._expires(ttl)
+
+        node = self._map._find_node(key, h_value)
+        if node is not None:
+            entry = node.value
+            entry.value = value
+            entry.expires = expires
+            self._touch(entry)
+            return
+
+        # a victim that already expired is counted as an expiration, not an eviction
+        if self._map.get_size() >= self._max_entries:
+            victim = self._victim()
+            self._drop(victim)
+            if self._is_expired(victim):
+                self._expirations += 1
+            else:
+                self._evictions += 1
+
+        entry = CacheEntry(key, value, expires)
+        self._map._put(key, entry, h_value)
+        self._link(entry)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if the key is cached and not expired, without marking it used
+
+        param: key
+
+        return: bool
+        """
+        return self._find(key, self._map._hash_function(key)) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the key from the cache
+
+        param: key
+
+        return: None
+        """
+        node = self._map._find_node(key, self._map._hash_function(key))
+        if node is not None:
+            self._drop(node.value)
+
+    def purge_expired(self) -> int:
+        """
+        Drops every expired entry now instead of on its next lookup
+
+        param: None
+
+        return: int of entries dropped
+        """
+        expired = [entry for entry in self._entries() if self._is_expired(entry)]
+        for entry in expired:
+            self._drop(entry)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Removes every entry, the counters are kept
+
+        param: None
+
+        return: None
+        """
+        self._map.clear()
+        self._reset_links()
+
+    def reset_stats(self) -> None:
+        """
+        Sets the hit, miss, eviction and expiration counters back to zero
+
+        param: None
+
+        return: None
+        """
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_size(self) -> int:
+        """Return number of cached entries, expired ones included until dropped"""
+        return self._map.get_size()
+
+    def get_max_entries(self) -> int:
+        """Return the most entries the cache holds"""
+        return self._max_entries
+
+    def _entries(self):
+        """Yields the entries from most to least recently used"""
+        entry = self._head.next
+        while entry is not self._head:
+            following = entry.next
+            yield entry
+            entry = following
+
+    def keys(self):
+        """
+        Iterates over the keys from most to least recently used
+
+        param: None
+
+        return: generator of keys
+        """
+        for entry in self._entries():
+            yield entry.key
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples from most to least recently used
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        for entry in self._entries():
+            yield entry.key, entry.value
+
+    def stats(self) -> dict:
+        """
+        Returns the hit, miss, eviction and expiration counters with the
+        occupancy of the underlying map
+
+        param: None
+
+        return: dict of statistics
+        """
+        lookups = self._hits + self._misses
+        return {
+            'size': self.get_size(),
+            'max_entries': self._max_entries,
+            'capacity': self._map.get_capacity(),
+            'table_load': self._map.table_load(),
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / lookups if lookups else 0.0,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+        }
+
+
+class RandomEvictionCache(BoundedCache):
+    """
+    Bounded cache that evicts a uniformly random key instead of the least
+    recently used one. Entries sit in a slot array instead of the recency
+    list, so a hit never relinks anything and an eviction is a swap with
+    the last slot.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = None,
+                 function: callable = hash_builtin, clock: callable = time.monotonic,
+                 map_class=hash_map_sc.HashMap, seed: int = None) -> None:
+        """
+        Initialize an empty cache, seed fixes the sequence of victims
+        """
+        super().__init__(max_entries, ttl, function, clock, map_class)
+        self._slots = DynamicArray()
+        self._random = random.Random(seed)
+
+    def _unlink(self, entry: CacheEntry) -> None:
+        """Takes the entry out of the slot array, the last entry fills its slot"""
+        last = self._slots.pop()
+        if last is not entry:
+            self._slots.set_at_index(entry.slot, last)
+            last.slot = entry.slot
+        entry.slot = None
+
+    def _link(self, entry: CacheEntry) -> None:
+        """Appends the entry to the slot array"""
+        entry.slot = self._slots.length()
+        self._slots.append(entry)
+
+    def _touch(self, entry: CacheEntry) -> None:
+        """Hits do not change which entry is evicted"""
+        pass
+
+    def _victim(self) -> CacheEntry:
+        """Returns the entry evicted to make room, a random one"""
+        return self._slots[self._random.randrange(self._slots.length())]
+
+    def _reset_links(self) -> None:
+        """Forgets every entry after the map was cleared"""
+        self._slots = DynamicArray()
+
+    def _entries(self):
+        """Yields the entries in no particular order"""
+        # walked backwards so dropping the current entry only moves a visited one into its slot
+        for num in range(self._slots.length() - 1, -1, -1):
+            if num < self._slots.length():
+                yield self._slots[num]
+
+
+# eviction policies a memoized function can be given
+POLICIES = {
+    'lru': BoundedCache,
+    'random': RandomEvictionCache,
+}
+
+# marks a lookup that found nothing, since None is a valid cached result
+_MISSING = object()
+
+
+# separates positional from keyword arguments in a call key
+_KWARGS_MARK = object()
+
+
+def make_key(args: tuple, kwargs: dict) -> tuple:
+    """
+    Builds the key of a call from its arguments, which must be hashable.
+    Keyword arguments follow a marker in call order, like functools.lru_cache,
+    so f(1, b=2) and f(1, 2) are cached apart. Arguments that compare equal
+    share a result, so f(1), f(1.0) and f(True) are one call
+
+    param: positional and keyword arguments of the call
+
+    return: tuple key
+    """
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+    return args
+
+
+def memoize(max_entries: int = 128, policy: str = 'lru', map_class=hash_map_sc.HashMap,
+            function: callable = hash_builtin, ttl: float = None, thread_safe: bool = False,
+            key: callable = make_key):
+    """
+    Decorator caching the results of a function in a bounded cache. Arguments
+    are turned into a tuple key by key, so like functools.lru_cache they must
+    be hashable, and calling with a list raises TypeError. The tuple is
+    hashed by function, which has to accept any hashable key, as hash_builtin
+    does. The decorated function gets cache_info() and cache_clear(). Can be
+    applied bare, @memoize, or called, @memoize(...)
+
+    param: maximum number of cached results, eviction policy ('lru' or
+           'random'), HashMap class and hash function the results are stored
+           with, seconds a result lives (forever when None), whether calls from
+           several threads may share the cache, and the key function
+
+    return: decorator
+    """
+    # used bare, the function arrives in place of max_entries
+    if callable(max_entries):
+        return memoize()(max_entries)
+
+    if policy not in POLICIES:
+        raise ValueError(f"unknown eviction policy {policy!r}, expected one of {sorted(POLICIES)}")
+
+    def decorator(func):
+        cache = POLICIES[policy](max_entries, ttl, function, map_class=map_class)
+
+        # the lock only guards the cache, the function itself runs outside it,
+        # so two threads missing on the same key may both compute it
+        lock = threading.Lock() if thread_safe else nullcontext()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            call_key = key(args, kwargs)
+            with lock:
+                result = cache.get(call_key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                with lock:
+                    cache.put(call_key, result)
+            return result
+
+        def cache_info() -> dict:
+            """
+            Returns hits, misses, hit rate, size and the table_load of the map
+
+            param: None
+
+            return: dict of statistics
+            """
+            with lock:
+                info = cache.stats()
+            info['policy'] = policy
+            return info
+
+        def cache_clear() -> None:
+            """
+            Drops every cached result and zeroes the counters
+
+            param: None
+
+            return: None
+            """
+            with lock:
+                cache.clear()
+                cache.reset_stats()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nBounded cache - LRU eviction")
+    print("----------------------------")
+    cache = BoundedCache(3)
+    for i in range(3):
+        cache.put('key' + str(i), i)
+    cache.get('key0')
+    cache.put('key3', 3)
+    print(list(cache.keys()))
+    print(cache.get('key1'), cache.get('key0'))
+    print(cache.stats())
+
+    print("\nBounded cache - TTL")
+    print("-------------------")
+    now = [0.0]
+    cache = BoundedCache(10, ttl=5, clock=lambda: now[0])
+    cache.put('short', 1, ttl=1)
+    cache.put('long', 2)
+    now[0] = 2.0
+    print(cache.get('short'), cache.get('long'), cache.get_size())
+    now[0] = 6.0
+    print(cache.contains_key('long'), cache.get_size())
+    print(cache.stats())
+
+    print("\nMemoize - LRU over open addressing")
+    print("----------------------------------")
+    import hash_map_oa
+
+    @memoize(max_entries=16, map_class=hash_map_oa.HashMap)
+    def fib(n: int) -> int:
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(80))
+    print(fib.cache_info())
+
+    print("\nMemoize - random eviction, thread safe")
+    print("--------------------------------------")
+
+    @memoize(max_entries=4, policy='random', thread_safe=True)
+    def square(n: int) -> int:
+        return n * n
+
+    for i in list(range(8)) * 2:
+        square(i)
+    info = square.cache_info()
+    print(info['size'], info['hits'] + info['misses'], info['policy'])
@@ -0,0 +1,96 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: String hash functions for use with both HashMaps (SC & OA).
+#              Every function takes a str key and returns a non-negative int,
+#              so each one can be passed as the function argument of HashMap.
+
+import struct
+
+
+MASK_64 = (1 << 64) - 1
+
+FNV_OFFSET_BASIS = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+
+# 64-bit primes from xxHash
+PRIME_1 = 0x9E3779B185EBCA87
+PRIME_2 = 0xC2B2AE3D27D4EB4F
+PRIME_3 = 0x165667B19E3779F9
+PRIME_5 = 0x27D4EB2F165667C5
+
+_unpack_words = struct.unpack_from
+
+
+def mix64(hash: int) -> int:
+    """Scramble all 64 bits of a hash so every input bit affects the low bits"""
+    hash &= MASK_64
+    hash ^= hash >> 33
+    hash = (hash * PRIME_2) & MASK_64
+    hash ^= hash >> 29
+    hash = (hash * PRIME_3) & MASK_64
+    hash ^= hash >> 32
+    return hash
+
+
+def mix_low_bits(hash: int) -> int:
+    """
+    Cheap finalizer for power-of-two tables: the high half is folded into the
+    low half and one multiply spreads it upward, so the low bits kept by a
+    mask depend on every bit of the original hash
+    """
+    hash &= MASK_64
+    hash ^= hash >> 32
+    return ((hash * PRIME_1) & MASK_64) >> 32
+
+
+def hash_fnv1a(key: str) -> int:
+    """64-bit FNV-1a over the UTF-8 bytes of the key"""
+    hash = FNV_OFFSET_BASIS
+    for byte in key.encode():
+        hash = ((hash ^ byte) * FNV_PRIME) & MASK_64
+    return hash
+
+
+def make_hash_mix(seed: int = 0):
+    """
+    Builds an xxHash style hash function with its own seed.
+    The key is consumed eight bytes at a time, so long keys take far fewer
+    Python steps than the per character loops of hash_function_1/2.
+    """
+    seed &= MASK_64
+
+    def hash_mix(key: str) -> int:
+        data = key.encode()
+        length = len(data)
+        hash = (seed + PRIME_5 + length) & MASK_64
+
+        # full 8 byte words are unpacked in one call, then multiplied and rotated in
+        words = length >> 3
+        for word in _unpack_words('<%dQ' % words, data):
+            hash = ((hash ^ word) * PRIME_1) & MASK_64
+            hash = ((hash << 31) | (hash >> 33)) & MASK_64
+
+        # remaining tail bytes form one last partial word
+        if length & 7:
+            hash = ((hash ^ int.from_bytes(data[words << 3:], 'little')) * PRIME_1) & MASK_64
+
+        return mix64(hash)
+
+    # named like a module level function so the default instance can be pickled
+    hash_mix.__name__ = hash_mix.__qualname__ = 'hash_mix' if seed == 0 else f"hash_mix_{seed}"
+    return hash_mix
+
+
+hash_mix = make_hash_mix()
+
+
+def hash_builtin(key: str) -> int:
+    """
+    Python's builtin str hash as a non-negative 64-bit int.
+    Fastest option, but it is randomized per interpreter unless PYTHONHASHSEED
+    is set, so its values must never be stored outside the process.
+    """
+    return hash(key) & MASK_64
@@ -0,0 +1,420 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Open Addressing with compact array storage
+
+
+from array import array
+
+from a6_include import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from hash_functions import MASK_64
+from hash_map_oa import HashMap as ObjectHashMap
+
+
+# slot states kept in the bytearray
+EMPTY = 0
+FULL = 1
+TOMBSTONE = 2
+
+
+class HashMap(ObjectHashMap):
+    """
+    Open addressing HashMap with the same quadratic probing and public API as
+    hash_map_oa.HashMap, but without a HashEntry object per bucket.
+    Keys, values, cached hashes and a one byte slot state live in four
+    parallel flat arrays, so a slot costs a few machine words instead of a
+    whole Python object.
+    """
+
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new HashMap that uses
+        quadratic probing over parallel arrays
+        """
+        # prime capacities only, and the arrays are always rebuilt in one pass,
+        # so resizing is never incremental
+        super().__init__(capacity, function)
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            out += str(i) + ': ' + str(self._entry_at(i)) + '\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Creates empty parallel arrays for the given capacity
+
+        param: capacity
+
+        return: None
+        """
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+        self._hashes = array('Q', bytes(8 * capacity))
+        self._states = bytearray(capacity)
+
+    def _entry_at(self, index: int) -> HashEntry:
+        """
+        Builds a HashEntry view of a slot
+
+        param: slot index
+
+        return: HashEntry, or None if the slot is empty
+        """
+        state = self._states[index]
+        if state == EMPTY:
+            return None
+
+        entry = HashEntry(self._keys[index], self._values[index], self._hashes[index])
+        entry.is_tombstone = state == TOMBSTONE
+        return entry
+
+    # ------------------------------------------------------------------ #
+
+    def _insert(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Probes the current slots and stores the key without checking the load
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+
+        hash_value &= MASK_64
+        states, hashes, keys = self._states, self._hashes, self._keys
+
+        # counter variable for quad probe formula and first reusable tombstone on the probe path
+        j_counter = 0
+        tombstone_index = -1
+
+        while True:
+            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            state = states[q_probe]
+
+            # key is not in the map, so store it in the first tombstone seen or this empty slot
+            if state == EMPTY:
+                if tombstone_index != -1:
+                    q_probe = tombstone_index
+                    self._tombstones -= 1
+                states[q_probe] = FULL
+                hashes[q_probe] = hash_value
+                keys[q_probe] = key
+                self._values[q_probe] = value
+                self._size += 1
+                self._version += 1
+
+                # a new key whose home slot was already taken is a collision
+                if self._stats is not None and j_counter > 0:
+                    self._stats.bucket_collisions += 1
+                return
+
+            if state == TOMBSTONE:
+                if tombstone_index == -1:
+                    tombstone_index = q_probe
+
+            # replaces with new value if keys match, comparing cached hashes before keys
+            elif hashes[q_probe] == hash_value and keys[q_probe] == key:
+                self._values[q_probe] = value
+                return
+
+            j_counter += 1
+
+    def _find_index(self, key: str) -> int:
+        """
+        Returns the slot index holding the key
+
+        param: key
+
+        return: index of the slot, or -1 if key is not in the hash map
+        """
+
+        hash_value = self._hash_function(key) & MASK_64
+        states, hashes, keys = self._states, self._hashes, self._keys
+        j_counter = 0
+
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(hash_value):
+            return -1
+
+        while True:
+            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            state = states[q_probe]
+
+            # an empty slot ends the probe sequence
+            if state == EMPTY:
+                if self._stats is not None:
+                    self._stats.record_probe(False, j_counter + 1)
+                if bloom is not None:
+                    bloom.false_positives += 1
+                return -1
+
+            # tombstones are skipped, live keys are compared once their cached hash matches
+            if state == FULL and hashes[q_probe] == hash_value and keys[q_probe] == key:
+                if self._stats is not None:
+                    self._stats.record_probe(True, j_counter + 1)
+                return q_probe
+
+            j_counter += 1
+
+    def _find_node(self, key: str, hash_value: int) -> HashEntry:
+        """
+        Returns a view of the slot holding the key, the view is a copy so
+        assigning to its value does not change the map
+
+        param: key and hash of the key (the slot arrays keep their own masked hash)
+
+        return: HashEntry, or None if the key is not in the hash map
+        """
+
+        index = self._find_index(key)
+        if index == -1:
+            return None
+        return self._entry_at(index)
+
+    def empty_buckets(self) -> int:
+        """
+        Method returns number of empty buckets in hash table
+
+        param: None
+
+        return: int of tallied empty buckets
+        """
+
+        return self._states.count(EMPTY)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the internal hash table
+
+        param: new capacity
+
+        return: None
+        """
+
+        if new_capacity < self.get_size():
+            return
+
+        stats = self._stats
+        if stats is not None:
+            stats.resizes += 1
+            stats.start_rehash()
+
+        old_keys, old_values = self._keys, self._values
+        old_hashes, old_states = self._hashes, self._states
+
+        self._capacity = self._next_prime(new_capacity)
+        self._allocate(self._capacity)
+        self._size = 0
+        self._tombstones = 0
+        self._version += 1
+
+        if self._bloom is not None:
+            self._bloom.reset(self._capacity)
+
+        # fill new slots with the live old slots, reusing the cached hashes
+        for num in range(len(old_states)):
+            if old_states[num] == FULL:
+                self._put(old_keys[num], old_values[num], old_hashes[num])
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def purge_tombstones(self) -> None:
+        """
+        Rehashes the live entries in place at the current capacity, dropping all tombstones
+
+        param: None
+
+        return: None
+        """
+
+        stats = self._stats
+        if stats is not None:
+            stats.purges += 1
+            stats.start_rehash()
+
+        live = DynamicArray()
+        for num in range(self._capacity):
+            if self._states[num] == FULL:
+                live.append((self._keys[num], self._values[num], self._hashes[num]))
+
+        # wipe the existing arrays without reallocating them
+        self._states[:] = bytes(self._capacity)
+        for num in range(self._capacity):
+            self._keys[num] = None
+            self._values[num] = None
+
+        self._size = 0
+        self._tombstones = 0
+        self._version += 1
+        for num in range(live.length()):
+            key, value, hash_value = live[num]
+            self._insert(key, value, hash_value)
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def get(self, key: str) -> object:
+        """
+        Returns value associated with the key
+
+        param: key
+
+        return: value of the key
+        """
+
+        index = self._find_index(key)
+        if index == -1:
+            return None
+        return self._values[index]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if key is in the hash and false otherwise
+
+        param: key
+
+        return: bool
+        """
+
+        return self._find_index(key) != -1
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of buckets a lookup of the key inspects
+
+        param: key
+
+        return: int of inspected buckets
+        """
+
+        hash_value = self._hash_function(key) & MASK_64
+        j_counter = 0
+
+        while True:
+            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            state = self._states[q_probe]
+            if state == EMPTY or (state == FULL and self._hashes[q_probe] == hash_value and
+                                  self._keys[q_probe] == key):
+                return j_counter + 1
+
+            j_counter += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map
+
+        param: key
+
+        return: None
+        """
+
+        index = self._find_index(key)
+        if index == -1:
+            return
+
+        # probes only read the state byte, so the key and value are released right away
+        self._states[index] = TOMBSTONE
+        self._keys[index] = None
+        self._values[index] = None
+        self._size -= 1
+        self._tombstones += 1
+        self._version += 1
+        if self._bloom is not None:
+            self._bloom.remove(self._hashes[index])
+        self._shrink_if_sparse()
+
+    def _live_indices(self):
+        """
+        Generator over the indices of the full slots, each call keeps its own position
+
+        param: None
+
+        return: generator of slot indices
+        """
+        version = self._version
+        states = self._states
+
+        for num in range(len(states)):
+            if states[num] == FULL:
+                yield num
+                if self._version != version:
+                    raise RuntimeError('HashMap changed size during iteration')
+
+    def _live_entries(self):
+        """
+        Generator over HashEntry views of the full slots
+
+        param: None
+
+        return: generator of HashEntry
+        """
+        for num in self._live_indices():
+            yield self._entry_at(num)
+
+    def keys(self):
+        """
+        Iterates over the keys without copying them
+
+        param: None
+
+        return: generator of keys
+        """
+        keys = self._keys
+        for num in self._live_indices():
+            yield keys[num]
+
+    def values(self):
+        """
+        Iterates over the values without copying them
+
+        param: None
+
+        return: generator of values
+        """
+        values = self._values
+        for num in self._live_indices():
+            yield values[num]
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples without copying the table
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        keys, values = self._keys, self._values
+        for num in self._live_indices():
+            yield keys[num], values[num]
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nCompact - put and get")
+    print("---------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    print(all(m.get('str' + str(i)) == i * 100 for i in range(150)))
+
+    print("\nCompact - remove and iterate")
+    print("----------------------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    print(m)
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
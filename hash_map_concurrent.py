@@ -0,0 +1,450 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Chaining with lock striping for threads
+
+
+from contextlib import contextmanager
+import threading
+
+from a6_include import DynamicArray, LinkedList, hash_function_1, hash_function_2
+from bloom import CountingBloomFilter
+from map_stats import hash_collisions
+from hash_map_sc import HashMap as ChainingHashMap
+from snapshot import dump_entries
+from sorted_bucket import SortedBucket
+
+
+class HashMap(ChainingHashMap):
+    """
+    Separate chaining HashMap that can be shared between threads.
+    Buckets are split into stripes, bucket i belongs to stripe i % stripes,
+    and every stripe has its own lock, so operations on buckets of different
+    stripes run in parallel. A resize takes every stripe lock, in order,
+    before it swaps in the new buckets. The Bloom filter's counters are
+    shared by every stripe, so they are only changed under a lock of their own.
+    """
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 stripes: int = 16,
+                 power_of_two: bool = False) -> None:
+        """
+        Initialize new HashMap that uses separate chaining
+        with one lock per stripe of buckets
+        """
+        # every stripe lock is taken for the whole resize, so it is never incremental
+        super().__init__(capacity, function, power_of_two=power_of_two)
+
+        self._locks = [threading.Lock() for _ in range(max(stripes, 1))]
+
+        # each stripe counts its own keys, so writers never share a counter
+        self._counts = [0] * len(self._locks)
+
+        # taken inside a stripe lock by writers adding or removing filter counters,
+        # and by readers counting a false positive
+        self._bloom_lock = threading.Lock()
+
+    @contextmanager
+    def _all_stripes(self):
+        """
+        Holds every stripe lock, taken in index order so two resizes cannot deadlock
+
+        param: None
+
+        return: context manager
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            # nothing can change while every lock is held, so the shared size is exact
+            self._size = sum(self._counts)
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _lock_bucket(self, h_value: int) -> (DynamicArray, int, int):
+        """
+        Locks the stripe that owns the bucket of the hash
+
+        param: hash of the key
+
+        return: buckets, bucket index and stripe index, with the stripe lock held
+        """
+        while True:
+            buckets = self._buckets
+            h_index = self._bucket_index(h_value, buckets.length())
+            stripe = h_index % len(self._locks)
+            self._locks[stripe].acquire()
+
+            # a resize may have swapped the buckets before the lock was taken
+            if buckets is self._buckets:
+                return buckets, h_index, stripe
+            self._locks[stripe].release()
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+
+        param: None
+
+        return: int of keys across every stripe
+        """
+        return sum(self._counts)
+
+    def table_load(self) -> float:
+        """
+        Returns current load factor of hash table
+
+        param: None
+
+        return: float indicating load factor
+        """
+        return self.get_size() / self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _put(self, key: str, value: object, h_value: int) -> None:
+        """
+        Updates key/value pair in the hash map using an already computed hash
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+
+        buckets, h_index, stripe = self._lock_bucket(h_value)
+        try:
+            hash_linked_list = buckets[h_index]
+            node = hash_linked_list.contains(key, h_value)
+
+            # an existing key is updated in place, so its chain is never relinked
+            if node is not None:
+                node.value = value
+                return
+
+            hash_linked_list.insert(key, value, h_value)
+            if type(hash_linked_list) is SortedBucket or hash_linked_list.length() > self.treeify_threshold:
+                self._fit_bucket(buckets, h_index)
+            self._counts[stripe] += 1
+            if self._bloom is not None:
+                with self._bloom_lock:
+                    self._bloom.add(h_value)
+            capacity = buckets.length()
+        finally:
+            self._locks[stripe].release()
+
+        # resizes once the load reaches 1, outside the stripe lock
+        if self.get_size() >= capacity:
+            self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Doubles the capacity unless another thread already resized the table
+
+        param: capacity that was full
+
+        return: None
+        """
+
+        with self._all_stripes():
+            if self._capacity == capacity and self._size >= capacity:
+                self._rebuild(capacity * 2)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes capacity of the internal hash table
+
+        param: new capacity
+
+        return: None
+        """
+
+        # if new capacity is less than one, do nothing
+        if new_capacity < 1:
+            return
+
+        with self._all_stripes():
+            self._rebuild(new_capacity)
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """
+        Moves every node into new buckets, the caller holds every stripe lock
+
+        param: new capacity
+
+        return: None
+        """
+
+        stats = self._stats
+        if stats is not None:
+            stats.resizes += 1
+            stats.start_rehash()
+
+        # never below the keys it holds, so the load stays under 1 like puts leave it,
+        # and if new capacity is not prime, make it the next prime (or power of two)
+        capacity = self._next_capacity(max(new_capacity, self._size + 1))
+        buckets = DynamicArray()
+        for num in range(capacity):
+            buckets.append(LinkedList())
+
+        # stripes own different buckets after the resize, so the counts are redone
+        counts = [0] * len(self._locks)
+        for indices in range(self._buckets.length()):
+            for node in self._buckets[indices]:
+                h_index = self._bucket_index(node.hash_value, capacity)
+                bucket = buckets[h_index]
+                bucket.insert(node.key, node.value, node.hash_value)
+                if bucket.length() > self.treeify_threshold or type(bucket) is SortedBucket:
+                    self._fit_bucket(buckets, h_index)
+                counts[h_index % len(counts)] += 1
+
+        self._counts = counts
+        self._capacity = capacity
+        self._version += 1
+
+        # no writer runs while every stripe is locked, so the filter is refilled without its lock
+        if self._bloom is not None:
+            self._bloom.reset(capacity)
+            for indices in range(buckets.length()):
+                for node in buckets[indices]:
+                    self._bloom.add(node.hash_value)
+
+        # swapped in last, a thread waiting on an old stripe lock sees it and retries
+        self._buckets = buckets
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def get(self, key: str):
+        """
+        Returns the value associated with the given key
+
+        param: key
+
+        return: value of key, or None if the key is not in the hash map
+        """
+
+        h_value = self._hash_function(key)
+        buckets, h_index, stripe = self._lock_bucket(h_value)
+        try:
+            node = self._find_in(buckets, h_index, key, h_value)
+        finally:
+            self._locks[stripe].release()
+
+        if node is not None:
+            return node.value
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if the key is in the hash map
+
+        param: key
+
+        return: bool
+        """
+
+        h_value = self._hash_function(key)
+        buckets, h_index, stripe = self._lock_bucket(h_value)
+        try:
+            return self._find_in(buckets, h_index, key, h_value) is not None
+        finally:
+            self._locks[stripe].release()
+
+    def _find_in(self, buckets: DynamicArray, h_index: int, key: str, h_value: int):
+        """
+        Returns the node holding the key, the caller holds the bucket's stripe lock
+
+        param: buckets, bucket index, key and hash of the key
+
+        return: SLNode, or None if the key is not in the hash map
+        """
+
+        # every counter of a key in the map stays set while its stripe is locked,
+        # so reading the filter without its lock never misses a stored key
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(h_value):
+            return None
+
+        node = buckets[h_index].contains(key, h_value)
+        if node is None and bloom is not None:
+            with self._bloom_lock:
+                bloom.false_positives += 1
+        return node
+
+    def remove(self, key: str) -> None:
+        """
+        Removes key from the hash map
+
+        param: key
+
+        return: None
+        """
+
+        h_value = self._hash_function(key)
+        buckets, h_index, stripe = self._lock_bucket(h_value)
+        try:
+            removed = buckets[h_index].remove(key, h_value)
+            if removed:
+                if type(buckets[h_index]) is SortedBucket:
+                    self._fit_bucket(buckets, h_index)
+                self._counts[stripe] -= 1
+                self._version += 1
+                if self._bloom is not None:
+                    with self._bloom_lock:
+                        self._bloom.remove(h_value)
+        finally:
+            self._locks[stripe].release()
+
+        # shrinks outside the stripe lock, like growing
+        if removed:
+            self._shrink_if_sparse()
+
+    def _reserve(self, count: int) -> None:
+        """
+        Resizes once so count more keys fit without put triggering a resize
+
+        param: number of keys about to be added
+
+        return: None
+        """
+
+        size = self.get_size()
+        if size + count > self._capacity:
+            self.resize_table(size + count)
+
+    def clear(self, reset_capacity: bool = False) -> None:
+        """
+        Clear hash map contents
+
+        param: whether the table goes back to the capacity it was created with
+
+        return: None
+        """
+
+        with self._all_stripes():
+            if reset_capacity:
+                self._capacity = self._initial_capacity
+            buckets = DynamicArray()
+            for num in range(self._capacity):
+                buckets.append(LinkedList())
+            self._counts = [0] * len(self._locks)
+            self._version += 1
+            self._buckets = buckets
+            if self._bloom is not None:
+                self._bloom.reset(self._capacity)
+
+    def empty_buckets(self) -> int:
+        """
+        Method returns the number of empty buckets
+
+        param: None
+
+        return: int representing number of empty buckets
+        """
+
+        with self._all_stripes():
+            return super().empty_buckets()
+
+    def stats(self, collisions: bool = False) -> dict:
+        """
+        Returns a consistent snapshot of the table's shape and counters
+
+        param: whether keys sharing a full hash are counted, which reads every node
+
+        return: dict of statistics
+        """
+
+        with self._all_stripes():
+            out = super().stats()
+            if collisions:
+                hashes = []
+                for indices in range(self._buckets.length()):
+                    for node in self._buckets[indices]:
+                        hashes.append(node.hash_value)
+                out['hash_collisions'] = hash_collisions(hashes)
+        out['stripes'] = len(self._locks)
+        return out
+
+    def enable_bloom(self, bits_per_key: int = 10) -> None:
+        """
+        Starts keeping a counting Bloom filter of the keys, filled while every stripe is locked
+
+        param: counters per key, each one byte, the filter is resized along with the table
+
+        return: None
+        """
+
+        with self._all_stripes():
+            if self._bloom is None:
+                bloom = CountingBloomFilter(self._capacity, bits_per_key)
+                for indices in range(self._buckets.length()):
+                    for node in self._buckets[indices]:
+                        bloom.add(node.hash_value)
+                self._bloom = bloom
+
+    def dump(self, fileobj, include_hashes: bool = True) -> None:
+        """
+        Writes a binary snapshot of the nodes present while every stripe was locked
+
+        param: binary file object and whether the cached hashes are written
+
+        return: None
+        """
+        nodes = list(self._live_nodes())
+        dump_entries(fileobj, nodes, len(nodes), self._capacity, self._hash_function,
+                     include_hashes, self._power_of_two)
+
+    def _live_nodes(self):
+        """
+        Generator over a snapshot of the nodes taken while every stripe is locked,
+        so other threads may keep writing while the caller iterates
+
+        param: None
+
+        return: generator of SLNode
+        """
+        nodes = []
+        with self._all_stripes():
+            for indices in range(self._buckets.length()):
+                for node in self._buckets[indices]:
+                    nodes.append(node)
+
+        yield from nodes
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nConcurrent - put and get")
+    print("------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    print(all(m.get('str' + str(i)) == i * 100 for i in range(150)))
+
+    print("\nConcurrent - writers on separate keys")
+    print("-------------------------------------")
+    m = HashMap(11, hash_function_2, stripes=8)
+
+    def writer(first: int) -> None:
+        for i in range(first, first + 2000):
+            m.put('key' + str(i), i)
+        for i in range(first, first + 2000, 2):
+            m.remove('key' + str(i))
+
+    threads = [threading.Thread(target=writer, args=(n * 2000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(m.get_size(), m.get_capacity(),
+          all(m.get('key' + str(i)) == (i if i % 2 else None) for i in range(8000)))
@@ -0,0 +1,574 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Bucketized cuckoo hashing with a stash
+
+
+import random
+
+from a6_include import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from hash_functions import make_hash_mix
+from primes import next_prime
+
+
+# seed of the default second hash function, any fixed value keeps runs reproducible
+SECOND_HASH_SEED = 0x5bd1e995
+
+
+class CuckooEntry(HashEntry):
+
+    def __init__(self, key: str, value: object, hash_value: int, hash_value_2: int) -> None:
+        """Initialize an entry that caches the hashes of both of its buckets."""
+        super().__init__(key, value, hash_value)
+        self.hash_value_2 = hash_value_2
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return f"K: {self.key} V: {self.value}"
+
+
+class HashMap:
+    """
+    Cuckoo HashMap with buckets of several slots. A key can only live in its
+    bucket under the first hash function, its bucket under the second one, or
+    a small stash, so get, contains_key and remove look at no more than
+    2 * slots + stash_size entries however full the table is. Put makes room
+    by moving entries to their other bucket, and the table grows when an entry
+    finds no slot and the stash is full.
+    """
+
+    # put grows the table before the load passes this, 4 slot buckets fill well past .9
+    max_load = .9
+
+    # entries one put may move before the entry left over goes to the stash
+    max_kicks = 100
+
+    # doublings one rebuild tries before it re-seeds the second function or gives up
+    max_rebuilds = 4
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 function_2: callable = None,
+                 slots: int = 4,
+                 stash_size: int = 4,
+                 seed: int = 0) -> None:
+        """
+        Initialize new HashMap that uses bucketized cuckoo hashing,
+        function_2 defaults to a seeded hash_mix and seed fixes which
+        entries put moves
+        """
+        if slots < 1 or stash_size < 0:
+            raise ValueError("slots must be at least 1 and stash_size at least 0")
+
+        # only the default second function is re-seeded when keys collide under both
+        self._second_seed = None
+        if function_2 is None:
+            self._second_seed = SECOND_HASH_SEED
+            function_2 = make_hash_mix(SECOND_HASH_SEED)
+
+        # keys that collide under one function have to be told apart by the other
+        if function_2 is function:
+            raise ValueError("cuckoo hashing needs two different hash functions")
+
+        self._hash_function = function
+        self._hash_function_2 = function_2
+        self._slots = slots
+        self._stash_size = stash_size
+        self._random = random.Random(seed)
+        self._allocate(capacity)
+        self._size = 0
+
+        # bumped on every structural change so running iterators can detect it
+        self._version = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(len(self._buckets)):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        for i in range(len(self._stash)):
+            out += 'stash ' + str(i) + ': ' + str(self._stash[i]) + '\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Creates empty slots for at least capacity entries and an empty stash
+
+        param: capacity
+
+        return: None
+        """
+        # a prime number of buckets, each made of self._slots consecutive slots
+        self._bucket_count = next_prime(max(1, -(-capacity // self._slots)))
+        self._capacity = self._bucket_count * self._slots
+
+        # plain lists like hash_map_compact, a put reads up to 2 * slots entries per move
+        self._buckets = [None] * self._capacity
+        self._stash = []
+
+    def get_size(self) -> int:
+        """Return size of map"""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return number of slots in the table, the stash is not counted"""
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find_index(self, key: str, hash_value: int, hash_value_2: int = None) -> int:
+        """
+        Looks for the key in its two buckets and then in the stash
+
+        param: key, its hash under the first function and, when already
+               computed, its hash under the second one
+
+        return: slot index, capacity + i for position i of the stash,
+                or -1 if the key is not in the hash map
+        """
+        buckets, slots = self._buckets, self._slots
+
+        start = (hash_value % self._bucket_count) * slots
+        for index in range(start, start + slots):
+            entry = buckets[index]
+            if entry is not None and entry.hash_value == hash_value and entry.key == key:
+                return index
+
+        # the second hash is only computed when the first bucket does not hold the key
+        if hash_value_2 is None:
+            hash_value_2 = self._hash_function_2(key)
+        start = (hash_value_2 % self._bucket_count) * slots
+        for index in range(start, start + slots):
+            entry = buckets[index]
+            if entry is not None and entry.hash_value_2 == hash_value_2 and entry.key == key:
+                return index
+
+        stash = self._stash
+        for num in range(len(stash)):
+            entry = stash[num]
+            if entry.hash_value == hash_value and entry.key == key:
+                return self._capacity + num
+        return -1
+
+    def _entry_at(self, index: int) -> CuckooEntry:
+        """Return the entry at an index from _find_index"""
+        if index >= self._capacity:
+            return self._stash[index - self._capacity]
+        return self._buckets[index]
+
+    def _place(self, entry: CuckooEntry) -> CuckooEntry:
+        """
+        Stores the entry in a free slot of one of its buckets, moving the
+        entries in its way to their other bucket when both are full
+
+        param: entry that is not in the table
+
+        return: None once every entry has a slot, otherwise the entry itself with
+                every move undone, so a failed place leaves the table as it was
+        """
+        buckets, slots, count = self._buckets, self._slots, self._bucket_count
+        rng = self._random
+        moves = []
+
+        for _ in range(self.max_kicks + 1):
+            first = (entry.hash_value % count) * slots
+            second = (entry.hash_value_2 % count) * slots
+            for start in (first, second):
+                for index in range(start, start + slots):
+                    if buckets[index] is None:
+                        buckets[index] = entry
+                        return None
+
+            # both buckets are full, so a random entry of either one makes room
+            index = rng.choice((first, second)) + rng.randrange(slots)
+            victim = buckets[index]
+            buckets[index] = entry
+            entry = victim
+            moves.append(index)
+
+        for index in reversed(moves):
+            buckets[index], entry = entry, buckets[index]
+        return entry
+
+    def _insert(self, entry: CuckooEntry) -> None:
+        """
+        Stores an entry whose key is not in the map, in the stash when the
+        table has no slot for it and growing when the stash is full as well
+
+        param: entry
+
+        return: None
+        """
+        homeless = self._place(entry)
+        if homeless is None:
+            return
+
+        if len(self._stash) < self._stash_size:
+            self._stash.append(homeless)
+        else:
+            self._rebuild(self._capacity * 2, homeless)
+
+    def _rebuild(self, new_capacity: int, extra: CuckooEntry = None) -> None:
+        """
+        Moves every entry, and extra when given, into a table of the new
+        capacity, doubling it again while some entry does not fit. Keys that
+        collide under both functions never fit however large the table gets,
+        so after max_rebuilds tries the default second function is re-seeded,
+        and a table that still does not fit is left as it was
+
+        param: new capacity and an entry that is in neither the table nor the stash
+
+        return: None
+        """
+        entries = DynamicArray()
+        for entry in self._live_entries():
+            entries.append(entry)
+        if extra is not None:
+            entries.append(extra)
+
+        buckets, stash, bucket_count = self._buckets, self._stash, self._bucket_count
+        function_2 = self._hash_function_2
+
+        capacity = new_capacity
+        for attempt in range(2 * self.max_rebuilds):
+            if attempt == self.max_rebuilds:
+                # a second function passed in by the caller is never replaced
+                if self._second_seed is None:
+                    break
+                self._second_seed = self._random.getrandbits(32)
+                self._set_function_2(make_hash_mix(self._second_seed), entries)
+                capacity = new_capacity
+
+            self._allocate(capacity)
+            if self._fill(entries):
+                self._version += 1
+                return
+            capacity = self._capacity * 2
+
+        # puts the old table back, so the map is unchanged and extra is not added
+        if self._hash_function_2 is not function_2:
+            self._set_function_2(function_2, entries)
+        self._buckets, self._stash, self._bucket_count = buckets, stash, bucket_count
+        self._capacity = bucket_count * self._slots
+        raise RuntimeError('cuckoo HashMap cannot place keys that collide under both hash functions')
+
+    def _fill(self, entries: DynamicArray) -> bool:
+        """
+        Places the entries into the empty table, cached hashes are reused so no key is hashed again
+
+        param: da of entries
+
+        return: True if every entry found a slot or stash position, False otherwise
+        """
+        for num in range(entries.length()):
+            homeless = self._place(entries[num])
+            if homeless is None:
+                continue
+            if len(self._stash) == self._stash_size:
+                return False
+            self._stash.append(homeless)
+        return True
+
+    def _set_function_2(self, function_2: callable, entries: DynamicArray) -> None:
+        """
+        Switches the second hash function and rehashes the entries with it
+
+        param: new second hash function and da of every entry
+
+        return: None
+        """
+        self._hash_function_2 = function_2
+        for num in range(entries.length()):
+            entries[num].hash_value_2 = function_2(entries[num].key)
+
+    def _unstash(self, index: int) -> None:
+        """
+        Moves a stashed entry into a slot that was just freed if the slot is in one of its buckets
+
+        param: index of the free slot
+
+        return: None
+        """
+        bucket = index // self._slots
+        stash = self._stash
+        for num in range(len(stash)):
+            entry = stash[num]
+            if entry.hash_value % self._bucket_count == bucket or \
+                    entry.hash_value_2 % self._bucket_count == bucket:
+                self._buckets[index] = entry
+                self._stash_remove(num)
+                return
+
+    def _stash_remove(self, num: int) -> None:
+        """Removes position num of the stash, the last stashed entry takes its place"""
+        last = self._stash.pop()
+        if num < len(self._stash):
+            self._stash[num] = last
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates key value pairs in the hash map
+
+        param: key and value
+
+        return: None
+        """
+        self._put(key, value, self._hash_function(key))
+
+    def _put(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Updates key value pairs in the hash map using an already computed hash
+
+        param: key, value and hash of the key under the first function
+
+        return: None
+        """
+        # a new key needs both hashes anyway, so the second one is computed up front
+        hash_value_2 = self._hash_function_2(key)
+        index = self._find_index(key, hash_value, hash_value_2)
+        if index != -1:
+            self._entry_at(index).value = value
+            return
+
+        # grows before the new key would take the load past max_load
+        if (self._size + 1) / self._capacity > self.max_load:
+            self._rebuild(self._capacity * 2)
+
+        self._insert(CuckooEntry(key, value, hash_value, hash_value_2))
+        self._size += 1
+        self._version += 1
+
+    def get(self, key: str) -> object:
+        """
+        Returns value associated with the key
+
+        param: key
+
+        return: value of the key, or None if the key is not in the hash map
+        """
+        index = self._find_index(key, self._hash_function(key))
+        if index == -1:
+            return None
+        return self._entry_at(index).value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if key is in the hash and false otherwise
+
+        param: key
+
+        return: bool
+        """
+        return self._find_index(key, self._hash_function(key)) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map
+
+        param: key
+
+        return: None
+        """
+        index = self._find_index(key, self._hash_function(key))
+        if index == -1:
+            return
+
+        # a key is only ever looked up in its own buckets, so no tombstone is needed
+        if index >= self._capacity:
+            self._stash_remove(index - self._capacity)
+        else:
+            self._buckets[index] = None
+            self._unstash(index)
+
+        self._size -= 1
+        self._version += 1
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of entries a lookup of the key inspects
+
+        param: key
+
+        return: int of inspected slots and stash positions
+        """
+        hash_value = self._hash_function(key)
+        index = self._find_index(key, hash_value)
+        first = (hash_value % self._bucket_count) * self._slots
+
+        if first <= index < first + self._slots:
+            return index - first + 1
+
+        second = (self._hash_function_2(key) % self._bucket_count) * self._slots
+        if second <= index < second + self._slots:
+            return self._slots + index - second + 1
+
+        if index >= self._capacity:
+            return 2 * self._slots + index - self._capacity + 1
+        return 2 * self._slots + len(self._stash)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the internal hash table
+
+        param: new capacity
+
+        return: None
+        """
+        if new_capacity < self.get_size():
+            return
+        self._rebuild(new_capacity)
+
+    def table_load(self) -> float:
+        """
+        Returns current load factor of hash table
+
+        param: None
+
+        return: float indicating load factor
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Method returns number of buckets with every slot empty
+
+        param: None
+
+        return: int of tallied empty buckets
+        """
+        count = 0
+        for start in range(0, self._capacity, self._slots):
+            empty = True
+            for index in range(start, start + self._slots):
+                if self._buckets[index] is not None:
+                    empty = False
+                    break
+            if empty:
+                count += 1
+        return count
+
+    def stash_size(self) -> int:
+        """Return number of entries waiting in the stash"""
+        return len(self._stash)
+
+    def clear(self) -> None:
+        """
+        Clears contents of the hash map
+
+        param: None
+
+        return: None
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+        self._version += 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns da with tuples containing key/value pairs
+
+        param: None
+
+        return: da
+        """
+        arr = DynamicArray()
+        for item in self.items():
+            arr.append(item)
+        return arr
+
+    def _live_entries(self):
+        """
+        Generator over the entries of the slots and then the stash,
+        each call keeps its own position
+
+        param: None
+
+        return: generator of CuckooEntry
+        """
+        version = self._version
+        for buckets in (self._buckets, self._stash):
+            for num in range(len(buckets)):
+                entry = buckets[num]
+                if entry is not None:
+                    yield entry
+                    if self._version != version:
+                        raise RuntimeError('HashMap changed size during iteration')
+
+    def keys(self):
+        """
+        Iterates over the keys
+
+        param: None
+
+        return: generator of keys
+        """
+        for entry in self._live_entries():
+            yield entry.key
+
+    def values(self):
+        """
+        Iterates over the values
+
+        param: None
+
+        return: generator of values
+        """
+        for entry in self._live_entries():
+            yield entry.value
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        for entry in self._live_entries():
+            yield entry.key, entry.value
+
+    def __iter__(self):
+        """
+        Method enables the hash map to iterate across itself,
+        every loop gets its own independent iterator
+
+        param: None
+
+        return: generator of CuckooEntry
+        """
+        return self._live_entries()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nCuckoo - put and get")
+    print("--------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    print(all(m.get('str' + str(i)) == i * 100 for i in range(150)))
+    print(max(m.probe_length('str' + str(i)) for i in range(150)),
+          max(m.probe_length('missing' + str(i)) for i in range(150)))
+
+    print("\nCuckoo - remove")
+    print("---------------")
+    m = HashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    m.remove('4')
+    print(m.get_keys_and_values())
+    print(m.contains_key('1'), m.contains_key('2'), m.get('5'))
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
@@ -0,0 +1,118 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Open Addressing in a memory-mapped file.
+#              The table is written once in the table_format layout, then every
+#              process start maps the file instead of calling put per key.
+
+
+import mmap
+import os
+
+from a6_include import hash_function_1
+from table_format import TableReader, build_image, source_pairs
+
+
+class HashMap(TableReader):
+    """
+    Read-only open addressing HashMap served straight from a mapped file.
+    Opening only reads the header, and each get or contains_key touches the
+    pages of the slots and records it probes, so a cold start costs page
+    faults for the keys actually used instead of a full rebuild.
+    """
+
+    def __init__(self, file, mapping: mmap.mmap) -> None:
+        """
+        Wraps an open mapping, use open instead of calling this
+        """
+        super().__init__(mapping)
+        self._file = file
+        self._mapping = mapping
+
+    @staticmethod
+    def write(path: str, source, function=None) -> None:
+        """
+        Writes every key/value pair of the source to a table file
+
+        param: file path, HashMap or dict with items() or an iterable of (key, value)
+               tuples, and the hash function (taken from a HashMap source when omitted)
+
+        return: None
+        """
+        image = build_image(*source_pairs(source, function))
+
+        # written next to the target and renamed, so readers never map a partial file
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as out:
+            out.write(image)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def open(cls, path: str) -> "HashMap":
+        """
+        Maps a table file read-only
+
+        param: file path
+
+        return: HashMap reading the mapped file
+        """
+        file = open(path, 'rb')
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            file.close()
+            raise
+
+        try:
+            return cls(file, mapping)
+        except BaseException:
+            mapping.close()
+            file.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Unmaps the file
+
+        param: None
+
+        return: None
+        """
+        if self._buffer is not None:
+            self._buffer = None
+            self._mapping.close()
+            self._file.close()
+
+    def __enter__(self) -> "HashMap":
+        """Use the map in a with block"""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Unmap when leaving the with block"""
+        self.close()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+    import tempfile
+    from hash_map_oa import HashMap as OpenAddressingHashMap
+
+    print("\nMapped - write an OA HashMap and open it")
+    print("----------------------------------------")
+    m = OpenAddressingHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'table.hm')
+        HashMap.write(path, m)
+
+        with HashMap.open(path) as mapped:
+            print(mapped.get_size(), mapped.get_capacity(), round(mapped.table_load(), 2))
+            print(all(mapped.get('str' + str(i)) == i * 100 for i in range(150)))
+            print(mapped.get('str7'), mapped.contains_key('str999'))
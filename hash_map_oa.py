@@ -5,26 +5,56 @@
 # Due Date: 6/9/2023
 # Description: Hash Map Implementation - Open Addressing
 
-from a6_include import (DynamicArray, DynamicArrayException, HashEntry,
-                        hash_function_1, hash_function_2)
+from a6_include import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from bloom import CountingBloomFilter
+from hash_functions import mix_low_bits
+from map_batch import get_values, put_pairs, remove_keys
+from map_stats import MapStats, hash_collisions
+from primes import is_prime, next_power_of_two, next_prime
+from snapshot import dump_entries, load_into
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    # share of the buckets that may hold tombstones before put purges them in place
+    tombstone_purge_ratio = .25
+
+    # old buckets moved into the new table by each put/remove during an incremental resize
+    migration_step = 16
+
+    # load below which remove shrinks the table, 0 never shrinks, must stay below .5
+    min_load = 0
+
+    def __init__(self, capacity: int, function, incremental: bool = False,
+                 power_of_two: bool = False) -> None:
         """
         Initialize new HashMap that uses
         quadratic probing for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
-        self._buckets = DynamicArray()
+        # capacity must be a prime number, or a power of two when indices are masked
+        self._power_of_two = power_of_two
+        self._capacity = self._next_capacity(capacity)
+        self._allocate(self._capacity)
 
-        # capacity must be a prime number
-        self._capacity = self._next_prime(capacity)
-        for _ in range(self._capacity):
-            self._buckets.append(None)
+        # the table never shrinks below its first capacity
+        self._initial_capacity = self._capacity
 
         self._hash_function = function
         self._size = 0
+        self._tombstones = 0
+
+        # incremental resizing keeps the old buckets until all of them are migrated
+        self._incremental = incremental
+        self._old_buckets = None
+        self._migrate_index = 0
+
+        # runtime counters, only kept while stats are enabled
+        self._stats = None
+
+        # filter answering lookups of missing keys, only kept while enabled
+        self._bloom = None
+
+        # bumped on every structural change so running iterators can detect it
+        self._version = 0
 
     def __str__(self) -> str:
         """
@@ -36,38 +66,55 @@ class HashMap:
             out += str(i) + ': ' + str(self._buckets[i]) + '\n'
         return out
 
+    def _allocate(self, capacity: int) -> None:
+        """
+        Creates empty buckets for the given capacity
+
+        param: capacity
+
+        return: None
+        """
+        self._buckets = DynamicArray([None] * capacity)
+
     def _next_prime(self, capacity: int) -> int:
         """
         Increment from given number to find the closest prime number
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Looked up in the precomputed prime table instead of trial division
         """
-        if capacity % 2 == 0:
-            capacity += 1
-
-        while not self._is_prime(capacity):
-            capacity += 2
-
-        return capacity
+        return next_prime(capacity)
 
     @staticmethod
     def _is_prime(capacity: int) -> bool:
         """
         Determine if given integer is a prime number and return boolean
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Looked up in the precomputed prime table instead of trial division
         """
-        if capacity == 2 or capacity == 3:
-            return True
+        return is_prime(capacity)
 
-        if capacity == 1 or capacity % 2 == 0:
-            return False
+    def _next_capacity(self, capacity: int) -> int:
+        """
+        Returns the capacity a table asked to hold the given capacity really gets
 
-        factor = 3
-        while factor ** 2 <= capacity:
-            if capacity % factor == 0:
-                return False
-            factor += 2
+        param: requested capacity
 
-        return True
+        return: next prime, or next power of two in power of two mode
+        """
+        if self._power_of_two:
+            return next_power_of_two(capacity)
+        return self._next_prime(capacity)
+
+    def _bucket_index(self, hash_value: int, capacity: int) -> int:
+        """
+        Returns the home bucket of a hash
+
+        param: hash of the key and capacity of the buckets
+
+        return: index of the home bucket
+        """
+        # power of two tables mask the low bits, so the hash is finalized first
+        if self._power_of_two:
+            return mix_low_bits(hash_value) & (capacity - 1)
+        return hash_value % capacity
 
     def get_size(self) -> int:
         """
@@ -94,37 +141,131 @@ class HashMap:
         return: None
         """
 
-        hash_value = self._hash_function(key)
+        self._put(key, value, self._hash_function(key))
 
-        # create loop variable to continue while loop and counter variable for quad probe formula
-        loop_variable = 0
-        j_counter = 0
+    def _put(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Updates key value pairs in the hash map using an already computed hash
+
+        param: key, value and hash of the key
+
+        return: None
+        """
 
-        # resizes if table load is less or equal to .5
-        if self.table_load() >= .5:
-            self.resize_table(self._capacity * 2)
+        # during an incremental resize an existing key only gets its value replaced,
+        # which is not a structural change, so running iterators keep going
+        if self._old_buckets is not None:
+            entry = self._find_entry(self._buckets, hash_value, key)
+            if entry is None:
+                entry = self._find_entry(self._old_buckets, hash_value, key)
+            if entry is not None:
+                entry.value = value
+                return
+
+            # moves a few old buckets over before the new key is added
+            self._migrate(self.migration_step)
+
+        # purges in place when too many buckets are tombstones, an incremental
+        # table copies its live entries into fresh buckets a few at a time instead
+        if self._tombstones / self._capacity >= self.tombstone_purge_ratio:
+            if not self._incremental:
+                self.purge_tombstones()
+            elif self._old_buckets is None:
+                self._start_migration(self._capacity)
+
+        # resizes if live entries plus tombstones would fill half of the table after this insert,
+        # quadratic probing only reaches (capacity + 1) / 2 buckets, so one of them has to stay empty
+        if (self._size + self._tombstones + 1) / self._capacity >= .5:
+            if self._incremental:
+                self._start_migration(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        # a key that was moved into the old buckets by the resize above is dropped
+        # there and written to the new ones
+        size = self._size
+        if self._old_buckets is not None:
+            entry = self._find_entry(self._old_buckets, hash_value, key)
+            if entry is not None:
+                entry.is_tombstone = True
+                self._size -= 1
+
+        self._insert(key, value, hash_value)
 
-        while loop_variable == 0:
-            # quadratic probing formula: (hash function initial index + j^2) + m
-            q_probe = (hash_value + (j_counter**2)) % self._capacity
+        # only a key that was not in the map yet is added to the filter
+        if self._bloom is not None and self._size > size:
+            self._bloom.add(hash_value)
 
-            # sets value if index of the q_probe is None
-            if self._buckets[q_probe] is None:
-                self._buckets.set_at_index(q_probe, HashEntry(key, value))
+    def _insert(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Probes the current buckets and stores the key without checking the load
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+
+        # counter variable for quad probe formula and first reusable tombstone on the probe path
+        q_probe = self._bucket_index(hash_value, self._capacity)
+        j_counter = 0
+        tombstone_index = -1
+
+        while True:
+            bucket = self._buckets[q_probe]
+
+            # key is not in the map, so store it in the first tombstone seen or this empty bucket
+            if bucket is None:
+                if tombstone_index != -1:
+                    q_probe = tombstone_index
+                    self._tombstones -= 1
+                self._buckets.set_at_index(q_probe, HashEntry(key, value, hash_value))
                 self._size += 1
+                self._version += 1
+
+                # a new key whose home bucket was already taken is a collision
+                if self._stats is not None and j_counter > 0:
+                    self._stats.bucket_collisions += 1
                 return
 
-            # replaces with new value if keys match
-            if self._buckets[q_probe].key == key:
-                # checks for tombstone
-                if self._buckets[q_probe].is_tombstone is True:
-                    self._size += 1
-                self._buckets.set_at_index(q_probe, HashEntry(key, value))
+            # remembers the first tombstone but keeps probing in case the key is further along
+            if bucket.is_tombstone is True:
+                if tombstone_index == -1:
+                    tombstone_index = q_probe
+
+            # replaces with new value if keys match, comparing cached hashes before keys
+            elif bucket.hash_value == hash_value and bucket.key == key:
+                self._buckets.set_at_index(q_probe, HashEntry(key, value, hash_value))
                 return
 
-            # update counter
+            # update counter and move to the next bucket of the probe sequence
             j_counter += 1
+            q_probe = self._next_probe(q_probe, j_counter, self._capacity)
+
+    def _next_probe(self, q_probe: int, j_counter: int, capacity: int) -> int:
+        """
+        Moves from probe j - 1 to probe j of a quadratic probe sequence
+
+        param: current bucket index, probe number j and capacity
 
+        return: index of the next bucket
+        """
+        # offsets j^2 grow by 2j - 1 and visit half of a prime table,
+        # offsets j(j + 1) / 2 grow by j and visit all of a power of two table
+        if self._power_of_two:
+            return (q_probe + j_counter) & (capacity - 1)
+        return (q_probe + 2 * j_counter - 1) % capacity
+
+    def _probe_limit(self, capacity: int) -> int:
+        """
+        Returns how many different buckets a probe sequence reaches
+
+        param: capacity
+
+        return: (capacity + 1) / 2 for a prime table, capacity for a power of two table
+        """
+        if self._power_of_two:
+            return capacity
+        return (capacity + 1) // 2
 
     def table_load(self) -> float:
         """
@@ -146,6 +287,7 @@ class HashMap:
         return: int of tallied empty buckets
         """
 
+        self._finish_migration()
         count = 0
 
         # loop and tally empty buckets
@@ -166,15 +308,31 @@ class HashMap:
         if new_capacity < self.get_size():
             return
 
-        # check if new capacity is a prime number
-        if self._is_prime(new_capacity) is False:
+        # an explicit resize finishes any incremental resize first
+        self._finish_migration()
+
+        stats = self._stats
+        if stats is not None:
+            stats.resizes += 1
+            stats.start_rehash()
+
+        # check if new capacity is a prime number, or a power of two in power of two mode
+        if self._power_of_two:
+            new_capacity = next_power_of_two(new_capacity)
+            self._capacity = new_capacity
+        elif self._is_prime(new_capacity) is False:
             new_capacity = self._next_prime(new_capacity)
             self._capacity = new_capacity
         else:
             self._capacity = new_capacity
 
-        # set size of hash map to 0
+        # set size of hash map to 0, tombstones are not carried over
         self._size = 0
+        self._tombstones = 0
+        self._version += 1
+
+        if self._bloom is not None:
+            self._bloom.reset(new_capacity)
         # save old bucket and create new empty hash
         old_bucket = self._buckets
         self._buckets = DynamicArray()
@@ -183,12 +341,161 @@ class HashMap:
         for num in range(new_capacity):
             self._buckets.append(None)
 
-        # fill new hash with old hash and account for tombstones
+        # fill new hash with old hash and account for tombstones, reusing the cached hashes
         for num in range(old_bucket.length()):
             values = old_bucket[num]
             if values is not None and values.is_tombstone is False:
-                self.put(values.key, values.value)
+                self._put(values.key, values.value, values.hash_value)
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Begins an incremental resize, keeping the old buckets next to the new ones
+
+        param: new capacity
+
+        return: None
+        """
+
+        # only one resize runs at a time
+        self._finish_migration()
+
+        # the current buckets become the old ones and are probed until the migration ends,
+        # so they are kept strictly under half full to leave an empty bucket on every probe sequence
+        if (self._size + self._tombstones) * 2 >= self._capacity:
+            self.purge_tombstones()
+
+        # a migration to the same capacity only drops the tombstones
+        new_capacity = self._next_capacity(new_capacity)
+        if self._stats is not None:
+            if new_capacity == self._capacity:
+                self._stats.purges += 1
+            else:
+                self._stats.resizes += 1
+
+        # the keys stay the same, so the filter is rebuilt for the new capacity right away
+        if self._bloom is not None and new_capacity != self._capacity:
+            self._rebuild_bloom(new_capacity)
+
+        self._old_buckets = self._buckets
+        self._migrate_index = 0
+        self._capacity = new_capacity
+        self._tombstones = 0
+        self._version += 1
+
+        self._buckets = DynamicArray([None] * self._capacity)
+
+    def _migrate(self, count: int) -> None:
+        """
+        Moves up to count old buckets into the new buckets
+
+        param: number of old buckets to move
+
+        return: None
+        """
+
+        stats = self._stats
+        if stats is not None:
+            stats.start_rehash()
+
+        old_bucket = self._old_buckets
+        end = min(self._migrate_index + count, old_bucket.length())
+
+        # a moved entry becomes a tombstone so old probe sequences still reach the entries behind it
+        for num in range(self._migrate_index, end):
+            values = old_bucket[num]
+            if values is not None and values.is_tombstone is False:
+                values.is_tombstone = True
+                self._size -= 1
+                self._insert(values.key, values.value, values.hash_value)
+
+        self._migrate_index = end
+        if end == old_bucket.length():
+            self._old_buckets = None
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def _finish_migration(self) -> None:
+        """
+        Moves every remaining old bucket so only the new buckets are left
+
+        param: None
+
+        return: None
+        """
+
+        if self._old_buckets is not None:
+            self._migrate(self._old_buckets.length())
+
+    def purge_tombstones(self) -> None:
+        """
+        Rehashes the live entries in place at the current capacity, dropping all tombstones
+
+        param: None
+
+        return: None
+        """
+
+        stats = self._stats
+        if stats is not None:
+            stats.purges += 1
+            stats.start_rehash()
+
+        # collect live entries, then empty the existing buckets and put them back
+        live = DynamicArray()
+        for num in range(self._buckets.length()):
+            values = self._buckets[num]
+            if values is not None and values.is_tombstone is False:
+                live.append(values)
+            self._buckets.set_at_index(num, None)
+
+        self._size -= live.length()
+        self._tombstones = 0
+        self._version += 1
+        for num in range(live.length()):
+            values = live[num]
+            self._insert(values.key, values.value, values.hash_value)
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def _find_entry(self, buckets: DynamicArray, hash_value: int, key: str) -> HashEntry:
+        """
+        Probes the given buckets for a live entry with the key
+
+        param: buckets to probe, hash of the key and key
+
+        return: matching HashEntry, or None if the key is not there
+        """
+
+        capacity = buckets.length()
+        q_probe = self._bucket_index(hash_value, capacity)
+        j_counter = 0
+
+        # an empty bucket ends the probe sequence, and so does running out of buckets to visit
+        for j_counter in range(self._probe_limit(capacity)):
+            bucket = buckets[q_probe]
+
+            if bucket is None:
+                if self._stats is not None:
+                    self._stats.record_probe(False, j_counter + 1)
+                return None
+
+            # tombstones are skipped, live keys are compared once their cached hash matches
+            if bucket.is_tombstone is False and bucket.hash_value == hash_value and bucket.key == key:
+                if self._stats is not None:
+                    self._stats.record_probe(True, j_counter + 1)
+                return bucket
 
+            # moves to the bucket of the next probe
+            q_probe = self._next_probe(q_probe, j_counter + 1, capacity)
+
+        if self._stats is not None:
+            self._stats.record_probe(False, j_counter + 1)
+        return None
 
     def get(self, key: str) -> object:
         """
@@ -199,29 +506,33 @@ class HashMap:
         return: value of the key
         """
 
-        hash_value = self._hash_function(key)
-        j_counter = 0
-        q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+        entry = self._find_node(key, self._hash_function(key))
+        if entry is None:
+            return None
+        return entry.value
 
-        # loops while true
-        while self._buckets[q_probe]:
-            # quadratic probing formula: (hash function initial index + j^2) + m
-            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+    def _find_node(self, key: str, hash_value: int) -> HashEntry:
+        """
+        Returns the live entry holding the key using an already computed hash
 
-            # checks if there is anything at the index provided by the quad probe
-            if self._buckets[q_probe] is None:
-                return None
+        param: key and hash of the key
 
-            # checks if index is a tombstone
-            elif self._buckets[q_probe].is_tombstone is True:
-                return None
+        return: HashEntry, or None if the key is not in the hash map
+        """
 
-            # finally checks if the keys are equal then returns value
-            elif self._buckets[q_probe].key == key:
-                return self._buckets[q_probe].value
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(hash_value):
+            return None
 
-            # updates counter for q_probe formula
-            j_counter += 1
+        entry = self._find_entry(self._buckets, hash_value, key)
+
+        # keys that are not migrated yet are still in the old buckets
+        if entry is None and self._old_buckets is not None:
+            entry = self._find_entry(self._old_buckets, hash_value, key)
+
+        if entry is None and bloom is not None:
+            bloom.false_positives += 1
+        return entry
 
     def contains_key(self, key: str) -> bool:
         """
@@ -231,29 +542,134 @@ class HashMap:
 
         return: bool
         """
+        return self._find_node(key, self._hash_function(key)) is not None
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of buckets a lookup of the key inspects
+
+        param: key
+
+        return: int of inspected buckets
+        """
         hash_value = self._hash_function(key)
-        loop_variable = 0
-        j_counter = 0
+        count = 0
+
+        # a lookup falls through to the old buckets only during an incremental resize
+        for buckets in (self._buckets, self._old_buckets):
+            if buckets is None:
+                break
 
-        # loops continues until a return is encountered
-        while loop_variable == 0:
-            # quadratic probing formula: (hash function initial index + j^2) + m
-            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            q_probe = self._bucket_index(hash_value, buckets.length())
+            for j_counter in range(1, self._probe_limit(buckets.length()) + 1):
+                bucket = buckets[q_probe]
+                count += 1
 
-            # checks if there is anything at index from quad probe
-            if self._buckets[q_probe] is None:
-                return False
+                if bucket is None:
+                    break
 
-            # checks if index is a tombstone
-            elif self._buckets[q_probe].is_tombstone is True:
-                return False
+                # lookup stops at the same buckets contains_key stops at
+                if bucket.is_tombstone is False and bucket.hash_value == hash_value and bucket.key == key:
+                    return count
 
-            # finally checks if keys match and returns bool
-            elif self._buckets[q_probe].key == key:
-                return True
+                q_probe = self._next_probe(q_probe, j_counter, buckets.length())
 
-            # updates counter variable for quad probe
-            j_counter += 1
+        return count
+
+    def enable_stats(self) -> None:
+        """
+        Starts collecting probe, collision and resize counters
+
+        param: None
+
+        return: None
+        """
+        if self._stats is None:
+            self._stats = MapStats()
+
+    def disable_stats(self) -> None:
+        """
+        Stops collecting counters and drops the ones collected so far
+
+        param: None
+
+        return: None
+        """
+        self._stats = None
+
+    def stats(self, collisions: bool = False) -> dict:
+        """
+        Returns a snapshot of the table's shape and, while enabled, its runtime counters.
+        An incremental resize that is running is left running
+
+        param: whether keys sharing a full hash are counted, which reads every entry
+
+        return: dict of statistics
+        """
+        # empty_buckets finishes an incremental resize, so the buckets are counted here
+        if self._old_buckets is None:
+            empty = self.empty_buckets()
+        else:
+            empty = 0
+            for buckets, start in self._bucket_spans():
+                for num in range(start, buckets.length()):
+                    if buckets[num] is None:
+                        empty += 1
+
+        out = {
+            'size': self._size,
+            'capacity': self._capacity,
+            'table_load': self.table_load(),
+            'tombstones': self._tombstones,
+            'empty_buckets': empty,
+            'hash_function': getattr(self._hash_function, '__name__', str(self._hash_function)),
+        }
+
+        # hashes are read from the entries, so no key is hashed again
+        if collisions:
+            out['hash_collisions'] = hash_collisions([entry.hash_value for entry in self._live_entries()])
+        if self._stats is not None:
+            out.update(self._stats.as_dict())
+        if self._bloom is not None:
+            out['bloom'] = self._bloom.stats()
+        return out
+
+    def enable_bloom(self, bits_per_key: int = 10) -> None:
+        """
+        Starts keeping a counting Bloom filter of the keys, so most lookups
+        of missing keys are answered without probing
+
+        param: counters per key, each one byte, the filter is resized along with the table
+
+        return: None
+        """
+        if self._bloom is None:
+            # put grows before half of the buckets are taken, so at most that many keys are held
+            self._bloom = CountingBloomFilter(self._capacity, bits_per_key, max_load=.5)
+            self._rebuild_bloom(self._capacity)
+
+    def disable_bloom(self) -> None:
+        """
+        Stops keeping the filter
+
+        param: None
+
+        return: None
+        """
+        self._bloom = None
+
+    def _rebuild_bloom(self, capacity: int) -> None:
+        """
+        Empties the filter, sizes it for the capacity and adds every live key back
+
+        param: capacity the filter is sized for
+
+        return: None
+        """
+        bloom = self._bloom
+        bloom.reset(capacity)
+        for entry in self._live_entries():
+            bloom.add(entry.hash_value)
 
     def remove(self, key: str) -> None:
         """
@@ -264,35 +680,157 @@ class HashMap:
         return: None
         """
 
-        hash_value = self._hash_function(key) % self._capacity
-        j_counter = 1
-        hash_bucket = self._buckets[hash_value]
-        while hash_bucket is not None:
-            # if bucket matches key and is not a TS, make TS true and decrease size
-            if hash_bucket.key == key and hash_bucket.is_tombstone is False:
-                hash_bucket.is_tombstone = True
+        hash_value = self._hash_function(key)
+
+        # moves a few old buckets over while an incremental resize is running
+        if self._old_buckets is not None:
+            self._migrate(self.migration_step)
+
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(hash_value):
+            return
+
+        # if bucket matches key and is not a TS, make TS true and decrease size
+        entry = self._find_entry(self._buckets, hash_value, key)
+        if entry is not None:
+            entry.is_tombstone = True
+            self._size -= 1
+            self._tombstones += 1
+            self._version += 1
+            if bloom is not None:
+                bloom.remove(hash_value)
+            self._shrink_if_sparse()
+            return
+
+        # old buckets are thrown away after migration, so their tombstones are not counted
+        if self._old_buckets is not None:
+            entry = self._find_entry(self._old_buckets, hash_value, key)
+            if entry is not None:
+                entry.is_tombstone = True
                 self._size -= 1
+                self._version += 1
+                if bloom is not None:
+                    bloom.remove(hash_value)
+                self._shrink_if_sparse()
                 return
-            # implement quad probing in loop if first search did not find the key
-            else:
-                q_probe = (hash_value + j_counter ** 2) % self._capacity
-                j_counter += 1
-                hash_bucket = self._buckets[q_probe]
 
-    def clear(self) -> None:
+        if bloom is not None:
+            bloom.false_positives += 1
+
+    def _shrink_if_sparse(self) -> None:
         """
-        Clears contents of the hash map
+        Shrinks the table once its load drops below min_load. The new load is
+        halfway between min_load and the load put grows at, so the table has
+        to gain or lose a good share of its keys before it resizes again
 
         param: None
 
         return: None
         """
 
-        # sets buckets to an empty da and appends None to each bucket
-        self._buckets = DynamicArray()
-        for num in range(self._capacity):
-            self._buckets.append(None)
+        if self.min_load <= 0 or self._size >= self._capacity * self.min_load:
+            return
+
+        # put grows once live entries and tombstones would reach a load of .5, and the
+        # table is never made so small that the next insert would already reach it
+        new_capacity = max(self._initial_capacity,
+                           int(self._size / ((self.min_load + .5) / 2)) + 1,
+                           2 * (self._size + 1) + 1)
+        if self._next_capacity(new_capacity) >= self._capacity:
+            return
+
+        if self._incremental:
+            self._start_migration(new_capacity)
+        else:
+            self.resize_table(new_capacity)
+
+    def put_many(self, pairs) -> None:
+        """
+        Updates every key/value pair, growing the table at most once up front
+
+        param: iterable or da of (key, value) tuples
+
+        return: None
+        """
+        put_pairs(self, pairs)
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Returns the values associated with each key, in the order given
+
+        param: iterable or da of keys
+
+        return: da of values, None where a key is missing
+        """
+        return get_values(self, keys)
+
+    def remove_many(self, keys) -> int:
+        """
+        Removes every given key from the hash map
+
+        param: iterable or da of keys
+
+        return: int of keys that were removed
+        """
+        return remove_keys(self, keys)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Resizes once so count more keys fit without put triggering a resize
+
+        param: number of keys about to be added
+
+        return: None
+        """
+
+        # put resizes before an insert that would fill half of the table, so the last
+        # insert needs more than twice the final count, and resizing at least at the
+        # current capacity also drops the tombstones
+        if (self._size + self._tombstones + count) * 2 >= self._capacity:
+            self.resize_table(max(self._capacity, (self._size + count) * 2 + 1))
+
+    def clear(self, reset_capacity: bool = False) -> None:
+        """
+        Clears contents of the hash map
+
+        param: whether the table goes back to the capacity it was created with
+
+        return: None
+        """
+
+        if reset_capacity:
+            self._capacity = self._initial_capacity
+
+        self._allocate(self._capacity)
         self._size = 0
+        self._tombstones = 0
+        self._old_buckets = None
+        self._version += 1
+        if self._bloom is not None:
+            self._bloom.reset(self._capacity)
+
+    def dump(self, fileobj, include_hashes: bool = True) -> None:
+        """
+        Writes a binary snapshot of the map, a chunk of buckets at a time
+
+        param: binary file object and whether the cached hashes are written
+
+        return: None
+        """
+        dump_entries(fileobj, self._live_entries(), self.get_size(), self._capacity,
+                     self._hash_function, include_hashes, self._power_of_two, self._incremental)
+
+    @classmethod
+    def load(cls, fileobj, function=None, allow_pickle: bool = True) -> "HashMap":
+        """
+        Reads a snapshot written by dump into a table presized from its header
+
+        param: binary file object, hash function (the one recorded by dump when
+               omitted) and whether pickled values may be loaded
+
+        return: new HashMap
+        """
+        return load_into(cls, fileobj, function, allow_pickle)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -303,45 +841,88 @@ class HashMap:
         return: da
         """
         arr = DynamicArray()
-        # finds buckets that are not empty/not tombstones and appends to the empty da
-        for num in range(self._buckets.length()):
-            if self._buckets[num] is not None and self._buckets[num].is_tombstone is False:
-                arr.append((self._buckets[num].key, self._buckets[num].value))
+        for item in self.items():
+            arr.append(item)
         return arr
 
-    def __iter__(self):
+    def _bucket_spans(self) -> list:
         """
-        Method enables the hash map to iterate across itself
+        Returns the buckets that can hold live entries, so they are read without
+        finishing an incremental resize. The old buckets before the migrate
+        index only hold tombstones
 
         param: None
 
-        return: None
+        return: list of (buckets, index of the first bucket to read) tuples
+        """
+        spans = [(self._buckets, 0)]
+        if self._old_buckets is not None:
+            spans.append((self._old_buckets, self._migrate_index))
+        return spans
+
+    def _live_entries(self):
         """
-        self._index = 0
+        Generator over the live entries, each call keeps its own position
 
-        return self
+        param: None
 
-    def __next__(self):
+        return: generator of HashEntry
+        """
+        version = self._version
+
+        # skips buckets that are empty or tombstones
+        for buckets, start in self._bucket_spans():
+            for num in range(start, buckets.length()):
+                entry = buckets[num]
+                if entry is not None and entry.is_tombstone is False:
+                    yield entry
+                    if self._version != version:
+                        raise RuntimeError('HashMap changed size during iteration')
+
+    def keys(self):
         """
-        Method returns next item in the hash map
+        Iterates over the keys without copying them
 
         param: None
 
-        return: None
+        return: generator of keys
+        """
+        for entry in self._live_entries():
+            yield entry.key
+
+    def values(self):
+        """
+        Iterates over the values without copying them
+
+        param: None
+
+        return: generator of values
         """
+        for entry in self._live_entries():
+            yield entry.value
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples without copying the table
+
+        param: None
 
-        # try and except method similar to lecture on __next__ method
-        try:
-            hash_value = self._buckets[self._index]
-            # moves to the next item in the hash that isn't None or a TS
-            while hash_value is None or hash_value.is_tombstone is True:
-                self._index = self._index + 1
-                hash_value = self._buckets[self._index]
-        except DynamicArrayException:
-            raise StopIteration
+        return: generator of (key, value) tuples
+        """
+        for entry in self._live_entries():
+            yield entry.key, entry.value
+
+    def __iter__(self):
+        """
+        Method enables the hash map to iterate across itself,
+        every loop gets its own independent iterator
+
+        param: None
+
+        return: generator of HashEntry
+        """
+        return self._live_entries()
 
-        self._index = self._index + 1
-        return hash_value
 
 # ------------------- BASIC TESTING ---------------------------------------- #
 
@@ -0,0 +1,221 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Open Addressing with Robin Hood probing
+
+
+from a6_include import HashEntry, hash_function_1, hash_function_2
+from hash_map_oa import HashMap as QuadraticHashMap
+
+
+class RobinHoodEntry(HashEntry):
+
+    def __init__(self, key: str, value: object, hash_value: int, distance: int = 0) -> None:
+        """Initialize an entry that remembers its probe number."""
+        super().__init__(key, value, hash_value)
+        self.distance = distance
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return f"K: {self.key} V: {self.value} TS: {self.is_tombstone} D: {self.distance}"
+
+
+class HashMap(QuadraticHashMap):
+    """
+    Open addressing HashMap that uses Robin Hood insertion over the same
+    quadratic probe sequence as the base HashMap.
+    An entry that is further along its probe sequence takes the bucket of an
+    entry that is closer to home, which evens out probe lengths and lets a
+    lookup stop as soon as it passes a bucket closer to home than itself.
+    """
+
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new HashMap that uses
+        Robin Hood quadratic probing for collision resolution
+        """
+        # lookups here only know the current buckets, so resizing is never incremental
+        super().__init__(capacity, function)
+
+    def _insert(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Probes the current buckets and stores the key without checking the load
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+
+        entry = RobinHoodEntry(key, value, hash_value)
+        displaced = False
+
+        while True:
+            q_probe = (entry.hash_value + (entry.distance ** 2)) % self._capacity
+            bucket = self._buckets[q_probe]
+
+            # empty bucket ends the probe and stores whatever entry is being carried
+            if bucket is None:
+                self._buckets.set_at_index(q_probe, entry)
+                self._size += 1
+                self._version += 1
+
+                # a new key whose home bucket was already taken is a collision
+                if self._stats is not None and (displaced or entry.distance > 0):
+                    self._stats.bucket_collisions += 1
+                return
+
+            # an existing key can only sit before the first swap, so stop checking afterwards
+            if not displaced and bucket.is_tombstone is False and \
+                    bucket.hash_value == hash_value and bucket.key == key:
+                bucket.value = value
+                return
+
+            # bucket closer to its home gives its place to the entry being carried
+            if bucket.distance < entry.distance:
+                self._buckets.set_at_index(q_probe, entry)
+
+                # a tombstone is simply dropped instead of carried forward
+                if bucket.is_tombstone is True:
+                    self._tombstones -= 1
+                    self._size += 1
+                    self._version += 1
+                    if self._stats is not None and (displaced or entry.distance > 0):
+                        self._stats.bucket_collisions += 1
+                    return
+
+                entry = bucket
+                displaced = True
+
+            entry.distance += 1
+
+    def _find_index(self, key: str) -> int:
+        """
+        Returns the bucket index holding the key
+
+        param: key
+
+        return: index of the bucket, or -1 if key is not in the hash map
+        """
+
+        hash_value = self._hash_function(key)
+        j_counter = 0
+
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(hash_value):
+            return -1
+
+        while True:
+            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            bucket = self._buckets[q_probe]
+
+            # a key is never stored past a bucket that is closer to its own home
+            if bucket is None or bucket.distance < j_counter:
+                if self._stats is not None:
+                    self._stats.record_probe(False, j_counter + 1)
+                if bloom is not None:
+                    bloom.false_positives += 1
+                return -1
+
+            if bucket.is_tombstone is False and bucket.hash_value == hash_value and bucket.key == key:
+                if self._stats is not None:
+                    self._stats.record_probe(True, j_counter + 1)
+                return q_probe
+
+            j_counter += 1
+
+    def get(self, key: str) -> object:
+        """
+        Returns value associated with the key
+
+        param: key
+
+        return: value of the key
+        """
+
+        index = self._find_index(key)
+        if index == -1:
+            return None
+        return self._buckets[index].value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if key is in the hash and false otherwise
+
+        param: key
+
+        return: bool
+        """
+
+        return self._find_index(key) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map
+
+        param: key
+
+        return: None
+        """
+
+        index = self._find_index(key)
+        if index == -1:
+            return
+
+        # tombstone keeps its distance so lookups can still stop early past it
+        self._buckets[index].is_tombstone = True
+        self._size -= 1
+        self._tombstones += 1
+        self._version += 1
+        if self._bloom is not None:
+            self._bloom.remove(self._buckets[index].hash_value)
+        self._shrink_if_sparse()
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of buckets a lookup of the key inspects
+
+        param: key
+
+        return: int of inspected buckets
+        """
+
+        hash_value = self._hash_function(key)
+        j_counter = 0
+
+        while True:
+            q_probe = (hash_value + (j_counter ** 2)) % self._capacity
+            bucket = self._buckets[q_probe]
+            if bucket is None or bucket.distance < j_counter or \
+                    (bucket.is_tombstone is False and bucket.hash_value == hash_value and bucket.key == key):
+                return j_counter + 1
+
+            j_counter += 1
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nRobin Hood - put and get")
+    print("------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    print(all(m.get('str' + str(i)) == i * 100 for i in range(150)))
+
+    print("\nRobin Hood - remove")
+    print("-------------------")
+    m = HashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    m.remove('4')
+    print(m)
+    print(m.get_keys_and_values())
+    print(m.contains_key('1'), m.contains_key('2'), m.get('5'))
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
@@ -6,29 +6,78 @@
 # Description: Hash Map Implementation - Chaining
 
 
+import os
+
 from a6_include import (DynamicArray, LinkedList,
                         hash_function_1, hash_function_2)
+from bloom import CountingBloomFilter
+from hash_functions import hash_builtin, mix_low_bits
+from map_batch import as_list, get_values, put_pairs, remove_keys
+from map_stats import MapStats, hash_collisions
+from primes import is_prime, next_power_of_two, next_prime
+from snapshot import dump_entries, load_into
+from sorted_bucket import SortedBucket
+
+# shared by the buckets of an incremental resize until their first insert, so
+# starting the resize never builds a LinkedList for every bucket up front
+_EMPTY_BUCKET = LinkedList()
+
+# numpy is optional, find_mode_vectorized counts with the HashMap without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class HashMap:
+    # old buckets moved into the new table by each put/remove during an incremental resize
+    migration_step = 16
+
+    # load below which remove shrinks the table, 0 never shrinks, must stay below 1
+    min_load = 0
+
+    # a chain longer than this becomes a sorted bucket, which turns back into a
+    # chain below the second length, the gap keeps a bucket from flipping back and forth
+    treeify_threshold = 8
+    untreeify_threshold = 6
+
     def __init__(self,
                  capacity: int = 11,
-                 function: callable = hash_function_1) -> None:
+                 function: callable = hash_function_1,
+                 incremental: bool = False,
+                 power_of_two: bool = False) -> None:
         """
         Initialize new HashMap that uses
         separate chaining for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
         self._buckets = DynamicArray()
 
-        # capacity must be a prime number
-        self._capacity = self._next_prime(capacity)
+        # capacity must be a prime number, or a power of two when indices are masked
+        self._power_of_two = power_of_two
+        self._capacity = self._next_capacity(capacity)
         for _ in range(self._capacity):
             self._buckets.append(LinkedList())
 
+        # the table never shrinks below its first capacity
+        self._initial_capacity = self._capacity
+
         self._hash_function = function
         self._size = 0
 
+        # incremental resizing keeps the old buckets until all of them are migrated
+        self._incremental = incremental
+        self._old_buckets = None
+        self._migrate_index = 0
+
+        # runtime counters, only kept while stats are enabled
+        self._stats = None
+
+        # filter answering lookups of missing keys, only kept while enabled
+        self._bloom = None
+
+        # bumped on every structural change so running iterators can detect it
+        self._version = 0
+
     def __str__(self) -> str:
         """
         Override string method to provide more readable output
@@ -42,35 +91,42 @@ class HashMap:
     def _next_prime(self, capacity: int) -> int:
         """
         Increment from given number and the find the closest prime number
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Looked up in the precomputed prime table instead of trial division
         """
-        if capacity % 2 == 0:
-            capacity += 1
-
-        while not self._is_prime(capacity):
-            capacity += 2
-
-        return capacity
+        return next_prime(capacity)
 
     @staticmethod
     def _is_prime(capacity: int) -> bool:
         """
         Determine if given integer is a prime number and return boolean
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Looked up in the precomputed prime table instead of trial division
         """
-        if capacity == 2 or capacity == 3:
-            return True
+        return is_prime(capacity)
 
-        if capacity == 1 or capacity % 2 == 0:
-            return False
+    def _next_capacity(self, capacity: int) -> int:
+        """
+        Returns the capacity a table asked to hold the given capacity really gets
 
-        factor = 3
-        while factor ** 2 <= capacity:
-            if capacity % factor == 0:
-                return False
-            factor += 2
+        param: requested capacity
 
-        return True
+        return: next prime, or next power of two in power of two mode
+        """
+        if self._power_of_two:
+            return next_power_of_two(capacity)
+        return self._next_prime(capacity)
+
+    def _bucket_index(self, h_value: int, capacity: int) -> int:
+        """
+        Returns the bucket a hash belongs to
+
+        param: hash of the key and capacity of the buckets
+
+        return: index of the bucket
+        """
+        # power of two tables mask the low bits, so the hash is finalized first
+        if self._power_of_two:
+            return mix_low_bits(h_value) & (capacity - 1)
+        return h_value % capacity
 
     def get_size(self) -> int:
         """
@@ -97,21 +153,54 @@ class HashMap:
         return: None
         """
 
-        # resizes if table load is less or equal to 1
-        if self.table_load() >= 1:
-            self.resize_table(self._capacity * 2)
+        self._put(key, value, self._hash_function(key))
 
-        h_value = self._hash_function(key)
-        h_index = h_value % self.get_capacity()
-        hash_linked_list = self._buckets[h_index]
+    def _put(self, key: str, value: object, h_value: int) -> None:
+        """
+        Updates key/value pair in the hash map using an already computed hash
 
-        # if the linked list at the index of the hash map contains the key, remove the key
-        if hash_linked_list.contains(key):
-            hash_linked_list.remove(key)
-            self._size -= 1
+        param: key, value and hash of the key
 
-        hash_linked_list.insert(key, value)
+        return: None
+        """
+
+        # an existing key only gets its value replaced, which is not a structural change
+        node = self._buckets[self._bucket_index(h_value, self._capacity)].contains(key, h_value)
+        if node is None:
+            old_linked_list = self._old_bucket(h_value)
+            if old_linked_list is not None:
+                node = old_linked_list.contains(key, h_value)
+        if node is not None:
+            node.value = value
+            return
+
+        # moves a few old buckets over while an incremental resize is running
+        if self._old_buckets is not None:
+            self._migrate(self.migration_step)
+
+        # resizes if table load is less or equal to 1
+        if self.table_load() >= 1:
+            if self._incremental:
+                self._start_migration(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        h_index = self._bucket_index(h_value, self._capacity)
+        hash_linked_list = self._writable_bucket(self._buckets, h_index)
+
+        # a new key landing in a bucket that already has a chain is a collision
+        if self._stats is not None and hash_linked_list.length() > 0:
+            self._stats.bucket_collisions += 1
+
+        # the node keeps the hash so resizes and chain walks never rehash the key
+        hash_linked_list.insert(key, value, h_value)
+        if type(hash_linked_list) is SortedBucket or hash_linked_list.length() > self.treeify_threshold:
+            self._fit_bucket(self._buckets, h_index)
         self._size += 1
+        self._version += 1
+
+        if self._bloom is not None:
+            self._bloom.add(h_value)
 
     def empty_buckets(self) -> int:
         """
@@ -122,6 +211,7 @@ class HashMap:
         return: int representing number of empty buckets
         """
 
+        self._finish_migration()
         empty_buckets = 0
 
         # loops through and tallies buckets that have length of 0
@@ -141,20 +231,27 @@ class HashMap:
         """
         return self._size / self._capacity
 
-    def clear(self) -> None:
+    def clear(self, reset_capacity: bool = False) -> None:
         """
         Clear hash map contents
 
-        param: None
+        param: whether the table goes back to the capacity it was created with
 
         return: None
         """
 
+        if reset_capacity:
+            self._capacity = self._initial_capacity
+
         self._buckets = DynamicArray()
         # appends an empty linked list to each index to clear hash map
         for num in range(self._capacity):
             self._buckets.append(LinkedList())
         self._size = 0
+        self._old_buckets = None
+        self._version += 1
+        if self._bloom is not None:
+            self._bloom.reset(self._capacity)
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -165,14 +262,24 @@ class HashMap:
         return: None
         """
 
-        hash_map = self._buckets
-
         # if new capacity is less than zero, do nothing
         if new_capacity < 1:
             return
 
-        # if new capacity is not prime, make it the next prime
-        if self._is_prime(new_capacity) is False:
+        # an explicit resize finishes any incremental resize first
+        self._finish_migration()
+        hash_map = self._buckets
+
+        stats = self._stats
+        if stats is not None:
+            stats.resizes += 1
+            stats.start_rehash()
+
+        # if new capacity is not prime, make it the next prime (or power of two)
+        if self._power_of_two:
+            self._capacity = next_power_of_two(new_capacity)
+
+        elif self._is_prime(new_capacity) is False:
             self._capacity = self._next_prime(new_capacity)
 
         else:
@@ -183,13 +290,151 @@ class HashMap:
         for num in range(self._capacity):
             self._buckets.append(LinkedList())
         self._size = 0
+        self._version += 1
+
+        if self._bloom is not None:
+            self._bloom.reset(self._capacity)
 
         for indices in range(hash_map.length()):
             hash_linked_list = hash_map[indices]
-            # adds in the ll if there is one at the index
+            # adds in the ll if there is one at the index, reusing the cached hashes
             if hash_linked_list.length() is not None:
                 for add_node in hash_linked_list:
-                    self.put(add_node.key, add_node.value)
+                    self._put(add_node.key, add_node.value, add_node.hash_value)
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Begins an incremental resize, keeping the old buckets next to the new ones
+
+        param: new capacity
+
+        return: None
+        """
+
+        # only one resize runs at a time
+        self._finish_migration()
+
+        if self._stats is not None:
+            self._stats.resizes += 1
+
+        # the keys stay the same, so the filter is rebuilt for the new capacity right away
+        new_capacity = self._next_capacity(new_capacity)
+        if self._bloom is not None:
+            self._rebuild_bloom(new_capacity)
+
+        self._old_buckets = self._buckets
+        self._migrate_index = 0
+        self._capacity = new_capacity
+        self._version += 1
+
+        self._buckets = DynamicArray([_EMPTY_BUCKET] * self._capacity)
+
+    def _writable_bucket(self, buckets: DynamicArray, h_index: int) -> LinkedList:
+        """
+        Returns the bucket at the index, first giving it its own LinkedList
+        if it still holds the shared empty bucket
+
+        param: buckets and index of the bucket
+
+        return: LinkedList or SortedBucket that can be inserted into
+        """
+
+        bucket = buckets[h_index]
+        if bucket is _EMPTY_BUCKET:
+            bucket = LinkedList()
+            buckets[h_index] = bucket
+        return bucket
+
+    def _migrate(self, count: int) -> None:
+        """
+        Moves up to count old buckets into the new buckets
+
+        param: number of old buckets to move
+
+        return: None
+        """
+
+        stats = self._stats
+        if stats is not None:
+            stats.start_rehash()
+
+        old_buckets = self._old_buckets
+        end = min(self._migrate_index + count, old_buckets.length())
+
+        for indices in range(self._migrate_index, end):
+            for node in old_buckets[indices]:
+                h_index = self._bucket_index(node.hash_value, self._capacity)
+                bucket = self._writable_bucket(self._buckets, h_index)
+                bucket.insert(node.key, node.value, node.hash_value)
+                if bucket.length() > self.treeify_threshold or type(bucket) is SortedBucket:
+                    self._fit_bucket(self._buckets, h_index)
+
+            # migrated buckets are never read again, so release them right away
+            old_buckets[indices] = None
+
+        self._migrate_index = end
+        self._version += 1
+        if end == old_buckets.length():
+            self._old_buckets = None
+
+        if stats is not None:
+            stats.end_rehash()
+
+    def _finish_migration(self) -> None:
+        """
+        Moves every remaining old bucket so only the new buckets are left
+
+        param: None
+
+        return: None
+        """
+
+        if self._old_buckets is not None:
+            self._migrate(self._old_buckets.length())
+
+    def _old_bucket(self, h_value: int) -> LinkedList:
+        """
+        Returns the old bucket for a hash if it has not been migrated yet
+
+        param: hash of the key
+
+        return: LinkedList, or None when there is no such bucket
+        """
+
+        if self._old_buckets is None:
+            return None
+
+        old_index = self._bucket_index(h_value, self._old_buckets.length())
+        if old_index < self._migrate_index:
+            return None
+        return self._old_buckets[old_index]
+
+    def _find_node(self, key: str, h_value: int):
+        """
+        Returns the node holding the key using an already computed hash
+
+        param: key and hash of the key
+
+        return: SLNode, or None if the key is not in the hash map
+        """
+
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(h_value):
+            return None
+
+        h_index = self._bucket_index(h_value, self._capacity)
+        node = self._buckets[h_index].contains(key, h_value)
+        if node is None:
+            old_linked_list = self._old_bucket(h_value)
+            if old_linked_list is not None:
+                node = old_linked_list.contains(key, h_value)
+
+        if node is None and bloom is not None:
+            bloom.false_positives += 1
+        return node
 
     def get(self, key: str):
         """
@@ -200,12 +445,12 @@ class HashMap:
         return: str value
         """
 
-        h_value = self._hash_function(key)
-        h_index = h_value % self.get_capacity()
+        # keys that are not migrated yet are still looked up in the old buckets
+        node = self._find_node(key, self._hash_function(key))
 
         # returns value if the keys match at the hash index
-        if self._buckets[h_index].contains(key) is not None:
-            return self._buckets[h_index].contains(key).value
+        if node is not None:
+            return node.value
 
         else:
             return None
@@ -219,14 +464,8 @@ class HashMap:
         return: bool
         """
 
-        h_value = self._hash_function(key)
-        h_index = h_value % self.get_capacity()
-
-        # return true if the hash index contains the right key
-        if self._buckets[h_index].contains(key) is not None:
-            return True
-        else:
-            return False
+        # return true if the hash index, or the old bucket during a migration, contains the right key
+        return self._find_node(key, self._hash_function(key)) is not None
 
     def remove(self, key: str) -> None:
         """
@@ -237,12 +476,250 @@ class HashMap:
         return: None
         """
 
+        # moves a few old buckets over while an incremental resize is running
+        if self._old_buckets is not None:
+            self._migrate(self.migration_step)
+
         h_value = self._hash_function(key)
-        h_index = h_value % self.get_capacity()
+        h_index = self._bucket_index(h_value, self._capacity)
+
+        bloom = self._bloom
+        if bloom is not None and not bloom.might_contain(h_value):
+            return
 
         # removes key if true
-        if self._buckets[h_index].remove(key):
+        hash_linked_list = self._buckets[h_index]
+        if hash_linked_list.remove(key, h_value):
+            if type(hash_linked_list) is SortedBucket:
+                self._fit_bucket(self._buckets, h_index)
             self._size -= 1
+            self._version += 1
+            if bloom is not None:
+                bloom.remove(h_value)
+            self._shrink_if_sparse()
+            return
+
+        old_linked_list = self._old_bucket(h_value)
+        if old_linked_list is not None and old_linked_list.remove(key, h_value):
+            self._size -= 1
+            self._version += 1
+            if bloom is not None:
+                bloom.remove(h_value)
+            self._shrink_if_sparse()
+            return
+
+        if bloom is not None:
+            bloom.false_positives += 1
+
+    def _fit_bucket(self, buckets: DynamicArray, h_index: int) -> None:
+        """
+        Turns a chain longer than treeify_threshold into a sorted bucket when its
+        keys can be sorted, and a sorted bucket shorter than untreeify_threshold,
+        or given a key that cannot be sorted, back into a chain
+
+        param: buckets and index of the bucket
+
+        return: None
+        """
+
+        bucket = buckets[h_index]
+        if type(bucket) is LinkedList:
+            if bucket.length() > self.treeify_threshold and SortedBucket.sortable(bucket):
+                buckets[h_index] = SortedBucket(bucket)
+        elif bucket.length() < self.untreeify_threshold or not bucket.is_ordered():
+            buckets[h_index] = bucket.to_linked_list()
+
+    def _shrink_if_sparse(self) -> None:
+        """
+        Shrinks the table once its load drops below min_load. The new load is
+        halfway between min_load and the load put grows at, so the table has
+        to gain or lose a good share of its keys before it resizes again
+
+        param: None
+
+        return: None
+        """
+
+        size = self.get_size()
+        if self.min_load <= 0 or size >= self._capacity * self.min_load:
+            return
+
+        # put grows at a load of 1
+        new_capacity = max(self._initial_capacity, int(size / ((self.min_load + 1) / 2)) + 1)
+        if self._next_capacity(new_capacity) >= self._capacity:
+            return
+
+        if self._incremental:
+            self._start_migration(new_capacity)
+        else:
+            self.resize_table(new_capacity)
+
+    def enable_stats(self) -> None:
+        """
+        Starts collecting collision and resize counters
+
+        param: None
+
+        return: None
+        """
+        if self._stats is None:
+            self._stats = MapStats()
+
+    def disable_stats(self) -> None:
+        """
+        Stops collecting counters and drops the ones collected so far
+
+        param: None
+
+        return: None
+        """
+        self._stats = None
+
+    def stats(self, collisions: bool = False) -> dict:
+        """
+        Returns a snapshot of the table's shape and, while enabled, its runtime counters.
+        During an incremental resize the chains of the old buckets that are not
+        migrated yet are counted too, and the resize is left running
+
+        param: whether keys sharing a full hash are counted, which reads every node
+
+        return: dict of statistics
+        """
+
+        # chain_lengths[i] holds how many buckets have a chain of length i
+        chain_lengths = [0]
+        sorted_buckets = 0
+        for buckets, start in self._bucket_spans():
+            for indices in range(start, buckets.length()):
+                hash_linked_list = buckets[indices]
+                length = hash_linked_list.length()
+                if type(hash_linked_list) is SortedBucket:
+                    sorted_buckets += 1
+                while len(chain_lengths) <= length:
+                    chain_lengths.append(0)
+                chain_lengths[length] += 1
+
+        out = {
+            'size': self._size,
+            'capacity': self._capacity,
+            'table_load': self.table_load(),
+            'empty_buckets': chain_lengths[0],
+            'chain_lengths': {length: count for length, count in enumerate(chain_lengths) if count},
+            'longest_chain': len(chain_lengths) - 1,
+            'sorted_buckets': sorted_buckets,
+            'hash_function': getattr(self._hash_function, '__name__', str(self._hash_function)),
+        }
+
+        # hashes are read from the nodes, so no key is hashed again
+        if collisions:
+            out['hash_collisions'] = hash_collisions([node.hash_value for node in self._live_nodes()])
+        if self._stats is not None:
+            out.update(self._stats.as_dict())
+        if self._bloom is not None:
+            out['bloom'] = self._bloom.stats()
+        return out
+
+    def enable_bloom(self, bits_per_key: int = 10) -> None:
+        """
+        Starts keeping a counting Bloom filter of the keys, so most lookups
+        of missing keys are answered without walking a chain
+
+        param: counters per key, each one byte, the filter is resized along with the table
+
+        return: None
+        """
+        if self._bloom is None:
+            self._bloom = CountingBloomFilter(self._capacity, bits_per_key)
+            self._rebuild_bloom(self._capacity)
+
+    def disable_bloom(self) -> None:
+        """
+        Stops keeping the filter
+
+        param: None
+
+        return: None
+        """
+        self._bloom = None
+
+    def _rebuild_bloom(self, capacity: int) -> None:
+        """
+        Empties the filter, sizes it for the capacity and adds every key back
+
+        param: capacity the filter is sized for
+
+        return: None
+        """
+        bloom = self._bloom
+        bloom.reset(capacity)
+        for node in self._live_nodes():
+            bloom.add(node.hash_value)
+
+    def put_many(self, pairs) -> None:
+        """
+        Updates every key/value pair, growing the table at most once up front
+
+        param: iterable or da of (key, value) tuples
+
+        return: None
+        """
+        put_pairs(self, pairs)
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Returns the values associated with each key, in the order given
+
+        param: iterable or da of keys
+
+        return: da of values, None where a key is missing
+        """
+        return get_values(self, keys)
+
+    def remove_many(self, keys) -> int:
+        """
+        Removes every given key from the hash map
+
+        param: iterable or da of keys
+
+        return: int of keys that were removed
+        """
+        return remove_keys(self, keys)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Resizes once so count more keys fit without put triggering a resize
+
+        param: number of keys about to be added
+
+        return: None
+        """
+
+        # put resizes when the load reaches 1 before an insert
+        if self._size + count > self._capacity:
+            self.resize_table(self._size + count)
+
+    def dump(self, fileobj, include_hashes: bool = True) -> None:
+        """
+        Writes a binary snapshot of the map, a chunk of buckets at a time
+
+        param: binary file object and whether the cached hashes are written
+
+        return: None
+        """
+        dump_entries(fileobj, self._live_nodes(), self.get_size(), self._capacity,
+                     self._hash_function, include_hashes, self._power_of_two, self._incremental)
+
+    @classmethod
+    def load(cls, fileobj, function=None, allow_pickle: bool = True) -> "HashMap":
+        """
+        Reads a snapshot written by dump into a table presized from its header
+
+        param: binary file object, hash function (the one recorded by dump when
+               omitted) and whether pickled values may be loaded
+
+        return: new HashMap
+        """
+        return load_into(cls, fileobj, function, allow_pickle)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -253,13 +730,86 @@ class HashMap:
         return: arr
         """
         arr = DynamicArray()
+        for item in self.items():
+            arr.append(item)
+        return arr
 
-        # loops through buckets and lls in buckets to append key/value pairs
-        for indices in range(self._buckets.length()):
-            for ll in self._buckets[indices]:
-                arr.append((ll.key, ll.value))
+    def _bucket_spans(self) -> list:
+        """
+        Returns the buckets that can hold nodes, so they are read without
+        finishing an incremental resize. The old buckets before the migrate
+        index are already migrated
 
-        return arr
+        param: None
+
+        return: list of (buckets, index of the first bucket to read) tuples
+        """
+        spans = [(self._buckets, 0)]
+        if self._old_buckets is not None:
+            spans.append((self._old_buckets, self._migrate_index))
+        return spans
+
+    def _live_nodes(self):
+        """
+        Generator over every node of every chain, each call keeps its own position
+
+        param: None
+
+        return: generator of SLNode
+        """
+        version = self._version
+
+        # loops through buckets and the nodes of the ll in each bucket
+        for buckets, start in self._bucket_spans():
+            for indices in range(start, buckets.length()):
+                for node in buckets[indices]:
+                    yield node
+                    if self._version != version:
+                        raise RuntimeError('HashMap changed size during iteration')
+
+    def keys(self):
+        """
+        Iterates over the keys without copying them
+
+        param: None
+
+        return: generator of keys
+        """
+        for node in self._live_nodes():
+            yield node.key
+
+    def values(self):
+        """
+        Iterates over the values without copying them
+
+        param: None
+
+        return: generator of values
+        """
+        for node in self._live_nodes():
+            yield node.value
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples without copying the table
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        for node in self._live_nodes():
+            yield node.key, node.value
+
+    def __iter__(self):
+        """
+        Method enables the hash map to iterate across itself,
+        every loop gets its own independent iterator
+
+        param: None
+
+        return: generator of SLNode
+        """
+        return self._live_nodes()
 
 
 def find_mode(da: DynamicArray) -> (DynamicArray, int):
@@ -303,6 +853,205 @@ def find_mode(da: DynamicArray) -> (DynamicArray, int):
     return arr, key_frequency
 
 
+
+def _count_into(counts: HashMap, keys, offset: int) -> None:
+    """
+    Adds the keys to counts, each key hashed once
+
+    param: HashMap of key -> [count, index of last occurrence], keys and
+           index of the first key in the whole input
+
+    return: None
+    """
+    hash_function = counts._hash_function
+    for index, key in enumerate(keys, offset):
+        h_value = hash_function(key)
+        node = counts._find_node(key, h_value)
+
+        # the count list is updated in place, so a repeated key is never put again
+        if node is None:
+            counts._put(key, [1, index], h_value)
+        else:
+            node.value[0] += 1
+            node.value[1] = index
+
+
+def _count_chunk(keys: list, offset: int, function) -> list:
+    """
+    Counts one chunk in a worker process with its own HashMap
+
+    param: list of keys, index of the first key in the whole input and hash function
+
+    return: list of (key, count, index of last occurrence) tuples
+    """
+    counts = HashMap(len(keys), function)
+    _count_into(counts, keys, offset)
+    return [(key, value[0], value[1]) for key, value in counts.items()]
+
+
+def _merge_counts(merged: HashMap, partial: list) -> None:
+    """
+    Adds the partial counts of one chunk to the merged counts
+
+    param: HashMap of key -> [count, index of last occurrence] and partial counts
+
+    return: None
+    """
+    hash_function = merged._hash_function
+    for key, count, last in partial:
+        h_value = hash_function(key)
+        node = merged._find_node(key, h_value)
+        if node is None:
+            merged._put(key, [count, last], h_value)
+        else:
+            node.value[0] += count
+            node.value[1] = max(node.value[1], last)
+
+
+def _modes(counts: HashMap) -> (DynamicArray, int):
+    """
+    Picks the modes out of merged counts
+
+    param: HashMap of key -> [count, index of last occurrence]
+
+    return: da of the mode(s) and the frequency
+    """
+    frequency = 0
+    modes = []
+    for key, (count, last) in counts.items():
+        if count > frequency:
+            frequency = count
+            modes = []
+        if count == frequency:
+            modes.append((last, key))
+
+    # find_mode lists each mode when it reaches the top frequency, at its last occurrence
+    modes.sort()
+    return DynamicArray([key for last, key in modes]), frequency
+
+
+def find_mode_stream(chunks, workers: int = None,
+                     function: callable = hash_builtin) -> (DynamicArray, int):
+    """
+    Finds the mode and frequency of an input given as an iterator of chunks,
+    with the same result as find_mode on the concatenated chunks.
+    Chunks are counted in worker processes and only the distinct keys are kept,
+    so the whole input never has to be in memory
+
+    param: iterable of key lists or das, number of worker processes
+           (os.cpu_count() when None, counted in this process when 1) and the
+           hash function of the counting maps, which does not change the result
+
+    return: da of the mode(s) and the frequency
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    merged = HashMap(11, function)
+    offset = 0
+
+    if workers <= 1:
+        for chunk in chunks:
+            keys = as_list(chunk)
+            _count_into(merged, keys, offset)
+            offset += len(keys)
+        return _modes(merged)
+
+    # loads multiprocessing and logging, so only callers that start workers pay for it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as pool:
+        # a couple of chunks per worker in flight bounds how much input is held at once
+        pending = []
+        for chunk in chunks:
+            keys = as_list(chunk)
+            pending.append(pool.submit(_count_chunk, keys, offset, function))
+            offset += len(keys)
+
+            if len(pending) >= workers * 2:
+                _merge_counts(merged, pending.pop(0).result())
+
+        for future in pending:
+            _merge_counts(merged, future.result())
+
+    return _modes(merged)
+
+
+def find_mode_parallel(da: DynamicArray, workers: int = None, chunk_size: int = 1 << 16,
+                       function: callable = hash_builtin) -> (DynamicArray, int):
+    """
+    Finds the mode and frequency by counting chunks of the da in worker processes
+
+    param: da or list, number of worker processes, keys per chunk and hash function
+
+    return: da of the mode(s) and the frequency, the same as find_mode
+    """
+    length = da.length() if isinstance(da, DynamicArray) else len(da)
+    chunks = ([da[num] for num in range(start, min(start + chunk_size, length))]
+              for start in range(0, length, chunk_size))
+    return find_mode_stream(chunks, workers, function)
+
+
+def _unique_counts(values: list):
+    """
+    Counts homogeneous str or int values with numpy
+
+    param: list of values
+
+    return: numpy arrays of the distinct values, their counts and the index of
+            their last occurrence, or None when numpy is missing or the values
+            are mixed, empty or not representable exactly
+    """
+    if numpy is None or not values:
+        return None
+
+    kind = type(values[0])
+    if kind is str:
+        # numpy strips trailing NUL characters, which would merge distinct keys
+        if any(type(value) is not str or value.endswith('\x00') for value in values):
+            return None
+        arr = numpy.array(values)
+    elif kind is int:
+        if any(type(value) is not int for value in values):
+            return None
+        try:
+            arr = numpy.array(values, dtype=numpy.int64)
+        except OverflowError:
+            return None
+    else:
+        return None
+
+    uniques, inverse, counts = numpy.unique(arr, return_inverse=True, return_counts=True)
+    last = numpy.zeros(len(uniques), dtype=numpy.int64)
+    numpy.maximum.at(last, inverse.reshape(-1), numpy.arange(len(arr)))
+    return uniques, counts, last
+
+
+def find_mode_vectorized(da: DynamicArray) -> (DynamicArray, int):
+    """
+    Finds the mode and frequency with one vectorized count when the da holds
+    only str or only int64 values and numpy is installed, and with a HashMap
+    count otherwise
+
+    param: da or list
+
+    return: da of the mode(s) and the frequency, the same as find_mode
+    """
+    values = as_list(da)
+    counted = _unique_counts(values)
+    if counted is None:
+        # hash_builtin takes any hashable key, hash_function_1 only takes strings
+        return find_mode_stream([values], 1)
+
+    uniques, counts, last = counted
+    frequency = counts.max()
+    is_mode = counts == frequency
+
+    # find_mode lists each mode at its last occurrence
+    modes = uniques[is_mode][numpy.argsort(last[is_mode])]
+    return DynamicArray(modes.tolist()), int(frequency)
+
+
 # ------------------- BASIC TESTING ---------------------------------------- #
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Open Addressing in shared memory.
+#              One process builds the table once, then any number of processes
+#              attach to it by name and read it in place.
+
+
+from multiprocessing import resource_tracker, shared_memory
+
+from a6_include import hash_function_2
+from table_format import TableReader, build_image, source_pairs
+
+
+class HashMap(TableReader):
+    """
+    Read-only open addressing HashMap whose slots live in a
+    multiprocessing.shared_memory segment laid out by table_format.
+    Attaching maps the segment, so get and contains_key probe the shared
+    bytes directly and no process keeps its own copy of the table.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool) -> None:
+        """
+        Wraps an open segment, use build or attach instead of calling this
+        """
+        super().__init__(segment.buf)
+        self._segment = segment
+        self._owner = owner
+
+    @classmethod
+    def build(cls, source, function=None, name: str = None) -> "HashMap":
+        """
+        Creates a shared segment holding every key/value pair of the source
+
+        param: HashMap or dict with items(), or an iterable of (key, value) tuples,
+               the hash function (taken from a HashMap source when omitted)
+               and an optional segment name
+
+        return: HashMap that owns the segment
+        """
+        image = build_image(*source_pairs(source, function))
+
+        segment = shared_memory.SharedMemory(name=name, create=True, size=len(image))
+        segment.buf[:len(image)] = image
+        return cls(segment, True)
+
+    @classmethod
+    def attach(cls, name: str) -> "HashMap":
+        """
+        Opens a segment another process built
+
+        param: segment name
+
+        return: HashMap reading the segment
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            segment = _attach_untracked(name)
+        return cls(segment, False)
+
+    def get_name(self) -> str:
+        """Return the name other processes attach with"""
+        return self._segment.name
+
+    def close(self) -> None:
+        """
+        Stops reading the segment in this process
+
+        param: None
+
+        return: None
+        """
+        if self._buffer is not None:
+            self._buffer = None
+            self._segment.close()
+
+    def unlink(self) -> None:
+        """
+        Closes the segment and frees it once every process has closed it,
+        only the process that built it should call this
+
+        param: None
+
+        return: None
+        """
+        self.close()
+        if self._owner:
+            self._segment.unlink()
+            self._owner = False
+
+    def __enter__(self) -> "HashMap":
+        """Use the map in a with block"""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Unlink when the builder leaves the with block, close otherwise"""
+        self.unlink()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches without registering the segment with the resource tracker.
+    Before Python 3.13 every attach is registered, and a tracker that outlives
+    the builder unlinks the segment when the attaching process exits.
+
+    param: segment name
+
+    return: SharedMemory
+    """
+    register = resource_tracker.register
+
+    def skip_shared_memory(resource_name: str, rtype: str) -> None:
+        if rtype != 'shared_memory':
+            register(resource_name, rtype)
+
+    resource_tracker.register = skip_shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _reader(name: str, queue) -> None:
+    """Child process of the basic testing below"""
+    shared = HashMap.attach(name)
+    queue.put((shared.get('str7'), shared.contains_key('str999'), shared.get_size()))
+    shared.close()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+    from multiprocessing import Process, Queue
+    from hash_map_oa import HashMap as OpenAddressingHashMap
+
+    print("\nShared - build from an OA HashMap")
+    print("---------------------------------")
+    m = OpenAddressingHashMap(53, hash_function_2)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+
+    with HashMap.build(m) as shared:
+        print(shared.get_size(), shared.get_capacity(), round(shared.table_load(), 2))
+        print(all(shared.get('str' + str(i)) == i * 100 for i in range(150)))
+
+        print("\nShared - read from another process")
+        print("----------------------------------")
+        queue = Queue()
+        process = Process(target=_reader, args=(shared.get_name(), queue))
+        process.start()
+        print(queue.get())
+        process.join()
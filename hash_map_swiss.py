@@ -0,0 +1,471 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Hash Map Implementation - Open Addressing with Swiss table control bytes.
+#              Every slot has a control byte that is EMPTY, DELETED or 7 bits
+#              of its key's hash. Slots are probed a group of eight at a
+#              time: the group's control bytes are read as one 64-bit int and
+#              compared with a key's 7 bits in a few int operations, so a key is
+#              only compared with the keys of slots whose fragment matched.
+
+
+import struct
+
+from a6_include import DynamicArray, hash_function_1, hash_function_2
+from hash_functions import mix_low_bits
+from primes import next_power_of_two
+
+
+# slots per group, one control byte each, so a group is one 64-bit word
+GROUP_WIDTH = 8
+
+# control byte states, a full slot holds a 7-bit hash fragment (high bit clear)
+EMPTY = 0x80
+DELETED = 0xfe
+
+# 0x01 and 0x80 repeated in every byte of a group word
+LSBS = 0x0101010101010101
+MSBS = 0x8080808080808080
+
+_unpack_group = struct.Struct('<Q').unpack_from
+
+
+def match_fragment(word: int, fragment: int) -> int:
+    """
+    Flags the bytes of a group word equal to the fragment, the high bit of a
+    flagged byte is set. A byte right above a match can be flagged as well,
+    so flagged slots are candidates that still need a key comparison.
+    """
+    x = word ^ (LSBS * fragment)
+    return (x - LSBS) & ~x & MSBS
+
+
+def match_empty(word: int) -> int:
+    """Flags the EMPTY bytes of a group word, the only bytes with bit 7 set and bit 1 clear"""
+    return word & (~word << 6) & MSBS
+
+
+def match_free(word: int) -> int:
+    """Flags the EMPTY and DELETED bytes of a group word"""
+    return word & MSBS
+
+
+class HashMap:
+    """
+    Open addressing HashMap in the style of a Swiss table. Control bytes,
+    keys, values and cached hashes live in parallel arrays. A probe visits
+    whole groups of slots in triangular order over a power of two number of
+    groups, and stops at the first group that still has an EMPTY slot.
+    """
+
+    # live slots plus DELETED slots put keeps the table under
+    max_load = .875
+
+    def __init__(self, capacity: int = 16, function: callable = hash_function_1) -> None:
+        """
+        Initialize new HashMap that probes groups of control bytes
+        """
+        self._hash_function = function
+        self._allocate(capacity)
+        self._size = 0
+        self._deleted = 0
+
+        # bumped on every structural change so running iterators can detect it
+        self._version = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            if self._control[i] < EMPTY:
+                out += str(i) + ': K: ' + str(self._keys[i]) + ' V: ' + str(self._values[i]) + '\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Creates empty arrays with at least capacity slots, a power of two and one group at least
+
+        param: capacity
+
+        return: None
+        """
+        self._capacity = next_power_of_two(max(capacity, GROUP_WIDTH))
+        self._group_mask = self._capacity // GROUP_WIDTH - 1
+        self._control = bytearray((EMPTY,)) * self._capacity
+        self._keys = [None] * self._capacity
+        self._values = [None] * self._capacity
+        self._hashes = [0] * self._capacity
+
+    def get_size(self) -> int:
+        """Return size of map"""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return number of slots"""
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find_index(self, key: str, hash_value: int) -> int:
+        """
+        Probes the groups for the key
+
+        param: key and its hash
+
+        return: index of the slot, or -1 if key is not in the hash map
+        """
+        # the hash is mixed so weak hash functions still spread over groups and fragments,
+        # 7 of the 32 mixed bits are the fragment and the rest pick the group
+        mixed = mix_low_bits(hash_value)
+        fragment = mixed & 0x7f
+        control, keys, mask = self._control, self._keys, self._group_mask
+        group = (mixed >> 7) & mask
+        step = 0
+
+        while True:
+            start = group * GROUP_WIDTH
+            word = _unpack_group(control, start)[0]
+
+            # only slots whose fragment matched are compared, removed keys are None
+            match = match_fragment(word, fragment)
+            while match:
+                bit = match & -match
+                index = start + ((bit.bit_length() - 1) >> 3)
+                if keys[index] == key:
+                    return index
+                match ^= bit
+
+            # the key would have been stored in this group's EMPTY slot, so it is not further along
+            if match_empty(word):
+                return -1
+
+            step += 1
+            group = (group + step) & mask
+
+    def _insert(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Stores a key that is not in the map in the first free slot of its probe sequence
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+        mixed = mix_low_bits(hash_value)
+        control, mask = self._control, self._group_mask
+        group = (mixed >> 7) & mask
+        step = 0
+
+        while True:
+            start = group * GROUP_WIDTH
+            free = match_free(_unpack_group(control, start)[0])
+            if free:
+                index = start + (((free & -free).bit_length() - 1) >> 3)
+                break
+            step += 1
+            group = (group + step) & mask
+
+        if control[index] == DELETED:
+            self._deleted -= 1
+        control[index] = mixed & 0x7f
+        self._keys[index] = key
+        self._values[index] = value
+        self._hashes[index] = hash_value
+
+    def _trace(self, key: str) -> (int, int):
+        """
+        Follows the probe sequence of a lookup of the key
+
+        param: key
+
+        return: groups inspected and keys compared
+        """
+        mixed = mix_low_bits(self._hash_function(key))
+        fragment = mixed & 0x7f
+        group = (mixed >> 7) & self._group_mask
+        groups = comparisons = step = 0
+
+        while True:
+            start = group * GROUP_WIDTH
+            word = _unpack_group(self._control, start)[0]
+            groups += 1
+
+            match = match_fragment(word, fragment)
+            while match:
+                bit = match & -match
+                comparisons += 1
+                if self._keys[start + ((bit.bit_length() - 1) >> 3)] == key:
+                    return groups, comparisons
+                match ^= bit
+
+            if match_empty(word):
+                return groups, comparisons
+
+            step += 1
+            group = (group + step) & self._group_mask
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates key value pairs in the hash map
+
+        param: key and value
+
+        return: None
+        """
+        self._put(key, value, self._hash_function(key))
+
+    def _put(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Updates key value pairs in the hash map using an already computed hash
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+        index = self._find_index(key, hash_value)
+        if index != -1:
+            self._values[index] = value
+            return
+
+        # a table that is mostly DELETED slots is rebuilt at the same size, a full one doubles
+        if self._size + self._deleted + 1 > self._capacity * self.max_load:
+            if (self._size + 1) * 2 > self._capacity * self.max_load:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        self._insert(key, value, hash_value)
+        self._size += 1
+        self._version += 1
+
+    def get(self, key: str) -> object:
+        """
+        Returns value associated with the key
+
+        param: key
+
+        return: value of the key, or None if the key is not in the hash map
+        """
+        index = self._find_index(key, self._hash_function(key))
+        if index == -1:
+            return None
+        return self._values[index]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if key is in the hash and false otherwise
+
+        param: key
+
+        return: bool
+        """
+        return self._find_index(key, self._hash_function(key)) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map
+
+        param: key
+
+        return: None
+        """
+        index = self._find_index(key, self._hash_function(key))
+        if index == -1:
+            return
+
+        # every probe through a group that still has an EMPTY slot stops there,
+        # so such a slot can go back to EMPTY instead of becoming DELETED
+        start = index - index % GROUP_WIDTH
+        if match_empty(_unpack_group(self._control, start)[0]):
+            self._control[index] = EMPTY
+        else:
+            self._control[index] = DELETED
+            self._deleted += 1
+
+        self._keys[index] = None
+        self._values[index] = None
+        self._size -= 1
+        self._version += 1
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of groups a lookup of the key inspects
+
+        param: key
+
+        return: int of inspected groups
+        """
+        return self._trace(key)[0]
+
+    def key_comparisons(self, key: str) -> int:
+        """
+        Returns the number of stored keys a lookup of the key is compared with
+
+        param: key
+
+        return: int of key comparisons
+        """
+        return self._trace(key)[1]
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the internal hash table, DELETED slots are dropped
+
+        param: new capacity
+
+        return: None
+        """
+        if new_capacity < self._size:
+            return
+
+        # the table keeps at least one EMPTY slot per probe sequence
+        while self._size > new_capacity * self.max_load:
+            new_capacity *= 2
+
+        control, keys, values, hashes = self._control, self._keys, self._values, self._hashes
+        self._allocate(new_capacity)
+        self._deleted = 0
+        self._version += 1
+
+        # cached hashes are reused, so no key is hashed again
+        for index in range(len(control)):
+            if control[index] < EMPTY:
+                self._insert(keys[index], values[index], hashes[index])
+
+    def table_load(self) -> float:
+        """
+        Returns current load factor of hash table
+
+        param: None
+
+        return: float indicating load factor
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Method returns number of EMPTY slots
+
+        param: None
+
+        return: int of tallied empty slots
+        """
+        return self._control.count(EMPTY)
+
+    def clear(self) -> None:
+        """
+        Clears contents of the hash map
+
+        param: None
+
+        return: None
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+        self._deleted = 0
+        self._version += 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns da with tuples containing key/value pairs
+
+        param: None
+
+        return: da
+        """
+        arr = DynamicArray()
+        for item in self.items():
+            arr.append(item)
+        return arr
+
+    def _live_indices(self):
+        """
+        Generator over the indices of full slots, each call keeps its own position
+
+        param: None
+
+        return: generator of slot indices
+        """
+        version = self._version
+        control = self._control
+        for index in range(len(control)):
+            if control[index] < EMPTY:
+                yield index
+                if self._version != version:
+                    raise RuntimeError('HashMap changed size during iteration')
+
+    def keys(self):
+        """
+        Iterates over the keys
+
+        param: None
+
+        return: generator of keys
+        """
+        for index in self._live_indices():
+            yield self._keys[index]
+
+    def values(self):
+        """
+        Iterates over the values
+
+        param: None
+
+        return: generator of values
+        """
+        for index in self._live_indices():
+            yield self._values[index]
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        for index in self._live_indices():
+            yield self._keys[index], self._values[index]
+
+    def __iter__(self):
+        """
+        Method enables the hash map to iterate across itself,
+        every loop gets its own independent iterator
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        return self.items()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nSwiss table - put and get")
+    print("-------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    print(all(m.get('str' + str(i)) == i * 100 for i in range(150)))
+    print(max(m.key_comparisons('str' + str(i)) for i in range(150)),
+          max(m.probe_length('missing' + str(i)) for i in range(150)))
+
+    print("\nSwiss table - remove")
+    print("--------------------")
+    m = HashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    m.remove('4')
+    print(m)
+    print(m.get_keys_and_values())
+    print(m.contains_key('1'), m.contains_key('2'), m.get('5'))
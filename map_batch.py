@@ -0,0 +1,72 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Batch put/get/remove shared by both HashMaps (SC & OA).
+#              Each map only provides _reserve, which grows the table once for
+#              the whole batch, and _put, which takes an already computed hash.
+
+
+from a6_include import DynamicArray
+
+
+def as_list(items) -> list:
+    """
+    Copies the items of an iterable or a DynamicArray into a list
+
+    param: iterable or da
+
+    return: list of items
+    """
+    # DynamicArray deliberately disables iteration, so it is copied by index
+    if isinstance(items, DynamicArray):
+        return [items[num] for num in range(items.length())]
+    return list(items)
+
+
+def put_pairs(m, pairs) -> None:
+    """
+    Updates every key/value pair, growing the table at most once up front
+
+    param: HashMap and iterable or da of (key, value) tuples
+
+    return: None
+    """
+    pairs = as_list(pairs)
+    m._reserve(len(pairs))
+
+    # tight loop with the hash function and _put looked up once
+    hash_function, put = m._hash_function, m._put
+    for key, value in pairs:
+        put(key, value, hash_function(key))
+
+
+def get_values(m, keys) -> DynamicArray:
+    """
+    Returns the values associated with each key, in the order given
+
+    param: HashMap and iterable or da of keys
+
+    return: da of values, None where a key is missing
+    """
+    arr = DynamicArray()
+    get = m.get
+    for key in as_list(keys):
+        arr.append(get(key))
+    return arr
+
+
+def remove_keys(m, keys) -> int:
+    """
+    Removes every given key from the hash map
+
+    param: HashMap and iterable or da of keys
+
+    return: int of keys that were removed
+    """
+    size = m.get_size()
+    remove = m.remove
+    for key in as_list(keys):
+        remove(key)
+    return size - m.get_size()
@@ -0,0 +1,72 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Runtime counters for both HashMaps (SC & OA).
+#              A HashMap only holds a MapStats while stats are enabled, so the
+#              disabled cost is a single "is not None" check per operation.
+
+
+import time
+
+
+class MapStats:
+    """
+    Counters a HashMap updates while its stats are enabled
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        # index i holds how many lookups inspected i buckets
+        self.hit_probes = [0]
+        self.miss_probes = [0]
+
+        self.bucket_collisions = 0
+        self.resizes = 0
+        self.purges = 0
+        self.rehash_seconds = 0.0
+
+        # nested resizes are timed once, by the outermost call
+        self._rehash_depth = 0
+        self._rehash_start = 0.0
+
+    def record_probe(self, hit: bool, length: int) -> None:
+        """Count one lookup that inspected length buckets."""
+        histogram = self.hit_probes if hit else self.miss_probes
+        while len(histogram) <= length:
+            histogram.append(0)
+        histogram[length] += 1
+
+    def start_rehash(self) -> None:
+        """Mark the start of a resize, purge or migration step."""
+        if self._rehash_depth == 0:
+            self._rehash_start = time.perf_counter()
+        self._rehash_depth += 1
+
+    def end_rehash(self) -> None:
+        """Mark the end of a resize, purge or migration step."""
+        self._rehash_depth -= 1
+        if self._rehash_depth == 0:
+            self.rehash_seconds += time.perf_counter() - self._rehash_start
+
+    def as_dict(self) -> dict:
+        """Return the counters as a plain dict."""
+        return {
+            'hit_probes': histogram_dict(self.hit_probes),
+            'miss_probes': histogram_dict(self.miss_probes),
+            'bucket_collisions': self.bucket_collisions,
+            'resizes': self.resizes,
+            'purges': self.purges,
+            'rehash_seconds': self.rehash_seconds,
+        }
+
+
+def histogram_dict(histogram: list) -> dict:
+    """Turn a list histogram into a {length: count} dict without the zero counts."""
+    return {length: count for length, count in enumerate(histogram) if count}
+
+
+def hash_collisions(hashes: list) -> int:
+    """Count entries whose full hash is shared with an entry earlier in the list."""
+    return len(hashes) - len(set(hashes))
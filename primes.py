@@ -0,0 +1,94 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Prime table used to pick HashMap capacities.
+#              A small sieve, built the first time a capacity is picked, turns
+#              every prime check and every "next prime" search below
+#              PRIME_LIMIT into a table lookup. Larger numbers are checked with
+#              Miller-Rabin instead of trial division.
+
+
+PRIME_LIMIT = 1 << 16
+
+# Miller-Rabin with these bases is exact for every number below 3.3 * 10^24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# built on first use, so importing a map costs nothing in processes that never resize
+_sieve = None
+
+
+def _build_sieve(limit: int) -> bytearray:
+    """Sieve of Eratosthenes, sieve[n] is 1 exactly when n is prime"""
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    factor = 2
+    while factor * factor < limit:
+        if sieve[factor]:
+            sieve[factor * factor::factor] = bytes(len(range(factor * factor, limit, factor)))
+        factor += 1
+    return sieve
+
+
+def _get_sieve() -> bytearray:
+    """Returns the sieve, building it on the first call"""
+    global _sieve
+    if _sieve is None:
+        _sieve = _build_sieve(PRIME_LIMIT)
+    return _sieve
+
+
+def _miller_rabin(number: int) -> bool:
+    """Determine if an odd number past the sieve is prime"""
+    odd, twos = number - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        twos += 1
+
+    for witness in _WITNESSES:
+        x = pow(witness, odd, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(twos - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(number: int) -> bool:
+    """Determine if given integer is a prime number and return boolean"""
+    if 0 <= number < PRIME_LIMIT:
+        return _get_sieve()[number] == 1
+
+    if number < 2 or number % 2 == 0:
+        return False
+    return _miller_rabin(number)
+
+
+def next_prime(capacity: int) -> int:
+    """
+    Returns the smallest odd prime that is at least capacity,
+    matching what HashMap._next_prime has always returned
+    """
+    # 2 is never returned, every odd prime is 3 or more
+    capacity = max(capacity, 3)
+    if capacity < PRIME_LIMIT:
+        index = _get_sieve().find(1, capacity)
+        if index != -1:
+            return index
+        capacity = PRIME_LIMIT
+
+    if capacity % 2 == 0:
+        capacity += 1
+    while not is_prime(capacity):
+        capacity += 2
+    return capacity
+
+
+def next_power_of_two(capacity: int) -> int:
+    """Returns the smallest power of two that is at least capacity"""
+    return 1 << max(capacity - 1, 1).bit_length()
@@ -0,0 +1,295 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Fixed memory frequency sketches and an approximate find_mode.
+#              Count-Min bounds how often any key was seen, Space-Saving keeps
+#              the keys that can be heavy hitters, and together they name the
+#              likely modes of a stream without a HashMap entry per distinct key.
+
+
+from array import array
+import heapq
+import math
+
+from a6_include import DynamicArray
+from hash_functions import make_hash_mix
+import hash_map_sc
+
+
+class CountMinSketch:
+    """
+    depth rows of width counters. A key adds to one counter per row, and its
+    estimate is the smallest of those counters, which is never below the true
+    count and, with probability 1 - delta, at most epsilon * total above it.
+    """
+
+    def __init__(self, width: int, depth: int, seed: int = 0) -> None:
+        """
+        Initialize an empty sketch, rows are indexed by double hashing a
+        64-bit hash_mix value made with the given seed
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1")
+
+        self._width = width
+        self._depth = depth
+        self._hash_function = make_hash_mix(seed)
+        self._counters = array('Q', bytes(8 * width * depth))
+        self._total = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float, seed: int = 0) -> "CountMinSketch":
+        """
+        Builds a sketch whose estimates are within epsilon * total of the true
+        count with probability at least 1 - delta
+
+        param: relative error, failure probability and seed
+
+        return: CountMinSketch
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    def get_width(self) -> int:
+        """Return the number of counters per row"""
+        return self._width
+
+    def get_depth(self) -> int:
+        """Return the number of rows"""
+        return self._depth
+
+    def get_total(self) -> int:
+        """Return the sum of every count added"""
+        return self._total
+
+    def error_bound(self) -> int:
+        """Return how far above the true count an estimate can be, epsilon * total"""
+        return math.ceil(math.e / self._width * self._total)
+
+    def _indices(self, hash_value: int):
+        """
+        Yields the counter of every row for a hash, row i uses h1 + i * h2
+
+        param: 64-bit hash of the key
+
+        return: generator of indices into the flat counter array
+        """
+        width = self._width
+        low = hash_value & 0xffffffff
+        step = (hash_value >> 32) | 1
+        for row in range(self._depth):
+            yield row * width + (low + row * step) % width
+
+    def add_hashed(self, hash_value: int, count: int = 1) -> int:
+        """
+        Adds count to a key given its hash_mix value
+
+        param: hash of the key from hash_function() and amount to add
+
+        return: the new estimate of the key
+        """
+        counters = self._counters
+        estimate = None
+        for index in self._indices(hash_value):
+            counters[index] += count
+            if estimate is None or counters[index] < estimate:
+                estimate = counters[index]
+        self._total += count
+        return estimate
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Adds count to a key
+
+        param: key and amount to add
+
+        return: the new estimate of the key
+        """
+        return self.add_hashed(self._hash_function(key), count)
+
+    def estimate(self, key: str) -> int:
+        """
+        Returns an upper bound on how often the key was added
+
+        param: key
+
+        return: int estimate
+        """
+        counters = self._counters
+        return min(counters[index] for index in self._indices(self._hash_function(key)))
+
+    def hash_function(self):
+        """Return the hash function the rows are indexed with"""
+        return self._hash_function
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitter summary with a fixed number of monitored keys.
+    A new key takes over the smallest counter and inherits its count as error,
+    so for every monitored key count - error <= true count <= count, and every
+    key seen more than total / capacity times is monitored.
+    """
+
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize an empty summary that monitors at most capacity keys
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._capacity = capacity
+
+        # key -> [count, error], a chaining map never leaves tombstones behind evictions
+        self._counters = hash_map_sc.HashMap(capacity * 2, function)
+
+        # (count, key) entries, stale ones are skipped when popped and purged when too many
+        self._heap = []
+        self._total = 0
+
+    def get_total(self) -> int:
+        """Return the sum of every count added"""
+        return self._total
+
+    def add_hashed(self, key: str, hash_value: int, count: int = 1) -> None:
+        """
+        Adds count to a key whose hash was already computed with the summary's function
+
+        param: key, hash of the key and amount to add
+
+        return: None
+        """
+        counters = self._counters
+        self._total += count
+
+        node = counters._find_node(key, hash_value)
+        if node is not None:
+            node.value[0] += count
+            heapq.heappush(self._heap, (node.value[0], key))
+
+        elif counters.get_size() < self._capacity:
+            counters._put(key, [count, 0], hash_value)
+            heapq.heappush(self._heap, (count, key))
+
+        else:
+            # the smallest monitored count is handed to the new key as its error
+            smallest, evicted = self._pop_smallest()
+            counters.remove(evicted)
+            counters._put(key, [smallest + count, smallest], hash_value)
+            heapq.heappush(self._heap, (smallest + count, key))
+
+        # stale heap entries are dropped once they outnumber the live ones
+        if len(self._heap) > 4 * self._capacity:
+            self._heap = [(value[0], monitored) for monitored, value in counters.items()]
+            heapq.heapify(self._heap)
+
+    def add(self, key: str, count: int = 1) -> None:
+        """
+        Adds count to a key
+
+        param: key and amount to add
+
+        return: None
+        """
+        self.add_hashed(key, self._counters._hash_function(key), count)
+
+    def _pop_smallest(self) -> (int, str):
+        """
+        Pops the monitored key with the smallest count
+
+        param: None
+
+        return: its count and the key
+        """
+        while True:
+            count, key = heapq.heappop(self._heap)
+            value = self._counters.get(key)
+            if value is not None and value[0] == count:
+                return count, key
+
+    def candidates(self) -> list:
+        """
+        Returns every monitored key with bounds on its true count
+
+        param: None
+
+        return: list of (key, lower bound, upper bound), largest upper bound first
+        """
+        out = [(key, value[0] - value[1], value[0]) for key, value in self._counters.items()]
+        out.sort(key=lambda candidate: (-candidate[2], -candidate[1]))
+        return out
+
+
+def find_mode_approx(da, width: int = None, depth: int = None, epsilon: float = .001,
+                     delta: float = .01, candidates: int = None,
+                     seed: int = 0) -> (DynamicArray, int, int):
+    """
+    Approximate find_mode in fixed memory. Keys go through a Count-Min sketch
+    and a Space-Saving summary that share one hash_mix value per key
+
+    param: da or any iterable of keys, sketch size as width and depth or as
+           epsilon and delta (width and depth win when given), number of
+           Space-Saving counters (1 / epsilon when None) and hash seed
+
+    return: da of the keys that can still be the mode, most frequent first,
+            the estimated frequency of the first one, and the error: its true
+            frequency is between frequency - error and frequency
+    """
+    if width is not None or depth is not None:
+        sketch = CountMinSketch(width or math.ceil(math.e / epsilon),
+                                depth or math.ceil(math.log(1 / delta)), seed)
+    else:
+        sketch = CountMinSketch.from_error(epsilon, delta, seed)
+
+    if candidates is None:
+        candidates = math.ceil(1 / epsilon)
+    function = sketch.hash_function()
+    summary = SpaceSaving(candidates, function)
+
+    if isinstance(da, DynamicArray):
+        keys = (da[num] for num in range(da.length()))
+    else:
+        keys = da
+
+    # each key is hashed once and the hash indexes both structures
+    add_sketch, add_summary = sketch.add_hashed, summary.add_hashed
+    for key in keys:
+        hash_value = function(key)
+        add_sketch(hash_value)
+        add_summary(key, hash_value)
+
+    if summary.get_total() == 0:
+        return DynamicArray(), 0, 0
+
+    # both structures only overcount, so the smaller upper bound is kept
+    bounded = []
+    for key, lower, upper in summary.candidates():
+        bounded.append((key, lower, min(upper, sketch.estimate(key))))
+
+    # a key can be the mode when its upper bound reaches the best lower bound
+    best_lower = max(lower for key, lower, upper in bounded)
+    modes = [candidate for candidate in bounded if candidate[2] >= best_lower]
+    modes.sort(key=lambda candidate: (-candidate[2], -candidate[1]))
+
+    key, lower, frequency = modes[0]
+    return DynamicArray([candidate[0] for candidate in modes]), frequency, frequency - lower
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+    import random
+    from hash_map_sc import find_mode
+
+    print("\nApproximate mode of a Zipf-like stream")
+    print("--------------------------------------")
+    rng = random.Random(0)
+    stream = ['user' + str(int(rng.paretovariate(1.2))) for _ in range(50000)]
+
+    exact_modes, exact_frequency = find_mode(DynamicArray(stream))
+    modes, frequency, error = find_mode_approx(stream, epsilon=.01)
+    print(f"exact : {exact_modes}, Frequency: {exact_frequency}")
+    print(f"approx: {modes}, Frequency: {frequency} (-{error})")
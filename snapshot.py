@@ -0,0 +1,220 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Streaming binary snapshots for both HashMaps (SC & OA).
+#
+#              header   magic, format version, flags, hash function id,
+#                       size and capacity of the dumped map (HEADER), the
+#                       flags also record the map's power_of_two and
+#                       incremental options
+#              records  size records of u32 key length, u32 value length,
+#                       the u64 cached hash when FLAG_HASHES is set, the
+#                       UTF-8 key and the value in the table_format codec
+#
+#              Values the codec cannot store are pickled under TAG_PICKLE.
+
+
+import pickle
+import struct
+
+from hash_functions import MASK_64
+from table_format import HASH_FUNCTION_IDS, decode_value, encode_value
+
+
+MAGIC = b'HMSN'
+FORMAT_VERSION = 1
+
+# magic, format version, flags, hash function id, size, capacity
+HEADER = struct.Struct('<4sHHH6xQQ')
+
+# key length, value length
+RECORD = struct.Struct('<II')
+HASH = struct.Struct('<Q')
+
+# records carry the hash of their key
+FLAG_HASHES = 1
+
+# options of the dumped map, so it is loaded back in the same mode
+FLAG_POWER_OF_TWO = 2
+FLAG_INCREMENTAL = 4
+
+# value tag used when the table_format codec cannot encode a value
+TAG_PICKLE = 0xff
+
+# records are collected into chunks of about this many bytes before each write
+CHUNK_SIZE = 1 << 16
+
+
+class SnapshotError(Exception):
+    """
+    Raised when a stream does not hold a snapshot in this format
+    """
+    pass
+
+
+def _function_id(function) -> int:
+    """
+    Returns the registered id of a hash function
+
+    param: hash function
+
+    return: int id, or 0 when the function is not registered
+    """
+    for function_id, known in HASH_FUNCTION_IDS.items():
+        if known is function:
+            return function_id
+    return 0
+
+
+def _encode(value: object) -> bytes:
+    """
+    Encodes a value, pickling it when the codec has no tag for its type
+
+    param: value
+
+    return: bytes
+    """
+    try:
+        return encode_value(value)
+    except TypeError:
+        return bytes((TAG_PICKLE,)) + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(data: bytes, allow_pickle: bool) -> object:
+    """
+    Decodes a value written by _encode
+
+    param: encoded bytes and whether pickled values may be loaded
+
+    return: value
+    """
+    if data[0] == TAG_PICKLE:
+        if not allow_pickle:
+            raise SnapshotError("snapshot holds a pickled value and allow_pickle is False")
+        return pickle.loads(data[1:])
+    return decode_value(data, 0)[0]
+
+
+def _read_exactly(fileobj, count: int) -> bytes:
+    """
+    Reads exactly count bytes
+
+    param: binary file object and number of bytes
+
+    return: bytes
+    """
+    data = fileobj.read(count)
+    if len(data) != count:
+        raise SnapshotError("snapshot ends before its last record")
+    return data
+
+
+def dump_entries(fileobj, entries, size: int, capacity: int, function,
+                 include_hashes: bool = True, power_of_two: bool = False,
+                 incremental: bool = False) -> None:
+    """
+    Writes a snapshot one chunk of records at a time
+
+    param: binary file object, iterable of entries with key, value and hash_value,
+           number of entries, capacity and hash function of the map, whether
+           cached hashes are written and the power_of_two and incremental
+           options of the map
+
+    return: None
+    """
+    function_id = _function_id(function)
+
+    # a hash is only worth storing when the loader can tell it came from the same function
+    include_hashes = include_hashes and function_id != 0
+    flags = FLAG_HASHES if include_hashes else 0
+    if power_of_two:
+        flags |= FLAG_POWER_OF_TWO
+    if incremental:
+        flags |= FLAG_INCREMENTAL
+    fileobj.write(HEADER.pack(MAGIC, FORMAT_VERSION, flags, function_id, size, capacity))
+
+    chunk = bytearray()
+    written = 0
+    for entry in entries:
+        key = entry.key.encode()
+        value = _encode(entry.value)
+        chunk += RECORD.pack(len(key), len(value))
+        if include_hashes:
+            chunk += HASH.pack(entry.hash_value & MASK_64)
+        chunk += key
+        chunk += value
+        written += 1
+
+        if len(chunk) >= CHUNK_SIZE:
+            fileobj.write(chunk)
+            chunk = bytearray()
+
+    if written != size:
+        raise SnapshotError(f"map reported {size} entries but yielded {written}")
+    fileobj.write(chunk)
+
+
+def read_header(fileobj) -> (int, int, int, int):
+    """
+    Reads and checks the snapshot header
+
+    param: binary file object
+
+    return: flags, hash function id, size and capacity
+    """
+    magic, version, flags, function_id, size, capacity = HEADER.unpack(
+        _read_exactly(fileobj, HEADER.size))
+    if magic != MAGIC:
+        raise SnapshotError("stream does not start with a snapshot header")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"unsupported snapshot format version {version}")
+    return flags, function_id, size, capacity
+
+
+def load_into(map_class, fileobj, function=None, allow_pickle: bool = True):
+    """
+    Builds a map of map_class from a snapshot, sized from the header up front
+    and created with the options of the dumped map
+
+    param: HashMap class, binary file object, hash function (the one recorded in
+           the header when omitted) and whether pickled values may be loaded,
+           pass False for snapshots from untrusted sources
+
+    return: new HashMap
+    """
+    flags, function_id, size, capacity = read_header(fileobj)
+
+    if function is None:
+        if function_id not in HASH_FUNCTION_IDS:
+            raise SnapshotError("snapshot has no registered hash function, pass function")
+        function = HASH_FUNCTION_IDS[function_id]
+
+    # stored hashes are reused only when they were made by this very function
+    has_hashes = flags & FLAG_HASHES
+    use_hashes = has_hashes and function_id != 0 and HASH_FUNCTION_IDS.get(function_id) is function
+
+    # only options that are set are passed, maps without them take fewer arguments
+    options = {}
+    if flags & FLAG_POWER_OF_TWO:
+        options['power_of_two'] = True
+    if flags & FLAG_INCREMENTAL:
+        options['incremental'] = True
+
+    m = map_class(capacity, function, **options)
+    m._reserve(size)
+
+    put = m._put
+    record_size = RECORD.size + (HASH.size if has_hashes else 0)
+    for _ in range(size):
+        record = _read_exactly(fileobj, record_size)
+        key_length, value_length = RECORD.unpack_from(record, 0)
+        key = str(_read_exactly(fileobj, key_length), 'utf-8')
+        value = _decode(_read_exactly(fileobj, value_length), allow_pickle)
+
+        if use_hashes:
+            put(key, value, HASH.unpack_from(record, RECORD.size)[0])
+        else:
+            put(key, value, function(key))
+    return m
@@ -0,0 +1,196 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Sorted array bucket for the chaining HashMap (SC). A chain that
+#              grows too long is swapped for one of these, so a bucket full of
+#              colliding keys is searched by bisection instead of walked node
+#              by node.
+
+
+from bisect import bisect_left, bisect_right
+
+from a6_include import LinkedList, SLNode
+
+
+# key types whose values are totally ordered among themselves, NaN aside
+SORTABLE_TYPES = (str, int, float)
+
+
+class SortedBucket:
+    """
+    Bucket holding its nodes in an array sorted by hash, and by key among
+    nodes with equal hashes. It has the same insert, remove, contains, length
+    and iterator methods as LinkedList, so the HashMap can use either one as
+    a bucket. Lookups bisect the hashes and then the keys of the matching
+    run, so keys with equal hashes are found in O(log n) too. Bisection only
+    finds keys whose order is total, so a bucket is only built from keys of
+    one type in SORTABLE_TYPES. A key of another type, or NaN, leaves the
+    bucket unordered and scanned linearly until the HashMap turns it back
+    into a chain.
+    """
+
+    def __init__(self, nodes=()) -> None:
+        """
+        Initialize a bucket holding the given nodes, e.g. the nodes of a LinkedList,
+        which must pass sortable
+        """
+        nodes = sorted(nodes, key=lambda node: (node.hash_value, node.key))
+        self._key_type = type(nodes[0].key) if nodes else None
+        self._ordered = True
+
+        self._nodes = nodes
+        self._hashes = [node.hash_value for node in nodes]
+        self._keys = [node.key for node in nodes]
+
+    @staticmethod
+    def sortable(nodes) -> bool:
+        """
+        Returns whether the keys of the nodes can be kept in a sorted bucket
+
+        param: iterable of nodes, e.g. a LinkedList
+
+        return: True if every key has the same type in SORTABLE_TYPES and none is NaN
+        """
+        key_type = None
+        for node in nodes:
+            key = node.key
+            if key_type is None:
+                key_type = type(key)
+                if key_type not in SORTABLE_TYPES:
+                    return False
+            # NaN is the one float that is not equal to itself
+            if type(key) is not key_type or key != key:
+                return False
+        return True
+
+    def is_ordered(self) -> bool:
+        """Return whether every key so far could be kept in sorted order."""
+        return self._ordered
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return 'SB [' + ' -> '.join(str(node) for node in self._nodes) + ']'
+
+    def __iter__(self):
+        """Return an iterator over the nodes in bucket order."""
+        return iter(self._nodes)
+
+    def _run(self, hash_value: int) -> (int, int):
+        """Return the start and end of the nodes with the hash"""
+        start = bisect_left(self._hashes, hash_value)
+        return start, bisect_right(self._hashes, hash_value, start)
+
+    def _index(self, key: str, hash_value: int) -> int:
+        """
+        Finds the position of a key
+
+        param: key and hash of the key
+
+        return: index of the node, or -1 if no match
+        """
+        keys = self._keys
+        if not self._ordered:
+            for index in range(len(keys)):
+                if self._hashes[index] == hash_value and keys[index] == key:
+                    return index
+            return -1
+
+        start, end = self._run(hash_value)
+        if type(key) is self._key_type:
+            index = bisect_left(keys, key, start, end)
+            if index < end and keys[index] == key:
+                return index
+            return -1
+
+        # a key of another type, like 1.0 in a bucket of ints, can still be equal to one of them
+        for index in range(start, end):
+            if keys[index] == key:
+                return index
+        return -1
+
+    def insert(self, key: str, value: object, hash_value: int) -> None:
+        """
+        Inserts a key that is not in the bucket yet at its sorted position
+
+        param: key, value and hash of the key
+
+        return: None
+        """
+        if not self._ordered or type(key) is not self._key_type or key != key:
+            # from now on the nodes are kept in no particular order and scanned
+            self._ordered = False
+            index = len(self._nodes)
+        else:
+            start, end = self._run(hash_value)
+            index = bisect_left(self._keys, key, start, end)
+
+        self._hashes.insert(index, hash_value)
+        self._keys.insert(index, key)
+        self._nodes.insert(index, SLNode(key, value, None, hash_value))
+
+    def remove(self, key: str, hash_value: int) -> bool:
+        """
+        Removes the node with a matching key
+
+        param: key and hash of the key
+
+        return: True if removal was successful, False otherwise
+        """
+        index = self._index(key, hash_value)
+        if index == -1:
+            return False
+        del self._hashes[index]
+        del self._keys[index]
+        del self._nodes[index]
+        return True
+
+    def contains(self, key: str, hash_value: int) -> SLNode:
+        """
+        Returns the node with a matching key
+
+        param: key and hash of the key
+
+        return: SLNode, or None if no match
+        """
+        index = self._index(key, hash_value)
+        if index == -1:
+            return None
+        return self._nodes[index]
+
+    def length(self) -> int:
+        """Return the number of nodes in the bucket."""
+        return len(self._nodes)
+
+    def to_linked_list(self) -> LinkedList:
+        """
+        Returns a LinkedList holding the same keys, values and hashes
+
+        param: None
+
+        return: LinkedList
+        """
+        out = LinkedList()
+        for node in reversed(self._nodes):
+            out.insert(node.key, node.value, node.hash_value)
+        return out
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+    from hash_map_sc import HashMap
+
+    print("\nSorted buckets - anagram keys")
+    print("-----------------------------")
+    m = HashMap(11)
+    word = 'abcdefgh'
+    keys = [word[i:] + word[:i] for i in range(len(word))] + [word[::-1], 'hgfedcab', 'ghfedcba']
+    for num, key in enumerate(keys):
+        m.put(key, num)
+    print(m.stats()['longest_chain'], m.stats()['sorted_buckets'])
+    print(all(m.get(key) == num for num, key in enumerate(keys)))
+    for key in keys[:6]:
+        m.remove(key)
+    print(m.stats()['sorted_buckets'], m.get_keys_and_values())
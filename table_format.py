@@ -0,0 +1,354 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Fixed binary layout of a read-only open addressing table.
+#              The same bytes can live in shared memory or in a file, and any
+#              process can probe them in place without copying or unpickling.
+#
+#              header   magic, format version, hash function id, capacity,
+#                       size and blob length (HEADER)
+#              slots    capacity records of (64-bit hash, record offset) (SLOT),
+#                       offset 0 marks an empty slot
+#              blob     one record per key: u32 key length, UTF-8 key, then
+#                       the value as a one byte type tag and its payload
+#
+#              Slots are filled with the same quadratic probing over a prime
+#              capacity as hash_map_oa, at a load of at most .5.
+
+
+import struct
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import MASK_64, hash_builtin, hash_fnv1a, hash_mix
+from primes import next_prime
+
+
+MAGIC = b'HMOA'
+FORMAT_VERSION = 1
+
+# magic, format version, hash function id, capacity, size, blob length
+HEADER = struct.Struct('<4sHHQQQ')
+
+# hash of the key, offset of its record from the start of the table
+SLOT = struct.Struct('<QQ')
+
+_U32 = struct.Struct('<I')
+_F64 = struct.Struct('<d')
+
+# stored tables name their hash function by id, ids are never reused
+HASH_FUNCTION_IDS = {
+    1: hash_function_1,
+    2: hash_function_2,
+    3: hash_fnv1a,
+    4: hash_mix,
+}
+
+# value type tags
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_BYTES = 6
+
+
+class TableFormatError(Exception):
+    """
+    Raised when bytes do not hold a table in this format
+    """
+    pass
+
+
+def hash_function_id(function) -> int:
+    """
+    Returns the id a hash function is stored under
+
+    param: hash function
+
+    return: int id from HASH_FUNCTION_IDS
+    """
+    if function is hash_builtin:
+        raise ValueError("hash_builtin is salted per process, so its hashes cannot be shared")
+
+    for function_id, known in HASH_FUNCTION_IDS.items():
+        if known is function:
+            return function_id
+    raise ValueError(f"{getattr(function, '__name__', function)!r} has no stable hash function id")
+
+
+def hash_function_from_id(function_id: int):
+    """
+    Returns the hash function stored under an id
+
+    param: int id
+
+    return: hash function
+    """
+    try:
+        return HASH_FUNCTION_IDS[function_id]
+    except KeyError:
+        raise TableFormatError(f"unknown hash function id {function_id}") from None
+
+
+def encode_value(value: object) -> bytes:
+    """
+    Encodes a value as a type tag followed by its payload
+
+    param: None, bool, int, float, str or bytes
+
+    return: bytes
+    """
+    # bool is checked before int since True and False are ints too
+    if value is None:
+        return bytes((TAG_NONE,))
+    if value is False:
+        return bytes((TAG_FALSE,))
+    if value is True:
+        return bytes((TAG_TRUE,))
+    if type(value) is int:
+        data = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+        return bytes((TAG_INT,)) + _U32.pack(len(data)) + data
+    if type(value) is float:
+        return bytes((TAG_FLOAT,)) + _F64.pack(value)
+    if type(value) is str:
+        data = value.encode()
+        return bytes((TAG_STR,)) + _U32.pack(len(data)) + data
+    if type(value) in (bytes, bytearray):
+        return bytes((TAG_BYTES,)) + _U32.pack(len(value)) + bytes(value)
+    raise TypeError(f"values of type {type(value).__name__} cannot be stored in a table")
+
+
+def decode_value(buffer, offset: int) -> (object, int):
+    """
+    Decodes the value that starts at offset
+
+    param: buffer and offset of the type tag
+
+    return: value and the offset just past it
+    """
+    tag = buffer[offset]
+    offset += 1
+
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FLOAT:
+        return _F64.unpack_from(buffer, offset)[0], offset + _F64.size
+
+    if tag in (TAG_INT, TAG_STR, TAG_BYTES):
+        length = _U32.unpack_from(buffer, offset)[0]
+        start = offset + _U32.size
+        end = start + length
+        if tag == TAG_INT:
+            return int.from_bytes(buffer[start:end], 'little', signed=True), end
+        if tag == TAG_STR:
+            return str(buffer[start:end], 'utf-8'), end
+        return bytes(buffer[start:end]), end
+
+    raise TableFormatError(f"unknown value tag {tag}")
+
+
+def source_pairs(source, function=None) -> (object, object):
+    """
+    Resolves what build_image needs from a map or from plain pairs
+
+    param: HashMap or dict with items(), or an iterable of (key, value) tuples,
+           and the hash function (taken from a HashMap source when omitted)
+
+    return: iterable of (key, value) tuples and the hash function
+    """
+    if function is None:
+        function = getattr(source, '_hash_function', None)
+        if function is None:
+            raise ValueError("a hash function is needed unless the source is a HashMap")
+
+    pairs = source.items() if hasattr(source, 'items') else source
+    return pairs, function
+
+
+def build_image(pairs, function) -> bytearray:
+    """
+    Lays out a table holding the pairs
+
+    param: iterable of (key, value) tuples with str keys, and a registered hash function
+
+    return: bytearray with the header, slots and blob
+    """
+    function_id = hash_function_id(function)
+
+    # later pairs win over earlier pairs with the same key, like put
+    records = {}
+    for key, value in pairs:
+        records[key] = value
+
+    size = len(records)
+    capacity = next_prime(size * 2 + 1)
+    blob_start = HEADER.size + capacity * SLOT.size
+
+    slot_hashes = [0] * capacity
+    slot_offsets = [0] * capacity
+    blob = bytearray()
+
+    for key, value in records.items():
+        data = key.encode()
+        hash_value = function(key) & MASK_64
+
+        # same probe sequence as hash_map_oa, keys are distinct so no comparisons are needed
+        q_probe = hash_value % capacity
+        j_counter = 0
+        while slot_offsets[q_probe] != 0:
+            j_counter += 1
+            q_probe = (q_probe + 2 * j_counter - 1) % capacity
+
+        slot_hashes[q_probe] = hash_value
+        slot_offsets[q_probe] = blob_start + len(blob)
+        blob += _U32.pack(len(data)) + data + encode_value(value)
+
+    image = bytearray(blob_start + len(blob))
+    HEADER.pack_into(image, 0, MAGIC, FORMAT_VERSION, function_id, capacity, size, len(blob))
+    for num in range(capacity):
+        if slot_offsets[num]:
+            SLOT.pack_into(image, HEADER.size + num * SLOT.size, slot_hashes[num], slot_offsets[num])
+    image[blob_start:] = blob
+    return image
+
+
+class TableReader:
+    """
+    Read-only HashMap view over a table laid out by build_image.
+    Every lookup probes the buffer in place, nothing is copied up front.
+    """
+
+    def __init__(self, buffer) -> None:
+        """
+        Checks the header and starts reading the table in the buffer
+        """
+        if len(buffer) < HEADER.size:
+            raise TableFormatError("buffer is smaller than a table header")
+
+        magic, version, function_id, capacity, size, blob_length = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise TableFormatError("buffer does not start with a table header")
+        if version != FORMAT_VERSION:
+            raise TableFormatError(f"unsupported table format version {version}")
+        if len(buffer) < HEADER.size + capacity * SLOT.size + blob_length:
+            raise TableFormatError("buffer is shorter than the table it describes")
+
+        self._buffer = buffer
+        self._hash_function = hash_function_from_id(function_id)
+        self._capacity = capacity
+        self._size = size
+
+    def get_size(self) -> int:
+        """Return number of keys in the table"""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return number of slots in the table"""
+        return self._capacity
+
+    def table_load(self) -> float:
+        """Return the load factor of the table"""
+        return self._size / self._capacity
+
+    def _find_record(self, key: str) -> int:
+        """
+        Probes the slots for the key
+
+        param: key
+
+        return: offset just past the key in its record, or -1 if the key is not there
+        """
+        buffer = self._buffer
+        capacity = self._capacity
+        hash_value = self._hash_function(key) & MASK_64
+        data = None
+
+        q_probe = hash_value % capacity
+        j_counter = 0
+        while True:
+            slot_hash, offset = SLOT.unpack_from(buffer, HEADER.size + q_probe * SLOT.size)
+
+            # an empty slot ends the probe sequence
+            if offset == 0:
+                return -1
+
+            # keys are compared in place once the stored hash matches
+            if slot_hash == hash_value:
+                if data is None:
+                    data = key.encode()
+                length = _U32.unpack_from(buffer, offset)[0]
+                start = offset + _U32.size
+                if length == len(data) and buffer[start:start + length] == data:
+                    return start + length
+
+            j_counter += 1
+            q_probe = (q_probe + 2 * j_counter - 1) % capacity
+
+    def get(self, key: str) -> object:
+        """
+        Returns value associated with the key
+
+        param: key
+
+        return: value of the key, or None if the key is not in the table
+        """
+        offset = self._find_record(key)
+        if offset == -1:
+            return None
+        return decode_value(self._buffer, offset)[0]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns true if key is in the table and false otherwise
+
+        param: key
+
+        return: bool
+        """
+        return self._find_record(key) != -1
+
+    def items(self):
+        """
+        Iterates over (key, value) tuples in slot order
+
+        param: None
+
+        return: generator of (key, value) tuples
+        """
+        buffer = self._buffer
+        for num in range(self._capacity):
+            offset = SLOT.unpack_from(buffer, HEADER.size + num * SLOT.size)[1]
+            if offset:
+                length = _U32.unpack_from(buffer, offset)[0]
+                start = offset + _U32.size
+                key = str(buffer[start:start + length], 'utf-8')
+                yield key, decode_value(buffer, start + length)[0]
+
+    def keys(self):
+        """
+        Iterates over the keys in slot order
+
+        param: None
+
+        return: generator of keys
+        """
+        for key, value in self.items():
+            yield key
+
+    def values(self):
+        """
+        Iterates over the values in slot order
+
+        param: None
+
+        return: generator of values
+        """
+        for key, value in self.items():
+            yield value
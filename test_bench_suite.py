@@ -0,0 +1,54 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the benchmark suite
+
+
+import json
+
+import pytest
+
+import bench_suite
+
+
+@pytest.mark.parametrize('workload', bench_suite.WORKLOADS)
+def test_workloads_are_reproducible(workload):
+    ops = bench_suite.build_workload(workload, 50, 3)
+    assert ops == bench_suite.build_workload(workload, 50, 3)
+    assert {op for op, key in ops} <= {'put', 'get', 'remove'}
+
+
+def test_the_seed_changes_the_random_keys():
+    assert bench_suite.build_workload('uniform', 50, 3) != bench_suite.build_workload('uniform', 50, 4)
+
+
+@pytest.mark.parametrize('workload', bench_suite.WORKLOADS)
+def test_every_engine_ends_with_the_same_keys_as_dict(workload):
+    ops = bench_suite.build_workload(workload, 60, 0)
+    expected = bench_suite.DictMap()
+    bench_suite.apply(expected, ops)
+
+    for map_name, function_name, engine, function in bench_suite.engines():
+        m = engine(11, function)
+        bench_suite.apply(m, ops)
+        assert m.get_size() == expected.get_size(), (map_name, function_name)
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = list(range(1, 101))
+    assert bench_suite.percentile(values, .5) == 50
+    assert bench_suite.percentile(values, .99) == 99
+    assert bench_suite.percentile([], .5) == 0.0
+
+
+def test_quick_run_writes_one_result_per_engine(tmp_path, capsys):
+    path = tmp_path / 'results.json'
+    bench_suite.main(['--quick', '--sizes', '40', '--workloads', 'uniform', '--json', str(path)])
+
+    report = json.loads(path.read_text())
+    results = report['results']
+    assert len(results) == len(bench_suite.engines())
+    assert all(result['ops_per_sec'] > 0 and result['p99_ns'] >= result['p50_ns'] for result in results)
+    assert 'wrote' in capsys.readouterr().out
@@ -0,0 +1,60 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the counting Bloom filter kept next to the HashMaps
+
+
+import math
+
+import pytest
+
+from bloom import CountingBloomFilter
+from hash_functions import hash_fnv1a
+import hash_map_compact
+import hash_map_oa
+import hash_map_sc
+
+
+def negative_hash(key: str) -> int:
+    """Hash function that returns negative values, like the built-in hash can"""
+    return -hash_fnv1a(key) - 1
+
+
+def test_negative_hash_and_its_masked_form_agree():
+    bloom = CountingBloomFilter(100)
+    for num in range(100):
+        bloom.add(negative_hash(str(num)))
+    for num in range(100):
+        assert bloom.might_contain(negative_hash(str(num)) & 0xffffffffffffffff)
+
+
+@pytest.mark.parametrize('map_class', [hash_map_compact.HashMap, hash_map_oa.HashMap, hash_map_sc.HashMap])
+def test_map_with_negative_hashes_finds_every_key(map_class):
+    m = map_class(1000, negative_hash)
+    m.enable_bloom()
+    keys = ['key' + str(num) for num in range(50)]
+    for key in keys:
+        m.put(key, key)
+
+    assert all(m.contains_key(key) for key in keys)
+    for key in keys[::2]:
+        m.remove(key)
+    assert [m.get(key) for key in keys[1::2]] == keys[1::2]
+    assert not any(m.contains_key(key) for key in keys[::2])
+
+
+@pytest.mark.parametrize('map_class, max_load', [
+    (hash_map_compact.HashMap, .5),
+    (hash_map_oa.HashMap, .5),
+    (hash_map_sc.HashMap, 1),
+])
+def test_filter_is_sized_per_key_the_table_can_hold(map_class, max_load):
+    m = map_class(1000, hash_fnv1a)
+    m.enable_bloom(bits_per_key=8)
+    for num in range(2000):
+        m.put('key' + str(num), num)
+
+    counters = m.stats()['bloom']['counters']
+    assert counters == math.ceil(m.get_capacity() * max_load) * 8
@@ -0,0 +1,178 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the bounded caches and the memoize decorator
+
+
+import pytest
+
+from cache import BoundedCache, RandomEvictionCache, memoize
+import hash_map_oa
+import hash_map_sc
+
+
+class FakeClock:
+    """Clock the tests move forward by hand"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Box:
+    """Object with the default repr and identity-based equality"""
+    pass
+
+
+def test_memoize_never_serves_a_collected_object_its_predecessors_result():
+    @memoize(max_entries=1000)
+    def label(box):
+        return box.label
+
+    # a repr key embeds id(), which a new object gets again once the old one is collected
+    for num in range(200):
+        box = Box()
+        box.label = num
+        assert label(box) == num
+
+
+def test_memoize_keys_on_argument_values():
+    calls = []
+
+    @memoize
+    def add(a, b=0):
+        calls.append((a, b))
+        return a + b
+
+    assert add(1, 2) == add(1, 2) == 3
+    assert add(1, b=2) == 3
+    assert calls == [(1, 2), (1, 2)]
+
+
+def test_memoize_rejects_unhashable_arguments():
+    @memoize
+    def length(items):
+        return len(items)
+
+    with pytest.raises(TypeError):
+        length([1, 2])
+
+
+@pytest.mark.parametrize('map_class', [hash_map_sc.HashMap, hash_map_oa.HashMap])
+def test_lru_evicts_the_least_recently_used_key(map_class):
+    cache = BoundedCache(3, map_class=map_class)
+    for key in 'abc':
+        cache.put(key, key.upper())
+
+    # a get and an update both count as a use
+    assert cache.get('a') == 'A'
+    cache.put('b', 'B2')
+    cache.put('d', 'D')
+
+    assert sorted(cache.keys()) == ['a', 'b', 'd']
+    cache.put('e', 'E')
+    assert sorted(cache.keys()) == ['b', 'd', 'e']
+    assert cache.stats()['evictions'] == 2
+    assert cache.get_size() == 3
+
+
+def test_contains_key_does_not_mark_a_key_used():
+    cache = BoundedCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.contains_key('a')
+
+    cache.put('c', 3)
+    assert not cache.contains_key('a')
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = BoundedCache(10, ttl=5, clock=clock)
+    cache.put('default', 1)
+    cache.put('short', 2, ttl=1)
+    cache.put('forever', 3, ttl=float('inf'))
+
+    clock.now = 1
+    assert cache.get('short') is None
+    assert cache.get('default') == 1
+
+    clock.now = 5
+    assert cache.get('default', 'gone') == 'gone'
+    assert cache.get('forever') == 3
+
+    stats = cache.stats()
+    assert stats['expirations'] == 2 and stats['evictions'] == 0
+    assert stats['hits'] == 2 and stats['misses'] == 2
+    assert stats['hit_rate'] == .5
+
+
+def test_an_expired_victim_counts_as_an_expiration():
+    clock = FakeClock()
+    cache = BoundedCache(2, clock=clock)
+    cache.put('old', 1, ttl=1)
+    cache.put('new', 2)
+
+    clock.now = 2
+    cache.put('third', 3)
+    stats = cache.stats()
+    assert stats['expirations'] == 1 and stats['evictions'] == 0
+
+
+def test_purge_expired_drops_every_expired_entry():
+    clock = FakeClock()
+    cache = BoundedCache(10, ttl=1, clock=clock)
+    for num in range(6):
+        cache.put(num, num, ttl=None if num % 2 else 10)
+
+    clock.now = 1
+    assert cache.purge_expired() == 3
+    assert sorted(cache.keys()) == [0, 2, 4]
+    assert cache.stats()['expirations'] == 3
+
+
+def test_random_eviction_keeps_the_bound_and_is_seeded():
+    def survivors(seed):
+        cache = RandomEvictionCache(5, seed=seed)
+        for num in range(50):
+            cache.put(num, num)
+            cache.get(num // 2)
+        assert cache.get_size() == 5
+        assert cache.stats()['evictions'] == 45
+        return sorted(cache.keys())
+
+    assert survivors(1) == survivors(1)
+    assert all(cache_key in range(50) for cache_key in survivors(2))
+
+
+def test_random_eviction_remove_and_purge_keep_the_slots_consistent():
+    clock = FakeClock()
+    cache = RandomEvictionCache(10, ttl=1, clock=clock, seed=0)
+    for num in range(10):
+        cache.put(num, num, ttl=None if num % 3 else 5)
+    cache.remove(4)
+
+    clock.now = 1
+    assert cache.purge_expired() == 5
+    assert sorted(cache.keys()) == [0, 3, 6, 9]
+    assert all(cache.get(num) == num for num in (0, 3, 6, 9))
+
+
+def test_memoize_reports_and_clears_its_counters():
+    @memoize(max_entries=2)
+    def square(n):
+        return n * n
+
+    for n in (1, 2, 1, 3, 2):
+        square(n)
+    info = square.cache_info()
+    assert (info['hits'], info['misses'], info['evictions']) == (1, 4, 2)
+    assert info['policy'] == 'lru' and info['size'] == 2
+
+    square.cache_clear()
+    info = square.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (0, 0, 0)
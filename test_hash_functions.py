@@ -0,0 +1,64 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the hash function family
+
+
+import pickle
+
+import pytest
+
+from a6_include import hash_function_1
+from hash_functions import MASK_64, hash_builtin, hash_fnv1a, hash_mix, make_hash_mix, mix_low_bits
+import hash_map_oa
+import hash_map_sc
+
+
+def test_fnv1a_matches_the_reference_values():
+    assert hash_fnv1a('') == 0xcbf29ce484222325
+    assert hash_fnv1a('a') == 0xaf63dc4c8601ec8c
+    assert hash_fnv1a('foobar') == 0x85944171f73967e8
+
+
+@pytest.mark.parametrize('function', [hash_fnv1a, hash_mix, hash_builtin])
+def test_hashes_are_non_negative_64_bit_ints(function):
+    for key in ['', 'a', 'seven77', 'eight888', 'nine99999', 'é' * 20, 'x' * 1000]:
+        value = function(key)
+        assert 0 <= value <= MASK_64
+        assert value == function(key)
+
+
+@pytest.mark.parametrize('function', [hash_fnv1a, hash_mix])
+def test_anagrams_and_shared_prefixes_get_different_hashes(function):
+    # hash_function_1 sums the characters, so it sends every anagram to one bucket
+    anagrams = ['listen', 'silent', 'enlist', 'tinsel', 'inlets']
+    assert len({hash_function_1(key) for key in anagrams}) == 1
+    assert len({function(key) for key in anagrams}) == len(anagrams)
+
+    # keys that only differ in the tail after the last full word still differ
+    keys = ['prefix__' + str(num) for num in range(1000)]
+    assert len({function(key) for key in keys}) == len(keys)
+
+
+def test_seeded_hash_mix_functions_differ_and_pickle_by_name():
+    seeded = make_hash_mix(7)
+    assert seeded.__name__ == 'hash_mix_7'
+    assert make_hash_mix(7)('key') == seeded('key') != hash_mix('key')
+    assert pickle.loads(pickle.dumps(hash_mix)) is hash_mix
+
+
+def test_mix_low_bits_spreads_hashes_that_only_differ_in_high_bits():
+    # masking these hashes directly would send every one of them to bucket 0
+    buckets = {mix_low_bits(num << 40) & 63 for num in range(1, 1025)}
+    assert len(buckets) > 48
+
+
+@pytest.mark.parametrize('map_class', [hash_map_sc.HashMap, hash_map_oa.HashMap])
+@pytest.mark.parametrize('function', [hash_fnv1a, hash_mix, hash_builtin])
+def test_maps_work_with_every_hash_function(map_class, function):
+    m = map_class(11, function)
+    for num in range(200):
+        m.put('key' + str(num), num)
+    assert all(m.get('key' + str(num)) == num for num in range(200))
@@ -0,0 +1,92 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the compact parallel-array HashMap
+
+
+import gc
+import random
+import weakref
+
+import pytest
+
+from a6_include import hash_function_1, hash_function_2
+import hash_map_compact
+import hash_map_oa
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+@pytest.mark.parametrize('function', [hash_function_1, hash_function_2, constant_hash])
+def test_slots_match_the_object_map_after_every_operation(function):
+    compact = hash_map_compact.HashMap(11, function)
+    objects = hash_map_oa.HashMap(11, function)
+    rng = random.Random(261)
+
+    for _ in range(600):
+        key = 'key' + str(rng.randrange(150))
+        if rng.random() < .3:
+            compact.remove(key)
+            objects.remove(key)
+        else:
+            compact.put(key, key.upper())
+            objects.put(key, key.upper())
+
+        assert compact.get_size() == objects.get_size()
+        assert compact.get_capacity() == objects.get_capacity()
+
+    # both maps probe alike, so every slot holds the same key, or a tombstone in the same place
+    for num in range(compact.get_capacity()):
+        ours, theirs = compact._entry_at(num), objects._buckets[num]
+        assert (ours is None) == (theirs is None)
+        if ours is not None:
+            assert ours.is_tombstone == theirs.is_tombstone
+            if not ours.is_tombstone:
+                assert (ours.key, ours.value) == (theirs.key, theirs.value)
+    assert compact.empty_buckets() == objects.empty_buckets()
+    assert compact.stats()['tombstones'] == objects.stats()['tombstones']
+
+
+def test_slots_hold_no_entry_objects():
+    m = hash_map_compact.HashMap(53, hash_function_1)
+    for num in range(30):
+        m.put('key' + str(num), num)
+
+    assert not any(isinstance(value, hash_map_oa.HashEntry) for value in m._values)
+    assert m._states.count(hash_map_compact.FULL) == 30
+    assert sorted(m.items()) == sorted(('key' + str(num), num) for num in range(30))
+
+
+def test_remove_releases_the_key_and_value():
+    class Box:
+        pass
+
+    m = hash_map_compact.HashMap(53, hash_function_1)
+    box = Box()
+    ref = weakref.ref(box)
+    m.put('box', box)
+    m.remove('box')
+
+    del box
+    gc.collect()
+    assert ref() is None
+    assert m.get('box') is None and m.stats()['tombstones'] == 1
+
+
+def test_purge_and_resize_keep_every_live_key():
+    m = hash_map_compact.HashMap(53, hash_function_1)
+    for num in range(20):
+        m.put('key' + str(num), num)
+    for num in range(0, 20, 2):
+        m.remove('key' + str(num))
+
+    m.purge_tombstones()
+    assert m.stats()['tombstones'] == 0
+    m.resize_table(200)
+    assert m.get_capacity() == 211
+    assert sorted(m.items()) == sorted(('key' + str(num), num) for num in range(1, 20, 2))
@@ -0,0 +1,46 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the lock-striped concurrent HashMap
+
+
+import threading
+
+from a6_include import hash_function_1
+import hash_map_concurrent
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+def test_resizing_below_the_size_keeps_the_load_at_most_1():
+    m = hash_map_concurrent.HashMap(53, hash_function_1)
+    for num in range(40):
+        m.put('key' + str(num), num)
+
+    m.resize_table(1)
+    assert m.table_load() <= 1
+    assert all(m.get('key' + str(num)) == num for num in range(40))
+
+
+def test_concurrent_readers_count_every_false_positive():
+    m = hash_map_concurrent.HashMap(11, constant_hash, stripes=4)
+    m.enable_bloom()
+    m.put('present', 1)
+
+    # every key hashes alike, so each lookup of a missing key is a false positive
+    def reader():
+        for num in range(2000):
+            m.contains_key('missing' + str(num))
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert m.stats()['bloom']['false_positives'] == 8000
@@ -0,0 +1,43 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the cuckoo HashMap
+
+
+import pytest
+
+from a6_include import hash_function_1, hash_function_2
+import hash_map_cuckoo
+
+
+# keys with the same hash under both hash_function_1 and hash_function_2
+DOUBLY_COLLIDING = ['azza', 'byyb', 'bzwc', 'cwzb', 'cxxc', 'cyvd', 'czte',
+                    'dvyc', 'dwwd', 'dxue', 'dysf', 'dzqg', 'etzc']
+
+
+def test_keys_colliding_under_both_functions_raise_and_keep_the_map():
+    m = hash_map_cuckoo.HashMap(11, hash_function_1, hash_function_2)
+    fitting = 2 * 4 + 4
+    for key in DOUBLY_COLLIDING[:fitting]:
+        m.put(key, key.upper())
+
+    with pytest.raises(RuntimeError):
+        m.put(DOUBLY_COLLIDING[fitting], 'x')
+
+    assert m.get_size() == fitting
+    assert not m.contains_key(DOUBLY_COLLIDING[fitting])
+    for key in DOUBLY_COLLIDING[:fitting]:
+        assert m.get(key) == key.upper()
+
+
+def test_default_second_function_is_reseeded_for_doubly_colliding_keys():
+    m = hash_map_cuckoo.HashMap(11, hash_function_1)
+    m._hash_function_2 = hash_function_2
+    for num, key in enumerate(DOUBLY_COLLIDING):
+        m.put(key, num)
+
+    assert m.get_size() == len(DOUBLY_COLLIDING)
+    for num, key in enumerate(DOUBLY_COLLIDING):
+        assert m.get(key) == num
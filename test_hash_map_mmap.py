@@ -0,0 +1,75 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the memory-mapped HashMap and its table format
+
+
+import os
+
+import pytest
+
+from a6_include import hash_function_1
+from hash_functions import hash_fnv1a
+import hash_map_mmap
+import hash_map_sc
+import table_format
+
+
+VALUES = [None, False, True, 0, -1, 2 ** 100, -2 ** 70, 1.5, float('inf'), '', 'é', b'', b'\x00\xff']
+
+
+def test_write_and_open_round_trip(tmp_path):
+    m = hash_map_sc.HashMap(53, hash_function_1)
+    for num in range(150):
+        m.put('str' + str(num), num * 100)
+
+    path = str(tmp_path / 'table.hm')
+    hash_map_mmap.HashMap.write(path, m)
+    assert not os.path.exists(path + '.tmp')
+
+    with hash_map_mmap.HashMap.open(path) as mapped:
+        assert mapped.get_size() == 150
+        assert mapped.table_load() <= .5
+        assert sorted(mapped.items()) == sorted(m.items())
+        assert mapped.get('str7') == 700
+        assert not mapped.contains_key('str999')
+
+
+def test_every_value_type_round_trips(tmp_path):
+    path = str(tmp_path / 'values.hm')
+    pairs = [('key' + str(num), value) for num, value in enumerate(VALUES)]
+
+    # a later pair replaces an earlier one with the same key, like put
+    hash_map_mmap.HashMap.write(path, pairs + [('key0', 'replaced')], hash_fnv1a)
+
+    with hash_map_mmap.HashMap.open(path) as mapped:
+        assert mapped.get_size() == len(VALUES)
+        assert mapped.get('key0') == 'replaced'
+        for num, value in enumerate(VALUES[1:], 1):
+            stored = mapped.get('key' + str(num))
+            assert stored == value and type(stored) is type(value)
+
+
+def test_unsupported_values_and_functions_are_rejected(tmp_path):
+    path = str(tmp_path / 'bad.hm')
+    with pytest.raises(TypeError):
+        hash_map_mmap.HashMap.write(path, {'a': [1]}, hash_fnv1a)
+    with pytest.raises(ValueError):
+        hash_map_mmap.HashMap.write(path, {'a': 1}, lambda key: 0)
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize('damage', [
+    lambda image: image[:10],
+    lambda image: b'XXXX' + image[4:],
+    lambda image: image[:-1],
+])
+def test_damaged_files_raise_table_format_error(tmp_path, damage):
+    image = bytes(table_format.build_image([('a', 1), ('b', 'two')], hash_fnv1a))
+    path = tmp_path / 'damaged.hm'
+    path.write_bytes(damage(image))
+
+    with pytest.raises(table_format.TableFormatError):
+        hash_map_mmap.HashMap.open(str(path))
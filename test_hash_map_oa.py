@@ -0,0 +1,191 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the open addressing HashMap
+
+
+import pytest
+
+from a6_include import hash_function_1
+from hash_functions import hash_builtin
+import hash_map_oa
+
+
+@pytest.mark.parametrize('power_of_two', [False, True])
+@pytest.mark.parametrize('count', [8, 16, 100])
+def test_put_many_resizes_once(power_of_two, count):
+    m = hash_map_oa.HashMap(3, hash_function_1, power_of_two=power_of_two)
+    m.enable_stats()
+    m.put_many(('key' + str(num), num) for num in range(count))
+
+    assert m.stats()['resizes'] == 1
+    assert m.get_size() == count
+
+
+def test_iterating_during_a_migration_leaves_it_running():
+    m = hash_map_oa.HashMap(11, hash_builtin, incremental=True)
+    for num in range(6):
+        m.put(num, num)
+    assert m._old_buckets is not None
+
+    assert sorted(m.items()) == [(num, num) for num in range(6)]
+    assert m._old_buckets is not None
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+def test_stats_during_a_migration_leaves_it_running():
+    m = hash_map_oa.HashMap(11, hash_builtin, incremental=True)
+    for num in range(6):
+        m.put(num, num)
+    stats = m.stats()
+
+    assert m._old_buckets is not None
+    assert stats['size'] == 6 and 'hash_collisions' not in stats
+
+
+def test_stats_counts_hash_collisions_on_request():
+    m = hash_map_oa.HashMap(11, constant_hash)
+    for num in range(5):
+        m.put('key' + str(num), num)
+
+    assert m.stats(collisions=True)['hash_collisions'] == 4
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_updating_values_during_iteration(incremental):
+    m = hash_map_oa.HashMap(53, hash_function_1, incremental=incremental)
+    for num in range(20):
+        m.put('key' + str(num), num)
+
+    for key, value in m.items():
+        m.put(key, value * 10)
+
+    assert m.get_size() == 20
+    assert sorted(m.items()) == sorted(('key' + str(num), num * 10) for num in range(20))
+
+
+def test_incremental_open_addressing_put_moves_a_bounded_number_of_entries(monkeypatch):
+    created = [0]
+
+    class CountingHashEntry(hash_map_oa.HashEntry):
+        def __init__(self, key, value, hash_value=None):
+            super().__init__(key, value, hash_value)
+            created[0] += 1
+
+    def purge_everything(self):
+        raise AssertionError('incremental tables purge through a migration')
+
+    monkeypatch.setattr(hash_map_oa, 'HashEntry', CountingHashEntry)
+    monkeypatch.setattr(hash_map_oa.HashMap, 'purge_tombstones', purge_everything)
+    m = hash_map_oa.HashMap(11, hash_builtin, incremental=True)
+    m.enable_stats()
+
+    most = 0
+    for num in range(20000):
+        created[0] = 0
+        m.put(num, num)
+        if num % 3:
+            m.remove(num - 1)
+        most = max(most, created[0])
+
+    assert m.stats()['purges'] > 0
+    assert most <= m.migration_step + 1
+    assert all(m.get(num) == (num if num % 3 == 2 or num == 19999 else None) for num in range(20000))
+
+
+def test_put_reuses_the_first_tombstone_on_the_probe_path():
+    m = hash_map_oa.HashMap(53, constant_hash)
+    for num in range(4):
+        m.put('key' + str(num), num)
+    m.remove('key1')
+    assert m.stats()['tombstones'] == 1
+
+    m.put('new', 'new')
+    assert m.stats()['tombstones'] == 0
+    assert m.get_size() == 4
+    assert m.probe_length('new') == 2
+
+
+def test_put_past_a_tombstone_updates_the_existing_key():
+    m = hash_map_oa.HashMap(53, constant_hash)
+    for num in range(4):
+        m.put('key' + str(num), num)
+    m.remove('key1')
+
+    # key3 sits behind the tombstone, so it is updated instead of stored twice
+    m.put('key3', 'updated')
+    m.remove('key3')
+    assert m.get_size() == 2
+    assert m.get('key3') is None
+    assert sorted(m.keys()) == ['key0', 'key2']
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_churn_purges_tombstones_instead_of_growing(incremental):
+    m = hash_map_oa.HashMap(53, hash_function_1, incremental=incremental)
+    m.enable_stats()
+    for num in range(2000):
+        m.put('key' + str(num), num)
+        m.remove('key' + str(num - 5))
+
+    # tombstones count toward the load, so the table keeps an empty bucket to end probes
+    stats = m.stats()
+    assert stats['purges'] > 0
+    assert stats['resizes'] == 0
+    assert stats['empty_buckets'] > 0
+    assert m.get_size() == 5
+    assert all(m.get('key' + str(num)) == num for num in range(1995, 2000))
+
+
+def test_purge_tombstones_keeps_every_live_key():
+    m = hash_map_oa.HashMap(53, hash_function_1)
+    for num in range(20):
+        m.put('key' + str(num), num)
+    for num in range(0, 20, 2):
+        m.remove('key' + str(num))
+
+    m.purge_tombstones()
+    assert m.stats()['tombstones'] == 0
+    assert m.get_capacity() == 53
+    assert sorted(m.items()) == sorted(('key' + str(num), num) for num in range(1, 20, 2))
+
+
+@pytest.mark.parametrize('options', [{}, {'incremental': True}, {'power_of_two': True}])
+def test_resizes_and_purges_reuse_the_cached_hashes(options):
+    calls = [0]
+
+    def counting_hash(key) -> int:
+        calls[0] += 1
+        return hash_function_1(key)
+
+    m = hash_map_oa.HashMap(3, counting_hash, **options)
+    for num in range(500):
+        m.put('key' + str(num), num)
+    for num in range(0, 500, 2):
+        m.remove('key' + str(num))
+    m.resize_table(2000)
+
+    # every key is hashed once by its put and once by its remove, never by a resize or purge
+    assert calls[0] == 750
+    assert all(m.get('key' + str(num)) == (num if num % 2 else None) for num in range(500))
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_power_of_two_capacities_and_probes_reach_every_bucket(incremental):
+    m = hash_map_oa.HashMap(10, constant_hash, power_of_two=True, incremental=incremental)
+    assert m.get_capacity() == 16
+
+    # every key shares one home, so the triangular probe has to visit every bucket in turn
+    for num in range(100):
+        m.put('key' + str(num), num)
+        capacity = m.get_capacity()
+        assert capacity & (capacity - 1) == 0
+
+    assert all(m.get('key' + str(num)) == num for num in range(100))
+    assert m.probe_length('missing') <= m.get_capacity()
@@ -0,0 +1,85 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the Robin Hood open addressing HashMap
+
+
+import random
+
+import pytest
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import hash_builtin
+import hash_map_rh
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+@pytest.mark.parametrize('function', [hash_function_1, hash_function_2, constant_hash])
+def test_puts_gets_and_removes_match_a_dict(function):
+    m = hash_map_rh.HashMap(11, function)
+    expected = {}
+    rng = random.Random(261)
+
+    for _ in range(600):
+        key = 'key' + str(rng.randrange(150))
+        if rng.random() < .3:
+            m.remove(key)
+            expected.pop(key, None)
+        else:
+            m.put(key, len(expected))
+            expected[key] = len(expected)
+
+    assert m.get_size() == len(expected)
+    assert sorted(m.items()) == sorted(expected.items())
+    for num in range(150):
+        key = 'key' + str(num)
+        assert m.get(key) == expected.get(key)
+        assert m.contains_key(key) == (key in expected)
+
+
+def test_every_entry_sits_at_its_own_probe_distance():
+    m = hash_map_rh.HashMap(53, hash_function_1)
+    for num in range(40):
+        m.put('key' + str(num), num)
+    for num in range(0, 40, 3):
+        m.remove('key' + str(num))
+
+    capacity = m.get_capacity()
+    for index in range(capacity):
+        entry = m._buckets[index]
+        if entry is not None:
+            assert (entry.hash_value + entry.distance ** 2) % capacity == index
+
+
+def test_lookup_of_a_missing_key_stops_at_a_bucket_closer_to_home():
+    # ints hash to themselves, so every key below sits in its home bucket
+    m = hash_map_rh.HashMap(11, hash_builtin)
+    for key in (0, 1, 4, 9):
+        m.put(key, key)
+
+    # 11 shares the home of 0 and gives up at 1, which is closer to its own home
+    assert m.probe_length(11) == 2
+    assert not m.contains_key(11)
+
+    m.put(11, 11)
+    m.remove(1)
+    assert m.get(11) == 11 and m.get(4) == 4 and m.get(1) is None
+
+
+def test_put_takes_a_tombstone_closer_to_its_home():
+    m = hash_map_rh.HashMap(11, hash_builtin)
+    m.put(0, 0)
+    m.put(1, 1)
+    m.remove(1)
+
+    # 11 is one probe from home when it reaches the tombstone 1 left at its home
+    m.put(11, 11)
+    assert m._tombstones == 0
+    assert m.get_size() == 2
+    assert m.get(11) == 11 and m.get(1) is None
@@ -0,0 +1,281 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the chaining HashMap
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from a6_include import DynamicArray, hash_function_1
+from hash_functions import hash_builtin
+import hash_map_sc
+
+
+@pytest.mark.parametrize('make_map', [
+    lambda: hash_map_sc.HashMap(53, hash_function_1),
+    lambda: hash_map_sc.HashMap(53, hash_function_1, incremental=True),
+])
+def test_updating_values_during_iteration(make_map):
+    m = make_map()
+    for num in range(20):
+        m.put('key' + str(num), num)
+
+    for key, value in m.items():
+        m.put(key, value * 10)
+
+    assert m.get_size() == 20
+    assert sorted(m.items()) == sorted(('key' + str(num), num * 10) for num in range(20))
+
+
+def test_adding_a_key_during_iteration_raises():
+    m = hash_map_sc.HashMap(53, hash_function_1)
+    m.put('a', 1)
+    m.put('b', 2)
+
+    with pytest.raises(RuntimeError):
+        for key, value in m.items():
+            m.put(key + key, value)
+
+
+def test_updating_a_key_waiting_in_the_old_buckets():
+    m = hash_map_sc.HashMap(11, hash_function_1, incremental=True)
+    for num in range(40):
+        m.put('key' + str(num), num)
+    for num in range(40):
+        m.put('key' + str(num), -num)
+
+    assert m.get_size() == 40
+    assert all(m.get('key' + str(num)) == -num for num in range(40))
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+def test_sorted_bucket_with_keys_that_cannot_be_ordered():
+    m = hash_map_sc.HashMap(11, constant_hash)
+    keys = ['a', 1, 'b', 2.5, ('t', 1), 3j, None, 'c', 4, 5j, 'd', 6, frozenset({1})]
+    for num, key in enumerate(keys):
+        m.put(key, num)
+
+    # keys of mixed types stay in a plain chain
+    assert m.stats()['sorted_buckets'] == 0
+    assert m.stats()['longest_chain'] == len(keys)
+    assert all(m.get(key) == num for num, key in enumerate(keys))
+    assert not m.contains_key('missing') and not m.contains_key(7j)
+
+    for key in keys[:8]:
+        m.remove(key)
+    assert all(m.get(key) == num + 8 for num, key in enumerate(keys[8:]))
+
+
+def test_sorted_bucket_with_keys_that_are_partially_ordered():
+    # frozensets compare by subset, so sorting them would misplace keys
+    m = hash_map_sc.HashMap(11, constant_hash)
+    keys = [frozenset({num}) for num in range(12)] + [frozenset({1, 2}), frozenset()]
+    for num, key in enumerate(keys):
+        m.put(key, num)
+
+    assert m.stats()['sorted_buckets'] == 0
+    assert all(m.get(key) == num for num, key in enumerate(keys))
+    assert not m.contains_key(frozenset({1, 3}))
+
+
+def test_sorted_bucket_finds_equal_keys_of_another_type():
+    m = hash_map_sc.HashMap(11, constant_hash)
+    for num in range(12):
+        m.put(num, num)
+    assert m.stats()['sorted_buckets'] == 1
+
+    assert m.get(3.0) == 3 and not m.contains_key('3') and not m.contains_key(frozenset())
+    m.put(3.0, 'float')
+    assert m.get(3) == 'float' and m.get_size() == 12
+
+
+def test_sorted_bucket_turns_back_into_a_chain_on_nan():
+    m = hash_map_sc.HashMap(11, constant_hash)
+    keys = [num + .5 for num in range(12)]
+    for num, key in enumerate(keys):
+        m.put(key, num)
+    assert m.stats()['sorted_buckets'] == 1
+
+    nan = float('nan')
+    m.put(nan, 'nan')
+    m.put(-1.5, 'after nan')
+
+    assert m.stats()['sorted_buckets'] == 0
+    assert all(m.get(key) == num for num, key in enumerate(keys))
+    assert m.get(-1.5) == 'after nan' and m.get_size() == 14
+
+
+def test_sorted_bucket_orders_equal_hashes_by_key():
+    m = hash_map_sc.HashMap(11, constant_hash)
+    keys = ['key' + str(num) for num in range(50)]
+    for num, key in enumerate(keys):
+        m.put(key, num)
+    assert m.stats()['sorted_buckets'] == 1
+
+    # a key of another type turns the bucket back into a chain
+    m.put(1, 'int key')
+    assert m.stats()['sorted_buckets'] == 0
+    assert all(m.get(key) == num for num, key in enumerate(keys))
+    assert m.get(1) == 'int key'
+
+
+@pytest.mark.parametrize('values', [
+    [3, 1, 3, 2, 1, 5],
+    [2 ** 70, 1, 2 ** 70, -2 ** 70, 1, 5],
+])
+def test_find_mode_vectorized_falls_back_for_ints(monkeypatch, values):
+    # without numpy, and with numpy for ints that overflow int64
+    monkeypatch.setattr(hash_map_sc, 'numpy', None)
+    mode, frequency = hash_map_sc.find_mode_vectorized(DynamicArray(values))
+    expected = hash_map_sc.find_mode(DynamicArray([str(value) for value in values]))
+
+    assert frequency == expected[1] == 2
+    assert [mode[num] for num in range(mode.length())] == \
+        [int(expected[0][num]) for num in range(expected[0].length())]
+
+
+def test_find_mode_vectorized_overflowing_ints():
+    values = [2 ** 70, 2 ** 70, 7, 7, 2 ** 63]
+    mode, frequency = hash_map_sc.find_mode_vectorized(values)
+
+    assert frequency == 2
+    assert [mode[num] for num in range(mode.length())] == [2 ** 70, 7]
+
+
+def test_incremental_chaining_put_builds_a_bounded_number_of_buckets(monkeypatch):
+    created = [0]
+
+    class CountingLinkedList(hash_map_sc.LinkedList):
+        def __init__(self):
+            super().__init__()
+            created[0] += 1
+
+    monkeypatch.setattr(hash_map_sc, 'LinkedList', CountingLinkedList)
+    m = hash_map_sc.HashMap(11, hash_builtin, incremental=True)
+
+    # sequential ints hash to themselves, so every old bucket holds at most one node
+    most = 0
+    for num in range(20000):
+        created[0] = 0
+        m.put(num, num)
+        most = max(most, created[0])
+
+    assert m.get_capacity() > 20000
+    assert most <= m.migration_step + 1
+    assert all(m.get(num) == num for num in range(20000))
+
+
+def test_resizing_below_the_size_keeps_the_load_at_most_1():
+    m = hash_map_sc.HashMap(53, hash_function_1)
+    for num in range(40):
+        m.put('key' + str(num), num)
+
+    m.resize_table(1)
+    assert m.table_load() <= 1
+    assert all(m.get('key' + str(num)) == num for num in range(40))
+
+
+@pytest.mark.parametrize('power_of_two', [False, True])
+@pytest.mark.parametrize('count', [8, 16, 100])
+def test_put_many_resizes_once(power_of_two, count):
+    m = hash_map_sc.HashMap(3, hash_function_1, power_of_two=power_of_two)
+    m.enable_stats()
+    m.put_many(('key' + str(num), num) for num in range(count))
+
+    assert m.stats()['resizes'] == 1
+    assert m.get_size() == count
+
+
+def test_importing_the_map_does_not_load_the_process_pool():
+    code = 'import sys, hash_map_sc; print("concurrent.futures" in sys.modules)'
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_iterating_during_a_migration_leaves_it_running():
+    m = hash_map_sc.HashMap(11, hash_builtin, incremental=True)
+    for num in range(12):
+        m.put(num, num)
+    assert m._old_buckets is not None
+
+    assert sorted(m.items()) == [(num, num) for num in range(12)]
+    assert m._old_buckets is not None
+
+
+def test_stats_during_a_migration_leaves_it_running():
+    m = hash_map_sc.HashMap(11, hash_builtin, incremental=True)
+    for num in range(12):
+        m.put(num, num)
+    stats = m.stats()
+
+    assert m._old_buckets is not None
+    assert sum(length * count for length, count in stats['chain_lengths'].items()) == 12
+    assert 'hash_collisions' not in stats
+
+
+def test_stats_counts_hash_collisions_on_request():
+    m = hash_map_sc.HashMap(11, constant_hash)
+    for num in range(5):
+        m.put('key' + str(num), num)
+
+    assert m.stats(collisions=True)['hash_collisions'] == 4
+
+
+@pytest.mark.parametrize('values', [
+    ['b', 'a', 'b', 'c', 'a', 'd'],
+    [5, -3, 5, 7, -3, 0, 7],
+    ['only'],
+])
+def test_find_mode_vectorized_matches_find_mode(values):
+    pytest.importorskip('numpy')
+    mode, frequency = hash_map_sc.find_mode_vectorized(DynamicArray(values))
+
+    # find_mode hashes characters, so ints are compared by their str form
+    expected = hash_map_sc.find_mode(DynamicArray([str(value) for value in values]))
+
+    assert type(frequency) is int and frequency == expected[1]
+    assert [str(mode[num]) for num in range(mode.length())] == \
+        [expected[0][num] for num in range(expected[0].length())]
+
+
+@pytest.mark.parametrize('options', [{}, {'incremental': True}, {'power_of_two': True}])
+def test_resizes_reuse_the_cached_hashes(options):
+    calls = [0]
+
+    def counting_hash(key) -> int:
+        calls[0] += 1
+        return hash_function_1(key)
+
+    m = hash_map_sc.HashMap(3, counting_hash, **options)
+    for num in range(500):
+        m.put('key' + str(num), num)
+    m.resize_table(2000)
+
+    # every key is hashed once by its put, never again by a resize
+    assert calls[0] == 500
+    assert all(m.get('key' + str(num)) == num for num in range(500))
+
+
+def test_power_of_two_capacities_spread_keys_that_share_their_low_bits():
+    m = hash_map_sc.HashMap(10, hash_builtin, power_of_two=True)
+    assert m.get_capacity() == 16
+
+    # masking these hashes directly would put every key in bucket 0
+    for num in range(200):
+        m.put(num << 32, num)
+        capacity = m.get_capacity()
+        assert capacity & (capacity - 1) == 0
+
+    assert m.stats()['longest_chain'] < 10
+    assert all(m.get(num << 32) == num for num in range(200))
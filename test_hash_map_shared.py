@@ -0,0 +1,62 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the shared-memory HashMap
+
+
+import multiprocessing
+
+import pytest
+
+from a6_include import hash_function_2
+from hash_functions import hash_builtin, hash_mix
+import hash_map_oa
+import hash_map_shared
+
+
+def test_build_and_attach_round_trip():
+    m = hash_map_oa.HashMap(53, hash_function_2)
+    for num in range(150):
+        m.put('str' + str(num), num * 100)
+
+    with hash_map_shared.HashMap.build(m) as shared:
+        attached = hash_map_shared.HashMap.attach(shared.get_name())
+        try:
+            assert attached.get_size() == 150
+            assert sorted(attached.items()) == sorted(m.items())
+            assert attached.get('str7') == 700
+            assert not attached.contains_key('str999')
+        finally:
+            attached.close()
+
+
+def test_another_process_reads_the_segment():
+    pairs = [('key' + str(num), 'value' + str(num)) for num in range(50)]
+    context = multiprocessing.get_context('spawn')
+
+    with hash_map_shared.HashMap.build(pairs, hash_mix) as shared:
+        queue = context.Queue()
+        process = context.Process(target=hash_map_shared._reader, args=(shared.get_name(), queue))
+        process.start()
+        result = queue.get(timeout=60)
+        process.join(timeout=60)
+
+    assert result == (None, False, 50)
+    assert process.exitcode == 0
+
+
+def test_closed_maps_stop_reading_and_unlink_frees_the_name():
+    shared = hash_map_shared.HashMap.build({'a': 1}, hash_mix)
+    name = shared.get_name()
+    shared.unlink()
+    shared.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        hash_map_shared.HashMap.attach(name)
+
+
+def test_salted_hashes_cannot_be_shared():
+    with pytest.raises(ValueError):
+        hash_map_shared.HashMap.build({'a': 1}, hash_builtin)
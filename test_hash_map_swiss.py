@@ -0,0 +1,113 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the Swiss-table style HashMap
+
+
+import random
+import struct
+
+import pytest
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import hash_mix
+import hash_map_swiss
+from hash_map_swiss import DELETED, EMPTY, match_empty, match_fragment, match_free
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+def group_word(control: list) -> int:
+    """Packs eight control bytes into a group word"""
+    return struct.unpack('<Q', bytes(control))[0]
+
+
+def flagged(match: int) -> list:
+    """Returns the slots whose high bit is set in a match"""
+    return [slot for slot in range(8) if match >> (slot * 8 + 7) & 1]
+
+
+def test_group_matches_flag_the_right_slots():
+    control = [5, EMPTY, 5, DELETED, 0x7f, 0, EMPTY, 5]
+    word = group_word(control)
+
+    assert set(flagged(match_fragment(word, 5))) >= {0, 2, 7}
+    assert flagged(match_empty(word)) == [1, 6]
+    assert flagged(match_free(word)) == [1, 3, 6]
+    assert flagged(match_fragment(group_word([EMPTY] * 8), 0)) == []
+
+
+@pytest.mark.parametrize('function', [hash_function_1, hash_function_2, constant_hash])
+def test_puts_gets_and_removes_match_a_dict(function):
+    m = hash_map_swiss.HashMap(8, function)
+    expected = {}
+    rng = random.Random(261)
+
+    for _ in range(1500):
+        key = 'key' + str(rng.randrange(300))
+        if rng.random() < .3:
+            m.remove(key)
+            expected.pop(key, None)
+        else:
+            m.put(key, len(expected))
+            expected[key] = len(expected)
+
+    assert m.get_size() == len(expected)
+    assert sorted(m.items()) == sorted(expected.items())
+    for num in range(300):
+        key = 'key' + str(num)
+        assert m.get(key) == expected.get(key)
+        assert m.contains_key(key) == (key in expected)
+
+
+def test_capacity_is_a_power_of_two_and_the_load_stays_bounded():
+    m = hash_map_swiss.HashMap(10)
+    assert m.get_capacity() == 16
+
+    for num in range(1000):
+        m.put('key' + str(num), num)
+        capacity = m.get_capacity()
+        assert capacity & (capacity - 1) == 0
+        assert m.table_load() <= m.max_load
+    assert m.empty_buckets() > 0
+
+
+def test_churn_rebuilds_in_place_instead_of_growing():
+    m = hash_map_swiss.HashMap(64)
+    for num in range(20000):
+        m.put('key' + str(num), num)
+        m.remove('key' + str(num - 20))
+
+    assert m.get_size() == 20
+    assert m.get_capacity() == 64
+    assert all(m.get('key' + str(num)) == num for num in range(19980, 20000))
+
+
+def test_lookups_compare_few_keys():
+    m = hash_map_swiss.HashMap(16, hash_mix)
+    for num in range(500):
+        m.put('key' + str(num), num)
+
+    # the 7-bit fragment filters out almost every slot before a key comparison
+    comparisons = [m.key_comparisons('key' + str(num)) for num in range(500)]
+    assert max(comparisons) <= 3
+    assert sum(comparisons) < 1.2 * 500
+    assert m.probe_length('missing') >= 1
+
+
+def test_clear_and_iteration_guard():
+    m = hash_map_swiss.HashMap()
+    for num in range(10):
+        m.put('key' + str(num), num)
+
+    with pytest.raises(RuntimeError):
+        for key in m.keys():
+            m.put(key + key, key)
+
+    m.clear()
+    assert m.get_size() == 0 and m.get('key1') is None
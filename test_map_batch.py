@@ -0,0 +1,56 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the batch put/get/remove of every HashMap
+
+
+import pytest
+
+from a6_include import DynamicArray, hash_function_1
+import hash_map_compact
+import hash_map_concurrent
+import hash_map_oa
+import hash_map_sc
+from map_batch import as_list
+
+
+@pytest.mark.parametrize('map_class', [
+    hash_map_compact.HashMap,
+    hash_map_concurrent.HashMap,
+    hash_map_oa.HashMap,
+    hash_map_sc.HashMap,
+])
+def test_batch_round_trip(map_class):
+    m = map_class(11, hash_function_1)
+    m.put_many(DynamicArray([('key' + str(num), num) for num in range(50)]))
+    m.put_many(('key' + str(num), -num) for num in range(0, 50, 5))
+
+    values = m.get_many(['key' + str(num) for num in range(55)])
+    assert as_list(values) == [-num if num % 5 == 0 else num for num in range(50)] + [None] * 5
+
+    assert m.remove_many(['key' + str(num) for num in range(0, 60, 2)]) == 25
+    assert m.get_size() == 25
+    assert sorted(m.keys()) == sorted('key' + str(num) for num in range(1, 50, 2))
+
+
+def test_as_list_copies_a_dynamic_array_and_any_iterable():
+    assert as_list(DynamicArray([1, 2, 3])) == [1, 2, 3]
+    assert as_list(num for num in range(3)) == [0, 1, 2]
+
+
+@pytest.mark.parametrize('map_class', [hash_map_oa.HashMap, hash_map_sc.HashMap])
+@pytest.mark.parametrize('options', [{'incremental': True}, {'power_of_two': True}])
+def test_batches_in_every_resize_mode(map_class, options):
+    m = map_class(3, hash_function_1, **options)
+    m.put_many(('key' + str(num % 40), num) for num in range(120))
+
+    # a key repeated in one batch keeps its last value
+    assert m.get_size() == 40
+    values = m.get_many('key' + str(num) for num in range(40))
+    assert isinstance(values, DynamicArray)
+    assert as_list(values) == [num + 80 for num in range(40)]
+
+    assert m.remove_many('key' + str(num) for num in range(40)) == 40
+    assert m.get_size() == 0
@@ -0,0 +1,90 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the statistics of both HashMaps (SC & OA)
+
+
+import pytest
+
+from a6_include import hash_function_1
+from hash_functions import hash_builtin
+import hash_map_oa
+import hash_map_sc
+from map_stats import MapStats, hash_collisions, histogram_dict
+
+
+def constant_hash(key) -> int:
+    """Hash function that sends every key to the same bucket"""
+    return 7
+
+
+@pytest.mark.parametrize('map_class', [hash_map_sc.HashMap, hash_map_oa.HashMap])
+def test_counters_are_only_reported_while_enabled(map_class):
+    m = map_class(11, hash_function_1)
+    m.put('key', 1)
+    assert 'resizes' not in m.stats()
+
+    m.enable_stats()
+    for num in range(40):
+        m.put('key' + str(num), num)
+    stats = m.stats()
+    assert stats['resizes'] > 0 and stats['rehash_seconds'] > 0
+    assert stats['size'] == 41 and stats['capacity'] == m.get_capacity()
+
+    m.disable_stats()
+    assert 'resizes' not in m.stats()
+
+
+@pytest.mark.parametrize('map_class', [hash_map_sc.HashMap, hash_map_oa.HashMap])
+def test_bucket_collisions_count_keys_whose_home_was_taken(map_class):
+    m = map_class(53, constant_hash)
+    m.enable_stats()
+    for num in range(5):
+        m.put('key' + str(num), num)
+    m.put('key0', 'updated')
+
+    # the first key has the bucket to itself, updating a key is not a collision
+    assert m.stats()['bucket_collisions'] == 4
+
+
+def test_chain_lengths_describe_every_bucket():
+    m = hash_map_sc.HashMap(11, hash_builtin)
+    for num in (0, 11, 22, 1, 12, 2):
+        m.put(num, num)
+
+    stats = m.stats()
+    assert stats['chain_lengths'] == {0: 8, 1: 1, 2: 1, 3: 1}
+    assert stats['longest_chain'] == 3
+    assert stats['empty_buckets'] == 8
+
+
+def test_probe_histograms_split_hits_and_misses():
+    m = hash_map_oa.HashMap(53, constant_hash)
+    m.enable_stats()
+    for num in range(3):
+        m.put('key' + str(num), num)
+
+    for num in range(3):
+        m.get('key' + str(num))
+    m.contains_key('missing')
+
+    stats = m.stats()
+    assert stats['hit_probes'] == {1: 1, 2: 1, 3: 1}
+    assert stats['miss_probes'] == {4: 1}
+
+
+def test_nested_rehashes_are_timed_once():
+    stats = MapStats()
+    stats.start_rehash()
+    stats.start_rehash()
+    stats.end_rehash()
+    assert stats.rehash_seconds == 0
+    stats.end_rehash()
+    assert stats.rehash_seconds > 0
+
+
+def test_helpers():
+    assert histogram_dict([0, 3, 0, 1]) == {1: 3, 3: 1}
+    assert hash_collisions([1, 2, 2, 3, 3, 3]) == 3
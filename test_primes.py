@@ -0,0 +1,52 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the prime table used to pick HashMap capacities
+
+
+import pytest
+
+import primes
+
+
+def trial_division(number: int) -> bool:
+    """Slow reference prime check"""
+    if number < 2:
+        return False
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            return False
+        factor += 1
+    return True
+
+
+def test_is_prime_matches_trial_division_around_the_sieve_limit():
+    for number in list(range(-5, 2000)) + list(range(primes.PRIME_LIMIT - 500, primes.PRIME_LIMIT + 500)):
+        assert primes.is_prime(number) == trial_division(number)
+
+
+@pytest.mark.parametrize('number', [561, 41041, 825265, 321197185, 3215031751, 3825123056546413051])
+def test_is_prime_rejects_carmichael_and_strong_pseudoprimes(number):
+    assert not primes.is_prime(number)
+
+
+@pytest.mark.parametrize('number', [2 ** 31 - 1, 2 ** 61 - 1, 10 ** 18 + 9])
+def test_is_prime_accepts_large_primes(number):
+    assert primes.is_prime(number)
+
+
+def test_next_prime_is_the_smallest_odd_prime_at_or_above():
+    for capacity in list(range(-2, 300)) + [primes.PRIME_LIMIT - 20, primes.PRIME_LIMIT, 10 ** 6]:
+        expected = max(capacity, 3)
+        while not trial_division(expected):
+            expected += 1
+        assert primes.next_prime(capacity) == expected
+
+
+def test_next_power_of_two():
+    assert [primes.next_power_of_two(num) for num in range(1, 10)] == [2, 2, 4, 4, 8, 8, 8, 8, 16]
+    assert primes.next_power_of_two(2 ** 20) == 2 ** 20
+    assert primes.next_power_of_two(2 ** 20 + 1) == 2 ** 21
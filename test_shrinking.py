@@ -0,0 +1,90 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for shrinking both HashMaps (SC & OA) when their load drops
+
+
+import pytest
+
+from a6_include import hash_function_1
+import hash_map_compact
+import hash_map_concurrent
+import hash_map_oa
+import hash_map_sc
+
+
+MAPS = [
+    lambda: hash_map_sc.HashMap(11, hash_function_1),
+    lambda: hash_map_sc.HashMap(11, hash_function_1, incremental=True),
+    lambda: hash_map_oa.HashMap(11, hash_function_1),
+    lambda: hash_map_oa.HashMap(11, hash_function_1, incremental=True),
+    lambda: hash_map_compact.HashMap(11, hash_function_1),
+    lambda: hash_map_concurrent.HashMap(11, hash_function_1),
+]
+
+
+@pytest.mark.parametrize('make_map', MAPS)
+def test_removes_shrink_the_table_but_not_below_its_first_capacity(make_map):
+    m = make_map()
+    m.min_load = .25
+    for num in range(1000):
+        m.put('key' + str(num), num)
+    grown = m.get_capacity()
+
+    for num in range(990):
+        m.remove('key' + str(num))
+        assert m.get_size() >= m.get_capacity() * m.min_load or m.get_capacity() == 11
+
+    assert m.get_capacity() < grown // 10
+    assert m.get_capacity() >= 11
+    assert all(m.get('key' + str(num)) == num for num in range(990, 1000))
+
+
+@pytest.mark.parametrize('make_map', MAPS)
+def test_tables_do_not_shrink_unless_asked(make_map):
+    m = make_map()
+    for num in range(200):
+        m.put('key' + str(num), num)
+    grown = m.get_capacity()
+
+    for num in range(200):
+        m.remove('key' + str(num))
+    assert m.get_capacity() == grown
+
+
+@pytest.mark.parametrize('make_map', MAPS)
+def test_alternating_around_the_threshold_does_not_thrash(make_map):
+    m = make_map()
+    m.min_load = .25
+    m.enable_stats()
+    for num in range(400):
+        m.put('key' + str(num), num)
+    for num in range(300):
+        m.remove('key' + str(num))
+    resizes = m.stats()['resizes']
+
+    # the new load sits between the two thresholds, so small swings never resize
+    for num in range(500):
+        m.put('extra', num)
+        m.remove('extra')
+    assert m.stats()['resizes'] == resizes
+
+
+@pytest.mark.parametrize('make_map', MAPS)
+def test_clear_can_reset_the_capacity(make_map):
+    m = make_map()
+    for num in range(200):
+        m.put('key' + str(num), num)
+    grown = m.get_capacity()
+
+    m.clear()
+    assert m.get_size() == 0 and m.get_capacity() == grown
+
+    for num in range(200):
+        m.put('key' + str(num), num)
+    m.clear(reset_capacity=True)
+    assert m.get_size() == 0 and m.get_capacity() == 11
+    m.put('key', 'value')
+    assert m.get('key') == 'value'
@@ -0,0 +1,85 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the frequency sketches and the approximate find_mode
+
+
+from collections import Counter
+import random
+
+import pytest
+
+from a6_include import DynamicArray
+from hash_functions import hash_mix
+from sketch import CountMinSketch, SpaceSaving, find_mode_approx
+
+
+def zipf_stream(count: int, seed: int = 0) -> list:
+    """Skewed stream of keys, a few are frequent and most are rare"""
+    rng = random.Random(seed)
+    return ['user' + str(int(rng.paretovariate(1.2))) for _ in range(count)]
+
+
+def test_count_min_estimates_stay_within_the_error_bound():
+    stream = zipf_stream(20000)
+    sketch = CountMinSketch.from_error(.01, .01)
+    for key in stream:
+        sketch.add(key)
+
+    counts = Counter(stream)
+    bound = sketch.error_bound()
+    assert sketch.get_total() == len(stream)
+    assert bound <= .01 * len(stream) + 1
+
+    # never below the true count, and the bound may fail for at most delta of the keys
+    over = [sketch.estimate(key) - count for key, count in counts.items()]
+    assert min(over) >= 0
+    assert sum(1 for error in over if error > bound) <= .01 * len(counts)
+    assert sketch.estimate('never added') <= bound
+
+
+def test_count_min_sizes_from_epsilon_and_delta():
+    sketch = CountMinSketch.from_error(.001, .01)
+    assert sketch.get_width() == 2719 and sketch.get_depth() == 5
+
+    with pytest.raises(ValueError):
+        CountMinSketch.from_error(0, .5)
+    with pytest.raises(ValueError):
+        CountMinSketch(0, 1)
+
+
+def test_space_saving_bounds_contain_the_true_counts():
+    stream = zipf_stream(20000, seed=1)
+    summary = SpaceSaving(50, hash_mix)
+    for key in stream:
+        summary.add(key)
+
+    counts = Counter(stream)
+    candidates = summary.candidates()
+    assert len(candidates) == 50
+    for key, lower, upper in candidates:
+        assert lower <= counts[key] <= upper
+
+    # every key seen more than total / capacity times is monitored
+    monitored = {key for key, lower, upper in candidates}
+    assert {key for key, count in counts.items() if count > len(stream) / 50} <= monitored
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_approximate_mode_brackets_the_exact_mode(seed):
+    stream = zipf_stream(30000, seed)
+    counts = Counter(stream)
+    exact = max(counts.values())
+
+    modes, frequency, error = find_mode_approx(DynamicArray(stream), epsilon=.01)
+    keys = [modes[num] for num in range(modes.length())]
+
+    assert frequency - error <= exact <= frequency
+    assert all(key in keys for key, count in counts.items() if count == exact)
+
+
+def test_approximate_mode_of_an_empty_stream():
+    modes, frequency, error = find_mode_approx([])
+    assert modes.length() == 0 and frequency == 0 and error == 0
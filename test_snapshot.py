@@ -0,0 +1,38 @@
+# Name: Tevin Voong
+# OSU Email: voongt@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 6/9/2023
+# Description: Tests for the HashMap snapshots (dump and load)
+
+
+import io
+
+import pytest
+
+from a6_include import hash_function_1
+import hash_map_oa
+import hash_map_sc
+
+
+@pytest.mark.parametrize('map_class', [hash_map_sc.HashMap, hash_map_oa.HashMap])
+@pytest.mark.parametrize('options', [
+    {},
+    {'power_of_two': True},
+    {'incremental': True},
+    {'power_of_two': True, 'incremental': True},
+])
+def test_snapshot_keeps_the_map_options(map_class, options):
+    m = map_class(53, hash_function_1, **options)
+    for num in range(100):
+        m.put('key' + str(num), num)
+
+    out = io.BytesIO()
+    m.dump(out)
+    out.seek(0)
+    loaded = map_class.load(out)
+
+    assert loaded._power_of_two == options.get('power_of_two', False)
+    assert loaded._incremental == options.get('incremental', False)
+    assert loaded.get_capacity() == m.get_capacity()
+    assert sorted(loaded.items()) == sorted(m.items())